@@ -1,8 +1,11 @@
 import asyncio
 import logging
 
+from aiohttp import TCPConnector
 from dependency_injector.wiring import inject, Provide
-from exchange.bitget.websocket_public_client import BitgetWebsocketClient
+from exchange.bitget.market_bus import SharedMarketBus
+from exchange.bitget.stream_manager import BitgetStreamManager
+from exchange.bitget.websocket_pool import BitgetWebsocketPool
 from shared.containers import Container
 
 logger = logging.getLogger("main")
@@ -10,10 +13,19 @@ logger = logging.getLogger("main")
 
 @inject
 async def main(
-    public_client: BitgetWebsocketClient = Provide[
-        Container.bitget_future_websocket_public_client
+    public_client: BitgetWebsocketPool = Provide[
+        Container.bitget_future_websocket_public_pool
     ],
+    stream_manager: BitgetStreamManager = Provide[Container.bitget_stream_manager],
+    market_bus_config: dict | None = Provide[Container.config.bitget.market_bus],
+    http_connector: TCPConnector = Provide[Container.http_connector],
 ):
+    # Publish candles/quotes for strategy worker processes (MarketBusReader)
+    market_bus = None
+    if market_bus_config:
+        market_bus = SharedMarketBus(market_bus_config["name"], market_bus_config.get("capacity", 65536))
+        market_bus.attach(stream_manager)
+        logger.info(f"Publishing market data to shared memory {market_bus.name}")
     # Start connection in background
     conn_task = asyncio.create_task(public_client.connect())
     # Wait until connected before subscribing
@@ -23,6 +35,11 @@ async def main(
         await conn_task
     except asyncio.CancelledError:
         await public_client.close()
+    finally:
+        if market_bus is not None:
+            market_bus.close()
+        # 백필용 REST 클라이언트가 쓰는 공용 커넥션 풀
+        await http_connector.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,134 @@
+from abc import ABC, abstractmethod
+from typing import Any, List, Optional
+
+from exchange.bitget.dto.websocket import Bar, WsTrade
+from exchange.bitget.utils.interval import interval_to_ms
+
+
+class BarAggregator(ABC):
+    """Accumulates trades into one open bar; `add()` returns the bars it closed."""
+
+    def __init__(self, symbol: str, kind: str):
+        self.symbol = symbol
+        self.kind = kind
+        self._reset()
+
+    def _reset(self) -> None:
+        self._start_ts: Optional[int] = None
+        self._end_ts = 0
+        self._open = self._high = self._low = self._close = 0.0
+        self._volume = 0.0
+        self._notional = 0.0
+        self._trades = 0
+
+    def _accumulate(self, trade: WsTrade) -> None:
+        price = trade.price
+        if self._start_ts is None:
+            self._start_ts = trade.ts
+            self._open = self._high = self._low = price
+        elif price > self._high:
+            self._high = price
+        elif price < self._low:
+            self._low = price
+        self._close = price
+        self._end_ts = trade.ts
+        self._volume += trade.size
+        self._notional += price * trade.size
+        self._trades += 1
+
+    def _close_bar(self, start_ts: Optional[int] = None, end_ts: Optional[int] = None) -> Bar:
+        bar = Bar(
+            self.symbol,
+            self.kind,
+            self._start_ts if start_ts is None else start_ts,
+            self._end_ts if end_ts is None else end_ts,
+            self._open,
+            self._high,
+            self._low,
+            self._close,
+            self._volume,
+            self._notional,
+            self._trades,
+        )
+        self._reset()
+        return bar
+
+    @abstractmethod
+    def add(self, trade: WsTrade) -> List[Bar]:
+        ...
+
+
+class TimeBarAggregator(BarAggregator):
+    """
+    Fixed-interval bars aligned to the epoch (like exchange candles), at any interval.
+    A bar is closed by the first trade of a later interval; empty intervals produce no bar.
+    """
+
+    def __init__(self, symbol: str, interval: str):
+        super().__init__(symbol, f"time:{interval}")
+        self.interval_ms = interval_to_ms(interval)
+        self._bucket: Optional[int] = None
+
+    def add(self, trade: WsTrade) -> List[Bar]:
+        bucket = trade.ts - trade.ts % self.interval_ms
+        closed = []
+        if self._bucket is not None and bucket != self._bucket:
+            closed.append(self._close_bar(self._bucket, self._bucket + self.interval_ms - 1))
+        self._bucket = bucket
+        self._accumulate(trade)
+        return closed
+
+
+class ThresholdBarAggregator(BarAggregator):
+    """
+    Closes a bar once the accumulated measure reaches `threshold`.
+    Trades are not split, so a bar may overshoot the threshold by its last trade.
+    """
+
+    def __init__(self, symbol: str, kind: str, threshold: float):
+        if threshold <= 0:
+            raise ValueError("threshold must be positive")
+        super().__init__(symbol, kind)
+        self.threshold = threshold
+
+    @abstractmethod
+    def _measure(self) -> float:
+        ...
+
+    def add(self, trade: WsTrade) -> List[Bar]:
+        self._accumulate(trade)
+        if self._measure() >= self.threshold:
+            return [self._close_bar()]
+        return []
+
+
+class VolumeBarAggregator(ThresholdBarAggregator):
+    def __init__(self, symbol: str, threshold: float):
+        super().__init__(symbol, f"volume:{threshold:g}", threshold)
+
+    def _measure(self) -> float:
+        return self._volume
+
+
+class DollarBarAggregator(ThresholdBarAggregator):
+    def __init__(self, symbol: str, threshold: float):
+        super().__init__(symbol, f"dollar:{threshold:g}", threshold)
+
+    def _measure(self) -> float:
+        return self._notional
+
+
+def create_aggregator(symbol: str, spec: dict[str, Any]) -> BarAggregator:
+    """
+    Build an aggregator from a strategy config entry:
+    {type: time, size: '7m'} | {type: volume, size: 50} | {type: dollar, size: 1000000}
+    """
+    bar_type = spec["type"]
+    size = spec["size"]
+    if bar_type == "time":
+        return TimeBarAggregator(symbol, str(size))
+    if bar_type == "volume":
+        return VolumeBarAggregator(symbol, float(size))
+    if bar_type == "dollar":
+        return DollarBarAggregator(symbol, float(size))
+    raise ValueError(f"Unknown bar type: {bar_type}")
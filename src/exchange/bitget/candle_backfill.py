@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from exchange.bitget.dto.websocket import SubscribeReq
+from exchange.bitget.future.future_market_client import BitgetFutureMarketClient
+from exchange.bitget.stream_manager import CANDLE_CHANNEL_PREFIX, BitgetStreamManager
+from exchange.bitget.utils.interval import interval_to_ms, to_ms
+
+logger = logging.getLogger(__name__)
+
+# history-candles returns at most 200 bars per request
+HISTORY_CANDLES_LIMIT = 200
+
+
+def split_windows(start_ms: int, end_ms: int, interval_ms: int, limit: int = HISTORY_CANDLES_LIMIT) -> List[Tuple[int, int]]:
+    """
+    Split [start_ms, end_ms) into non-overlapping (start, end) windows of at most `limit` bars,
+    with `end` inclusive as history-candles expects.
+    """
+    page_ms = interval_ms * limit
+    windows = []
+    start = start_ms
+    while start < end_ms:
+        end = min(start + page_ms, end_ms)
+        windows.append((start, end - 1))
+        start = end
+    return windows
+
+
+def merge_pages(pages: Iterable[list], start_ms: Optional[int] = None, end_ms: Optional[int] = None) -> list:
+    """Concatenate candle pages into one list ordered by timestamp, keeping one bar per timestamp."""
+    rows = {}
+    for page in pages:
+        for row in page:
+            ts = int(row[0])
+            # a bar on a page boundary can come back from both requests
+            if (start_ms is None or ts >= start_ms) and (end_ms is None or ts < end_ms):
+                rows[ts] = row
+    return [rows[ts] for ts in sorted(rows)]
+
+
+async def fetch_candles(
+    market_client: BitgetFutureMarketClient,
+    symbol: str,
+    granularity: str,
+    start: datetime | int,
+    end: datetime | int,
+    product_type: str = "USDT-FUTURES",
+    max_concurrency: int = 10,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> list:
+    """
+    Download every bar in [start, end) for one symbol: the range is split into page-sized windows
+    that are fetched concurrently (at most `max_concurrency` in flight, or as many as a shared
+    `semaphore` allows; the client's shared rate limiter paces the actual request rate) and merged
+    into one ordered, de-duplicated list.
+    """
+    start_ms, end_ms = to_ms(start), to_ms(end)
+    windows = split_windows(start_ms, end_ms, interval_to_ms(granularity))
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def fetch(window_start: int, window_end: int) -> list:
+        async with semaphore:
+            return await market_client.get_klines(
+                symbol, granularity, product_type, window_start, window_end, HISTORY_CANDLES_LIMIT
+            )
+
+    pages = await asyncio.gather(*(fetch(*window) for window in windows))
+    rows = merge_pages(pages, start_ms, end_ms)
+    logger.debug(f"Fetched {len(rows)} {granularity} candles for {symbol} in {len(windows)} windows")
+    return rows
+
+
+class BackfillError(Exception):
+    """The missed candles of `channels` could not be fetched; their gaps stay queued for the next fill()."""
+
+    def __init__(self, channels: List[SubscribeReq], cause: BaseException):
+        self.channels = channels
+        super().__init__(f"Candle backfill failed for {len(channels)} channels: {cause!r}")
+
+
+class CandleBackfiller:
+    """
+    Fills the candles missed while a connection was down.
+
+    For every candle channel that already has history, the range from its last stored bar
+    up to now is fetched over REST (all channels and pages concurrently, at most
+    `max_concurrency` requests in flight) and dispatched through the stream manager as a
+    regular update, so the bars reach subscribers in order before live pushes resume.
+    The last stored bar is fetched again to pick up its final values.
+
+    A failed fill raises `BackfillError` and remembers where each gap started, so a later fill()
+    fetches it again even after live pushes have moved the buffer past it; such a retried range
+    is dispatched as a snapshot to rebuild the stored history from the gap start.
+    """
+
+    def __init__(
+        self,
+        stream_manager: BitgetStreamManager,
+        market_client_factory: Callable[[], BitgetFutureMarketClient],
+        max_concurrency: int = 5,
+        timeout: float = 10,
+    ):
+        self._stream_manager = stream_manager
+        # resolved lazily so the backfiller can be built before an event loop exists
+        self._market_client_factory = market_client_factory
+        self._max_concurrency = max_concurrency
+        self._timeout = timeout
+        # channel -> start of a gap that failed to backfill
+        self._pending: Dict[SubscribeReq, int] = {}
+
+    @property
+    def pending(self) -> Set[SubscribeReq]:
+        """Channels whose gap is still missing after a failed fill()."""
+        return set(self._pending)
+
+    def _gaps(self, channels: Iterable[SubscribeReq], now_ms: int) -> List[Tuple[SubscribeReq, str, int, int]]:
+        """(channel, granularity, start_ms, end_ms) range missing from each candle channel."""
+        gaps = []
+        for ch in channels:
+            if not ch.channel.startswith(CANDLE_CHANNEL_PREFIX):
+                continue
+            interval = ch.channel[len(CANDLE_CHANNEL_PREFIX):]
+            buffer = self._stream_manager.candle_store.get(ch.inst_id, interval)
+            if buffer is None or buffer.last_ts is None:
+                continue
+            start = min(buffer.last_ts, self._pending.get(ch, buffer.last_ts))
+            gaps.append((ch, interval, start, now_ms + 1))
+        return gaps
+
+    async def fill(self, channels: Iterable[SubscribeReq]) -> int:
+        """
+        Backfill `channels`, from the start of a gap still pending from an earlier failure where
+        there is one; returns the number of bars dispatched.
+        Raises `BackfillError` if the REST fetch fails or times out.
+        """
+        gaps = self._gaps(channels, int(time.time() * 1000))
+        if not gaps:
+            return 0
+
+        market_client = self._market_client_factory()
+        # one budget for every channel's windows
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        try:
+            async with asyncio.timeout(self._timeout):
+                results = await asyncio.gather(*(
+                    fetch_candles(market_client, ch.inst_id, granularity, start, end, ch.inst_type, semaphore=semaphore)
+                    for ch, granularity, start, end in gaps
+                ))
+        except Exception as e:
+            for ch, _, start, _ in gaps:
+                self._pending[ch] = start
+            raise BackfillError([ch for ch, *_ in gaps], e) from e
+
+        dispatched = 0
+        for (ch, *_), rows in zip(gaps, results):
+            retried = self._pending.pop(ch, None) is not None
+            if rows:
+                action = "snapshot" if retried else "update"
+                self._stream_manager.dispatch({"arg": ch.to_arg(), "action": action, "data": rows})
+                dispatched += len(rows)
+        logger.info(f"Backfilled {dispatched} candles over {len(gaps)} channels")
+        return dispatched
@@ -0,0 +1,124 @@
+from array import array
+from typing import Dict, Iterable, Optional, Tuple
+
+from exchange.bitget.dto.websocket import WsCandle
+
+PRICE_COLUMNS = ("open", "high", "low", "close", "volume")
+COLUMNS = ("ts",) + PRICE_COLUMNS
+
+
+class CandleBuffer:
+    """
+    Fixed-capacity ring of candles stored as contiguous numeric columns
+    (`ts` as int64 ms, OHLCV as float64).
+
+    Every slot is written twice, at i and i + capacity, so the latest n bars are always
+    one contiguous slice and `window()` can hand out memoryviews without copying.
+    Views are live: they are overwritten once the ring wraps past them.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._ts = array("q", bytes(8 * 2 * capacity))
+        self._prices = {name: array("d", bytes(8 * 2 * capacity)) for name in PRICE_COLUMNS}
+        self._columns = (self._ts, *(self._prices[name] for name in PRICE_COLUMNS))
+        self._head = 0  # next slot to write
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def last_ts(self) -> Optional[int]:
+        if not self._size:
+            return None
+        return self._ts[self._head - 1 + self.capacity]
+
+    def _write(self, slot: int, values: Tuple[float, ...]) -> None:
+        mirror = slot + self.capacity
+        for column, value in zip(self._columns, values):
+            column[slot] = value
+            column[mirror] = value
+
+    def upsert(self, ts: int, open_: float, high: float, low: float, close: float, volume: float) -> bool:
+        """
+        Update semantics: the same start time overwrites the current bar, a newer one appends.
+        Bars older than the current one are ignored; returns False for those.
+        """
+        values = (ts, open_, high, low, close, volume)
+        if self._size:
+            last = self._ts[self._head - 1 + self.capacity]
+            if ts == last:
+                self._write((self._head - 1) % self.capacity, values)
+                return True
+            if ts < last:
+                return False
+        self._write(self._head, values)
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+        return True
+
+    def apply_snapshot(self, candles: Iterable[WsCandle]) -> None:
+        """Snapshot semantics: the snapshot replaces every stored bar from its first start time on."""
+        candles = sorted(candles, key=lambda c: c.ts)
+        if not candles:
+            return
+        first_ts = candles[0].ts
+        while self._size and self._ts[self._head - 1 + self.capacity] >= first_ts:
+            self._head = (self._head - 1) % self.capacity
+            self._size -= 1
+        for c in candles:
+            self.upsert(c.ts, c.open, c.high, c.low, c.close, c.volume)
+
+    def apply_update(self, candles: Iterable[WsCandle]) -> None:
+        for c in candles:
+            self.upsert(c.ts, c.open, c.high, c.low, c.close, c.volume)
+
+    def _span(self, n: Optional[int]) -> Tuple[int, int]:
+        n = self._size if n is None else min(n, self._size)
+        start = self._head - n
+        if start < 0:
+            start += self.capacity
+        return start, start + n
+
+    def column(self, name: str, n: Optional[int] = None) -> memoryview:
+        """Zero-copy view of the latest n values (oldest first) of one column."""
+        start, end = self._span(n)
+        source = self._ts if name == "ts" else self._prices[name]
+        return memoryview(source)[start:end]
+
+    def window(self, n: Optional[int] = None) -> Dict[str, memoryview]:
+        """Zero-copy views of the latest n bars (oldest first), keyed by column name."""
+        start, end = self._span(n)
+        return {name: memoryview(column)[start:end] for name, column in zip(COLUMNS, self._columns)}
+
+
+class CandleStore:
+    """Rolling in-memory candle history keyed by (symbol, interval)."""
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._buffers: Dict[Tuple[str, str], CandleBuffer] = {}
+
+    def buffer(self, symbol: str, interval: str) -> CandleBuffer:
+        key = (symbol, interval)
+        buf = self._buffers.get(key)
+        if buf is None:
+            buf = self._buffers[key] = CandleBuffer(self.capacity)
+        return buf
+
+    def get(self, symbol: str, interval: str) -> Optional[CandleBuffer]:
+        return self._buffers.get((symbol, interval))
+
+    def window(self, symbol: str, interval: str, n: Optional[int] = None) -> Dict[str, memoryview]:
+        return self.buffer(symbol, interval).window(n)
+
+    def apply(self, symbol: str, interval: str, action: str, candles: Iterable[WsCandle]) -> None:
+        buf = self.buffer(symbol, interval)
+        if action == "snapshot":
+            buf.apply_snapshot(candles)
+        else:
+            buf.apply_update(candles)
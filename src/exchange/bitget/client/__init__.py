@@ -1 +1,2 @@
-from .signature_client import SignatureClient
\ No newline at end of file
+from .bitget_client import request_cycle
+from .signature_client import SignatureClient
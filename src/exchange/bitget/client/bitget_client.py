@@ -1,31 +1,125 @@
+import asyncio
+import contextvars
 import json
+import logging
+import random
 
-from typing import Any
-from aiohttp import TCPConnector
-from exchange.bitget.dto.bitget_error import BitgetError
+from contextlib import contextmanager
+from typing import Any, Dict, Hashable, Iterator
+from aiohttp import ClientConnectionError, TCPConnector
+from exchange.bitget.client.rate_limiter import BitgetRateLimiter
+from exchange.bitget.dto.bitget_error import BitgetDuplicateOrderError, BitgetError, BitgetErrorCode
 from shared.http import TracingClientSession
 
+logger = logging.getLogger(__name__)
+
+# 같은 요청을 여러 번 보내도 결과가 같은 메서드
+IDEMPOTENT_METHODS = {"GET", "DELETE"}
+
+
+def _retry_after(value: str | None) -> float | None:
+    try:
+        return max(float(value), 0.0) if value else None
+    except ValueError:
+        return None
+
+
+def is_idempotent(method: str, json_body: dict | None) -> bool:
+    """
+    재시도해도 중복 실행되지 않는 요청인지 여부.
+    주문 등 POST 는 clientOid 가 있어야 거래소가 중복 주문을 거부하므로 그때만 재시도한다.
+    """
+    if method.upper() in IDEMPOTENT_METHODS:
+        return True
+    if not json_body:
+        return False
+    if json_body.get("clientOid"):
+        return True
+    orders = json_body.get("orderList") or json_body.get("orderIdList")
+    return bool(orders) and all(order.get("clientOid") for order in orders)
+
+
+# request_cycle() 안에서만 설정되는 GET 결과 캐시: 키 -> 요청 Task
+_cycle_cache: contextvars.ContextVar[Dict[Hashable, asyncio.Task] | None] = contextvars.ContextVar(
+    "bitget_request_cycle", default=None
+)
+
+
+@contextmanager
+def request_cycle() -> Iterator[None]:
+    """
+    의사결정 한 주기 동안 같은 GET(경로+파라미터)은 한 번만 호출하고 결과를 재사용한다.
+    주기 안에서 GET 이 아닌 요청(주문 등)을 보내면 캐시를 비워 이후 조회는 새로 한다.
+    결과 객체는 호출자끼리 공유되므로 수정하지 말 것. 중첩 시 바깥 주기의 캐시를 사용.
+    """
+    if _cycle_cache.get() is not None:
+        yield
+        return
+    token = _cycle_cache.set({})
+    try:
+        yield
+    finally:
+        _cycle_cache.reset(token)
+
+
+def _params_key(params: dict | None) -> tuple:
+    return tuple(sorted((k, str(v)) for k, v in (params or {}).items() if v is not None))
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    # 공유 Task 를 기다리던 호출자가 모두 취소돼도 예외 미확인 경고가 나지 않도록
+    if not task.cancelled():
+        task.exception()
+
+
 class BitgetClient:
     def __init__(
             self,
             base_url: str,
             headers: dict | None = None,
+            connector: TCPConnector | None = None,
+            rate_limiter: BitgetRateLimiter | None = None,
+            max_retries: int = 3,
+            backoff_base: float = 0.5,
+            backoff_max: float = 8.0,
+            coalesce: bool = False,
     ):
+        """
+        connector 를 넘기면 공유 커넥션 풀을 사용하고, 세션 종료 시 풀은 닫지 않는다.
+        rate_limiter 를 넘기면 요청마다 엔드포인트 한도만큼 대기한다 (클라이언트 간 공유).
+        재시도 가능한 에러(한도 초과, 타임스탬프 만료, 시스템 오류, 5xx, 연결 오류)는 멱등 요청에 한해
+        최대 max_retries 번 지수 백오프 + 지터로 재시도하며, Retry-After 헤더가 있으면 그만큼은 기다린다.
+        """
         default_headers = headers or {
             "Content-Type": "application/json",
             "Accept": "application/json",
             "locale": "ko-KR",
         }
-        connector = TCPConnector(ssl=False)
         self._client = TracingClientSession(
-            base_url=base_url, headers=default_headers, connector=connector
+            base_url=base_url,
+            headers=default_headers,
+            connector=connector or TCPConnector(ssl=False),
+            connector_owner=connector is None,
         )
+        self._rate_limiter = rate_limiter
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_max = backoff_max
+        self._coalesce = coalesce
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    async def close(self):
+        await self._client.close()
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        await self._client.close()
+        await self.close()
+
+    async def _throttle(self, path: str) -> None:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(path)
 
     async def _request(
             self,
@@ -34,6 +128,93 @@ class BitgetClient:
             params: dict | None = None,
             json_body: dict | None = None,
             headers: dict | None = None,
+    ) -> Any:
+        cache = _cycle_cache.get()
+        if method.upper() != "GET":
+            if cache:
+                cache.clear()
+            return await self._request_with_retry(method, path, params, json_body, headers)
+        if cache is None and not self._coalesce:
+            return await self._request_with_retry(method, path, params, json_body, headers)
+
+        key = (id(self), path, _params_key(params))
+        store = cache if cache is not None else self._inflight
+        task = store.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_with_retry(method, path, params, json_body, headers))
+            task.add_done_callback(_consume_exception)
+            store[key] = task
+
+            def _release(t: asyncio.Task) -> None:
+                # 진행 중 공유는 끝나면 해제, 주기 캐시는 실패한 결과만 제거
+                if store.get(key) is t and (store is self._inflight or t.cancelled() or t.exception()):
+                    del store[key]
+
+            task.add_done_callback(_release)
+        # 한 호출자가 취소돼도 공유 요청은 계속 진행
+        return await asyncio.shield(task)
+
+    async def _request_with_retry(
+            self,
+            method: str,
+            path: str,
+            params: dict | None = None,
+            json_body: dict | None = None,
+            headers: dict | None = None,
+    ) -> Any:
+        attempt = 0
+        while True:
+            try:
+                return await self._request_once(method, path, params, json_body, headers)
+            except (BitgetError, ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt > 0 and isinstance(e, BitgetError) and e.code == BitgetErrorCode.DUPLICATE_CLIENT_OID:
+                    # 앞선 시도가 응답만 유실되고 실제로는 접수된 경우
+                    return await self._on_duplicate_order(method, path, json_body, e)
+                delay = self._retry_delay(e, method, json_body, attempt)
+                if delay is None:
+                    raise
+                attempt += 1
+                logger.warning(f"{method} {path} failed ({e.__class__.__name__}: {e}), retry {attempt}/{self._max_retries} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    async def _on_duplicate_order(self, method: str, path: str, json_body: dict | None, error: BitgetError) -> Any:
+        """
+        재시도가 clientOid 중복으로 거부됐을 때 호출. 주문을 조회할 수 있는 클라이언트는 재정의해서
+        앞선 시도로 접수된 주문을 성공 응답으로 돌려주고, 기본 동작은 재주문하지 않도록 구분된 에러를 던진다.
+        """
+        raise BitgetDuplicateOrderError(error, (json_body or {}).get("clientOid")) from error
+
+    async def _request_once(
+            self,
+            method: str,
+            path: str,
+            params: dict | None = None,
+            json_body: dict | None = None,
+            headers: dict | None = None,
+    ) -> Any:
+        await self._throttle(path)
+        return await self._send(method, path, params, json_body, headers)
+
+    def _retry_delay(self, error: Exception, method: str, json_body: dict | None, attempt: int) -> float | None:
+        """재시도하지 않을 에러면 None, 재시도할 경우 대기 시간(초)"""
+        if attempt >= self._max_retries or not is_idempotent(method, json_body):
+            return None
+        retry_after = None
+        if isinstance(error, BitgetError):
+            if not (error.code.retryable() or error.status == 429 or (error.status or 0) >= 500):
+                return None
+            retry_after = error.retry_after
+        # full jitter: 0 ~ min(backoff_max, backoff_base * 2^attempt)
+        delay = random.uniform(0, min(self._backoff_max, self._backoff_base * 2 ** attempt))
+        return max(delay, retry_after or 0.0)
+
+    async def _send(
+            self,
+            method: str,
+            path: str,
+            params: dict | None = None,
+            json_body: dict | None = None,
+            headers: dict | None = None,
     ) -> Any:
         headers = headers or {}
         session_method = getattr(self._client, method.lower())
@@ -54,7 +235,9 @@ class BitgetClient:
                         "requestTime": None,
                         "data": None,
                     }
-                raise BitgetError(error_resp)
+                raise BitgetError(
+                    error_resp, status=resp.status, retry_after=_retry_after(resp.headers.get("Retry-After"))
+                )
             content_type = resp.headers.get("Content-Type", "")
             if "application/json" in content_type:
                 return await resp.json()
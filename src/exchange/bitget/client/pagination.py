@@ -0,0 +1,50 @@
+import asyncio
+import dataclasses
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Page(Generic[T]):
+    """한 페이지 결과. cursor 가 None 이면 마지막 페이지."""
+    items: List[T]
+    cursor: Optional[Any] = None
+
+
+async def paginate(
+    fetch: Callable[[Optional[Any]], Awaitable[Page[T]]],
+    cursor: Optional[Any] = None,
+    stop: Optional[Callable[[T], bool]] = None,
+) -> AsyncIterator[T]:
+    """
+    cursor 를 따라가며 페이지의 항목을 순서대로 내보내는 비동기 이터레이터.
+    호출자가 현재 페이지를 처리하는 동안 다음 페이지를 미리 요청한다.
+    stop(item) 이 True 인 항목(워터마크)을 만나면 그 항목은 내보내지 않고 종료하며,
+    페이지의 마지막 항목이 이미 워터마크면 다음 페이지는 요청하지 않는다.
+    """
+    pending: Optional[asyncio.Task] = asyncio.ensure_future(fetch(cursor))
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            reached = stop is not None and bool(page.items) and stop(page.items[-1])
+            if page.cursor is not None and not reached:
+                pending = asyncio.ensure_future(fetch(page.cursor))
+            for item in page.items:
+                if stop is not None and stop(item):
+                    return
+                yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
+            if pending.done() and not pending.cancelled():
+                pending.exception()  # 미리 받은 페이지의 에러는 버림
+
+
+def id_watermark(field: str, until_id: Optional[str]) -> Optional[Callable[[dict], bool]]:
+    """id 내림차순 목록에서 until_id 이하(이미 수집한 항목)에 도달하면 True"""
+    if until_id is None:
+        return None
+    watermark = int(until_id)
+    return lambda item: int(item[field]) <= watermark
@@ -0,0 +1,87 @@
+import fnmatch
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from shared.utils.token_bucket import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    path(glob 패턴)에 해당하는 엔드포인트의 초당 요청 한도.
+    와일드카드 규칙이라도 버킷은 실제 엔드포인트마다 따로 둔다 (Bitget 한도는 엔드포인트 단위).
+    """
+    path: str
+    rate: float
+    capacity: Optional[float] = None
+
+
+# Bitget API 문서의 엔드포인트별 한도 (UID/IP 기준, 초당)
+DEFAULT_RULES: Tuple[RateLimitRule, ...] = (
+    RateLimitRule("/api/v2/mix/order/place-order", 10),
+    RateLimitRule("/api/v2/mix/order/batch-place-order", 5),
+    RateLimitRule("/api/v2/mix/order/cancel-order", 10),
+    RateLimitRule("/api/v2/mix/order/batch-cancel-orders", 10),
+    RateLimitRule("/api/v2/mix/order/cancel-all-orders", 10),
+    RateLimitRule("/api/v2/mix/order/close-positions", 1),
+    RateLimitRule("/api/v2/mix/order/orders-history", 10),
+    RateLimitRule("/api/v2/mix/order/*", 10),
+    RateLimitRule("/api/v2/mix/position/all-position", 5),
+    RateLimitRule("/api/v2/mix/position/history-position", 20),
+    RateLimitRule("/api/v2/mix/position/*", 10),
+    RateLimitRule("/api/v2/mix/account/set-leverage", 5),
+    RateLimitRule("/api/v2/mix/account/*", 10),
+    RateLimitRule("/api/v2/mix/market/*", 20),
+    RateLimitRule("/api/v2/spot/market/*", 20),
+    RateLimitRule("/api/v2/spot/trade/*", 10),
+)
+
+# IP 당 전체 한도 6000회/분
+GLOBAL_RULE = RateLimitRule("*", 100)
+
+
+class BitgetRateLimiter:
+    """
+    엔드포인트별 토큰 버킷 + 전체 버킷. 모든 REST 클라이언트가 한 인스턴스를 공유해야
+    같은 UID/IP 한도를 함께 나눠 쓴다. 요청 전에 `acquire(path)` 로 필요한 만큼만 대기.
+
+    규칙은 먼저 일치하는 것이 적용되며, 일치하는 규칙이 없는 경로는 전체 버킷만 적용된다.
+    """
+
+    def __init__(
+        self,
+        rules: Optional[Iterable[RateLimitRule | dict]] = None,
+        global_rule: Optional[RateLimitRule | dict] = GLOBAL_RULE,
+    ):
+        self._rules: List[RateLimitRule] = [
+            _to_rule(rule) for rule in (DEFAULT_RULES if rules is None else rules)
+        ]
+        self._global: Optional[TokenBucket] = None
+        if global_rule is not None:
+            global_rule = _to_rule(global_rule)
+            self._global = TokenBucket(global_rule.rate, global_rule.capacity)
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+
+    def _bucket(self, path: str) -> Optional[TokenBucket]:
+        if path not in self._buckets:
+            rule = next((r for r in self._rules if fnmatch.fnmatchcase(path, r.path)), None)
+            self._buckets[path] = TokenBucket(rule.rate, rule.capacity) if rule else None
+            if rule is None:
+                logger.debug(f"No rate limit rule for {path}, using the global limit only")
+        return self._buckets[path]
+
+    async def acquire(self, path: str) -> None:
+        path = path.split("?", 1)[0]
+        bucket = self._bucket(path)
+        if bucket is not None:
+            await bucket.acquire()
+        if self._global is not None:
+            await self._global.acquire()
+
+
+def _to_rule(rule: RateLimitRule | dict) -> RateLimitRule:
+    # config.yml 의 {path, rate, capacity} 항목도 허용
+    return rule if isinstance(rule, RateLimitRule) else RateLimitRule(**rule)
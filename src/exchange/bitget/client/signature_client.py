@@ -4,19 +4,35 @@ import logging
 from aiohttp import TCPConnector
 
 from exchange.bitget.client.bitget_client import BitgetClient
+from exchange.bitget.client.rate_limiter import BitgetRateLimiter
 from exchange.bitget.utils.signature import generate_signature
 from shared.http import TracingClientSession
 
 
 class SignatureClient(BitgetClient):
-    def __init__(self, base_url: str, access_key: str, secret_key: str, passphrase: str):
+    def __init__(
+            self,
+            base_url: str,
+            access_key: str,
+            secret_key: str,
+            passphrase: str,
+            connector: TCPConnector | None = None,
+            rate_limiter: BitgetRateLimiter | None = None,
+            coalesce: bool = False,
+    ):
         default_headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
             "ACCESS-KEY": access_key,
             "locale": "ko-KR",
         }
-        super().__init__(base_url=base_url, headers=default_headers)
+        super().__init__(
+            base_url=base_url,
+            headers=default_headers,
+            connector=connector,
+            rate_limiter=rate_limiter,
+            coalesce=coalesce,
+        )
         self._access_key = access_key
         self._secret_key = secret_key
         self._passphrase = passphrase
@@ -44,7 +60,7 @@ class SignatureClient(BitgetClient):
             "ACCESS-PASSPHRASE": self._passphrase,
         }
 
-    async def _request(
+    async def _request_once(
             self,
             method: str,
             path: str,
@@ -60,11 +76,13 @@ class SignatureClient(BitgetClient):
             import json
             body_str = json.dumps(json_body, separators=(",", ":"))
 
+        # 한도 대기 후 서명해야 ACCESS-TIMESTAMP 가 만료되지 않음 (재시도마다 새로 서명)
+        await self._throttle(path)
         auth_headers = self._sign(method, path, params if method == "GET" else None, body_str)
         # aiohttp 의 session.get/post 에서 headers 병합
         headers = {**auth_headers}
 
-        return await super()._request(
+        return await self._send(
             method,
             path,
             params=params if method == "GET" else None,
@@ -1,9 +1,10 @@
+import asyncio
 import json
 import pytest
 from aioresponses import aioresponses, CallbackResult
 
-from exchange.bitget.client.bitget_client import BitgetClient
-from exchange.bitget.dto.bitget_error import BitgetError, BitgetErrorCode
+from exchange.bitget.client.bitget_client import BitgetClient, request_cycle
+from exchange.bitget.dto.bitget_error import BitgetDuplicateOrderError, BitgetError, BitgetErrorCode
 
 BASE_URL = "https://api.example.com"
 
@@ -94,3 +95,160 @@ async def test_context_manager_closes_session(monkeypatch):
             _ = await client.get(path)
 
         assert closed["value"] is True
+
+
+def _no_sleep(monkeypatch):
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr("exchange.bitget.client.bitget_client.asyncio.sleep", fake_sleep)
+    return delays
+
+
+@pytest.mark.asyncio
+async def test_get_retries_retryable_errors_with_backoff(monkeypatch):
+    delays = _no_sleep(monkeypatch)
+    path = "/v1/retry"
+    with aioresponses() as mocked:
+        mocked.get(f"{BASE_URL}{path}", status=429, payload={"code": "429", "msg": "Too Many Requests"})
+        mocked.get(f"{BASE_URL}{path}", status=503, body="unavailable")
+        mocked.get(f"{BASE_URL}{path}", status=200, payload={"ok": True}, headers={"Content-Type": "application/json"})
+
+        async with BitgetClient(base_url=BASE_URL, backoff_base=0.5) as client:
+            assert await client.get(path) == {"ok": True}
+
+    assert len(delays) == 2
+    assert 0 <= delays[0] <= 0.5 and 0 <= delays[1] <= 1.0
+
+
+@pytest.mark.asyncio
+async def test_retry_honors_retry_after_and_gives_up_after_max_retries(monkeypatch):
+    delays = _no_sleep(monkeypatch)
+    path = "/v1/busy"
+    with aioresponses() as mocked:
+        for _ in range(3):
+            mocked.get(
+                f"{BASE_URL}{path}",
+                status=429,
+                payload={"code": "429", "msg": "Too Many Requests"},
+                headers={"Retry-After": "2"},
+            )
+
+        async with BitgetClient(base_url=BASE_URL, max_retries=2) as client:
+            with pytest.raises(BitgetError) as exc:
+                await client.get(path)
+
+    assert exc.value.code == BitgetErrorCode.RATE_LIMIT
+    assert exc.value.retry_after == 2
+    assert delays == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_post_is_retried_only_with_client_oid(monkeypatch):
+    delays = _no_sleep(monkeypatch)
+    path = "/v1/order"
+    with aioresponses() as mocked:
+        mocked.post(f"{BASE_URL}{path}", status=500, payload={"code": "40015", "msg": "system error"})
+        mocked.post(f"{BASE_URL}{path}", status=500, payload={"code": "40015", "msg": "system error"})
+        mocked.post(f"{BASE_URL}{path}", status=200, payload={"ok": True}, headers={"Content-Type": "application/json"})
+
+        async with BitgetClient(base_url=BASE_URL) as client:
+            with pytest.raises(BitgetError):
+                await client.post(path, json_body={"symbol": "BTCUSDT"})
+            assert delays == []
+            assert await client.post(path, json_body={"symbol": "BTCUSDT", "clientOid": "oid-1"}) == {"ok": True}
+
+    assert len(delays) == 1
+
+
+@pytest.mark.asyncio
+async def test_duplicate_client_oid_on_retry_raises_distinct_error(monkeypatch):
+    _no_sleep(monkeypatch)
+    path = "/v1/order"
+    duplicate = {"code": "40786", "msg": "Duplicate clientOid"}
+    with aioresponses() as mocked:
+        mocked.post(f"{BASE_URL}{path}", status=500, payload={"code": "40015", "msg": "system error"})
+        mocked.post(f"{BASE_URL}{path}", status=400, payload=duplicate)
+        mocked.post(f"{BASE_URL}{path}", status=400, payload=duplicate)
+
+        async with BitgetClient(base_url=BASE_URL) as client:
+            with pytest.raises(BitgetDuplicateOrderError) as exc:
+                await client.post(path, json_body={"symbol": "BTCUSDT", "clientOid": "oid-1"})
+            assert exc.value.client_oid == "oid-1"
+            assert exc.value.code == BitgetErrorCode.DUPLICATE_CLIENT_OID
+
+            # on a first attempt the clientOid was reused by the caller, not by a retry
+            with pytest.raises(BitgetError) as exc:
+                await client.post(path, json_body={"symbol": "BTCUSDT", "clientOid": "oid-1"})
+            assert not isinstance(exc.value, BitgetDuplicateOrderError)
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_is_raised_immediately(monkeypatch):
+    delays = _no_sleep(monkeypatch)
+    path = "/v1/balance"
+    with aioresponses() as mocked:
+        mocked.get(f"{BASE_URL}{path}", status=400, payload={"code": "40762", "msg": "insufficient"})
+        async with BitgetClient(base_url=BASE_URL) as client:
+            with pytest.raises(BitgetError):
+                await client.get(path)
+    assert delays == []
+
+
+def _counting_get(mocked, url, counter, payload):
+    async def cb(url, **kwargs):
+        counter["calls"] += 1
+        await asyncio.sleep(0.01)
+        return CallbackResult(status=200, headers={"Content-Type": "application/json"}, body=json.dumps(payload))
+
+    mocked.get(url, callback=cb, repeat=True)
+
+
+@pytest.mark.asyncio
+async def test_coalesce_shares_in_flight_identical_gets():
+    counter = {"calls": 0}
+    with aioresponses() as mocked:
+        _counting_get(mocked, f"{BASE_URL}/v1/leverage?symbol=BTCUSDT", counter, {"leverage": "5"})
+        async with BitgetClient(base_url=BASE_URL, coalesce=True) as client:
+            results = await asyncio.gather(*(client.get("/v1/leverage", {"symbol": "BTCUSDT"}) for _ in range(3)))
+            assert results == [{"leverage": "5"}] * 3
+            assert counter["calls"] == 1
+            # a finished request is not reused
+            await client.get("/v1/leverage", {"symbol": "BTCUSDT"})
+            assert counter["calls"] == 2
+
+
+@pytest.mark.asyncio
+async def test_request_cycle_memoizes_gets_until_a_write():
+    counter = {"calls": 0}
+    with aioresponses() as mocked:
+        _counting_get(mocked, f"{BASE_URL}/v1/position?symbol=BTCUSDT", counter, {"size": "1"})
+        mocked.post(f"{BASE_URL}/v1/order", payload={"ok": True}, headers={"Content-Type": "application/json"})
+        async with BitgetClient(base_url=BASE_URL) as client:
+            with request_cycle():
+                await client.get("/v1/position", {"symbol": "BTCUSDT"})
+                await client.get("/v1/position", {"symbol": "BTCUSDT", "unused": None})
+                assert counter["calls"] == 1
+                await client.post("/v1/order", json_body={"symbol": "BTCUSDT"})
+                await client.get("/v1/position", {"symbol": "BTCUSDT"})
+                assert counter["calls"] == 2
+            # no memoization outside a cycle
+            await client.get("/v1/position", {"symbol": "BTCUSDT"})
+            await client.get("/v1/position", {"symbol": "BTCUSDT"})
+            assert counter["calls"] == 4
+
+
+@pytest.mark.asyncio
+async def test_request_cycle_does_not_memoize_failures(monkeypatch):
+    _no_sleep(monkeypatch)
+    path = "/v1/flaky"
+    with aioresponses() as mocked:
+        mocked.get(f"{BASE_URL}{path}", status=400, payload={"code": "40762", "msg": "insufficient"})
+        mocked.get(f"{BASE_URL}{path}", status=200, payload={"ok": True}, headers={"Content-Type": "application/json"})
+        async with BitgetClient(base_url=BASE_URL) as client:
+            with request_cycle():
+                with pytest.raises(BitgetError):
+                    await client.get(path)
+                assert await client.get(path) == {"ok": True}
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from exchange.bitget.client.pagination import Page, id_watermark, paginate
+
+
+def _pages(*pages):
+    """fetch() over fixed pages keyed by cursor, recording the cursors requested"""
+    requested = []
+
+    async def fetch(cursor):
+        requested.append(cursor)
+        await asyncio.sleep(0)
+        return pages[cursor or 0]
+
+    return fetch, requested
+
+
+@pytest.mark.asyncio
+async def test_follows_cursor_until_last_page():
+    fetch, requested = _pages(Page([1, 2], 1), Page([3, 4], 2), Page([5], None))
+    assert [item async for item in paginate(fetch)] == [1, 2, 3, 4, 5]
+    assert requested == [None, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_next_page_is_prefetched_while_caller_processes():
+    fetch, requested = _pages(Page([1, 2], 1), Page([3], None))
+    it = paginate(fetch)
+    assert await it.__anext__() == 1
+    await asyncio.sleep(0.01)
+    assert requested == [None, 1]
+    await it.aclose()
+
+
+@pytest.mark.asyncio
+async def test_stops_at_watermark_without_fetching_further():
+    fetch, requested = _pages(
+        Page([{"id": "9"}, {"id": "8"}], 1),
+        Page([{"id": "7"}, {"id": "5"}], 2),
+        Page([{"id": "4"}], None),
+    )
+    items = [item["id"] async for item in paginate(fetch, stop=id_watermark("id", "6"))]
+    assert items == ["9", "8", "7"]
+    # the second page already reaches the watermark, so the third is never requested
+    assert requested == [None, 1]
+
+
+@pytest.mark.asyncio
+async def test_empty_window_does_not_end_time_paging():
+    fetch, requested = _pages(Page([1], 1), Page([], 2), Page([2], None))
+    assert [item async for item in paginate(fetch)] == [1, 2]
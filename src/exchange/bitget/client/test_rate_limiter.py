@@ -0,0 +1,61 @@
+import asyncio
+import time
+
+import pytest
+from aioresponses import aioresponses
+
+from exchange.bitget.client.bitget_client import BitgetClient
+from exchange.bitget.client.rate_limiter import BitgetRateLimiter, RateLimitRule
+
+BASE_URL = "https://api.example.com"
+
+
+@pytest.mark.asyncio
+async def test_paces_requests_to_the_endpoint_rate():
+    limiter = BitgetRateLimiter([RateLimitRule("/api/v2/mix/order/*", rate=50, capacity=1)], global_rule=None)
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire("/api/v2/mix/order/place-order") for _ in range(6)))
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_wildcard_rule_keeps_a_bucket_per_endpoint():
+    limiter = BitgetRateLimiter([RateLimitRule("/api/v2/mix/market/*", rate=1, capacity=1)], global_rule=None)
+    start = time.monotonic()
+    await limiter.acquire("/api/v2/mix/market/ticker")
+    await limiter.acquire("/api/v2/mix/market/history-candles?symbol=BTCUSDT")
+    assert time.monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_first_matching_rule_wins_and_global_limit_applies_to_all():
+    limiter = BitgetRateLimiter(
+        [{"path": "/api/v2/mix/order/place-order", "rate": 1}, {"path": "/api/v2/mix/order/*", "rate": 100}],
+        global_rule={"path": "*", "rate": 50, "capacity": 2},
+    )
+    assert limiter._bucket("/api/v2/mix/order/place-order").rate == 1
+    assert limiter._bucket("/api/v2/mix/order/orders-history").rate == 100
+    assert limiter._bucket("/api/v1/unknown") is None
+
+    start = time.monotonic()
+    for path in ("/a", "/b", "/c", "/d"):
+        await limiter.acquire(path)
+    # two free tokens, the next two paced by the global 50/s bucket
+    assert time.monotonic() - start >= 2 / 50 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_clients_sharing_a_limiter_share_the_budget():
+    limiter = BitgetRateLimiter([RateLimitRule("/v1/*", rate=50, capacity=1)], global_rule=None)
+    first = BitgetClient(base_url=BASE_URL, rate_limiter=limiter)
+    second = BitgetClient(base_url=BASE_URL, rate_limiter=limiter)
+    try:
+        with aioresponses() as mocked:
+            for _ in range(4):
+                mocked.get(f"{BASE_URL}/v1/ping", payload={"ok": True}, headers={"Content-Type": "application/json"})
+            start = time.monotonic()
+            await asyncio.gather(first.get("/v1/ping"), second.get("/v1/ping"), first.get("/v1/ping"), second.get("/v1/ping"))
+            assert time.monotonic() - start >= 3 / 50 * 0.9
+    finally:
+        await first.close()
+        await second.close()
@@ -194,3 +194,30 @@ async def test_error_bubbles_with_http_status_and_body(monkeypatch):
     assert err.data == error_body["data"]
     s = str(err)
     assert "INSUFFICIENT_BALANCE" in s and "40762" in s and error_body["msg"] in s
+
+
+@pytest.mark.asyncio
+async def test_timestamp_expired_is_retried_with_a_fresh_signature(monkeypatch):
+    async def fake_sleep(delay):
+        pass
+
+    monkeypatch.setattr("exchange.bitget.client.bitget_client.asyncio.sleep", fake_sleep)
+    now = {"value": 1_720_000_000.0}
+    monkeypatch.setattr("exchange.bitget.client.signature_client.time.time", lambda: now["value"])
+    seen = []
+
+    def cb(url, **kwargs):
+        seen.append(kwargs["headers"]["ACCESS-TIMESTAMP"])
+        if len(seen) == 1:
+            now["value"] += 31
+            return CallbackResult(status=400, payload={"code": "40008", "msg": "Request timestamp expired"})
+        return CallbackResult(status=200, headers={"Content-Type": "application/json"}, body=json.dumps({"ok": True}))
+
+    with aioresponses() as mocked:
+        mocked.get(f"{BASE_URL}/v1/ping", callback=cb, repeat=True)
+        async with SignatureClient(
+            base_url=BASE_URL, access_key=ACCESS_KEY, secret_key=SECRET_KEY, passphrase=PASSPHRASE
+        ) as client:
+            assert await client.get("/v1/ping") == {"ok": True}
+
+    assert seen == ["1720000000000", "1720000031000"]
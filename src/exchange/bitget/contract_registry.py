@@ -0,0 +1,205 @@
+import asyncio
+import dataclasses
+import json
+import logging
+import os
+import tempfile
+import time
+from decimal import Decimal, ROUND_DOWN
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from exchange.bitget.future.future_market_client import BitgetFutureMarketClient
+
+logger = logging.getLogger(__name__)
+
+# 캐시 파일에 저장하는 원본 필드
+SPEC_FIELDS = ("symbol", "pricePlace", "priceEndStep", "volumePlace", "sizeMultiplier", "minTradeNum", "minTradeUSDT")
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "mango-shake"
+
+
+def _round_down(value: Decimal, step: Decimal) -> Decimal:
+    if step == 0:
+        return value
+    return (value / step).to_integral_value(rounding=ROUND_DOWN) * step
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ContractSpec:
+    """
+    선물 계약 규격. `/api/v2/mix/market/contracts` 항목에서 미리 계산해 둔 값.
+    tick 은 가격 단위, qty_step 은 수량 단위, min_qty/min_notional 은 최소 주문 수량/금액(USDT).
+    """
+    symbol: str
+    tick: Decimal
+    qty_step: Decimal
+    min_qty: Decimal
+    min_notional: Decimal
+
+    @classmethod
+    def from_contract(cls, item: dict) -> "ContractSpec":
+        tick = (Decimal(1) / (Decimal(10) ** int(item.get("pricePlace") or 0))) * Decimal(str(item.get("priceEndStep") or 1))
+        if item.get("sizeMultiplier"):
+            qty_step = Decimal(str(item["sizeMultiplier"]))
+        else:
+            qty_step = Decimal(1) / (Decimal(10) ** int(item.get("volumePlace") or 0))
+        return cls(
+            item["symbol"],
+            tick,
+            qty_step,
+            Decimal(str(item.get("minTradeNum") or 0)),
+            Decimal(str(item.get("minTradeUSDT") or 0)),
+        )
+
+    def round_price(self, price: Decimal) -> Decimal:
+        return _round_down(price, self.tick)
+
+    def round_qty(self, qty: Decimal) -> Decimal:
+        return _round_down(qty, self.qty_step)
+
+    def validate(self, price: Decimal, qty: Decimal) -> Optional[str]:
+        """주문 가능하면 None, 아니면 사유"""
+        if qty < self.min_qty:
+            return f"qty {qty} < min {self.min_qty}"
+        if price * qty < self.min_notional:
+            return f"notional {price * qty} < min {self.min_notional} USDT"
+        return None
+
+
+class ContractRegistry:
+    """
+    상품 유형 전체의 계약 규격을 한 번에 받아 심볼별로 보관하고, 로컬 파일에 캐시한다.
+
+    - start(): 캐시 파일을 읽어 네트워크 없이 바로 사용, 캐시가 없거나 필요한 심볼이 빠졌을 때만 즉시 조회
+      이후 ttl 이 지나면 백그라운드에서 갱신 (실패 시 기존 규격 유지 후 retry_interval 뒤 재시도)
+      한 번 실행하는 스크립트는 start(background=False) 로 갱신 루프 없이 사용
+    - get(): 메모리 dict 조회
+    """
+
+    def __init__(
+        self,
+        market_client_factory: Callable[[], BitgetFutureMarketClient],
+        product_type: str = "USDT-FUTURES",
+        cache_path: Optional[str | Path] = None,
+        ttl: float = 6 * 60 * 60,
+        retry_interval: float = 60,
+    ):
+        # resolved lazily so the registry can be built before an event loop exists
+        self._market_client_factory = market_client_factory
+        self.product_type = product_type
+        self.cache_path = Path(cache_path) if cache_path else DEFAULT_CACHE_DIR / f"bitget-contracts-{product_type}.json"
+        self.ttl = ttl
+        self.retry_interval = retry_interval
+        self.fetched_at: Optional[float] = None  # epoch seconds
+        self._specs: Dict[str, ContractSpec] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def get(self, symbol: str) -> ContractSpec:
+        try:
+            return self._specs[symbol]
+        except KeyError:
+            raise LookupError(f"No contract spec for {symbol} ({self.product_type})") from None
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._specs
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    @property
+    def stale(self) -> bool:
+        return self.fetched_at is None or time.time() - self.fetched_at >= self.ttl
+
+    def _apply(self, contracts: List[dict], fetched_at: float) -> None:
+        specs = {}
+        for item in contracts:
+            try:
+                specs[item["symbol"]] = ContractSpec.from_contract(item)
+            except (KeyError, ArithmeticError, ValueError) as e:
+                logger.warning(f"Skipping malformed contract {item.get('symbol')}: {e}")
+        self._specs = specs
+        self.fetched_at = fetched_at
+
+    def load(self) -> bool:
+        """캐시 파일에서 규격을 읽음 (만료 여부와 상관없이 사용), 읽었으면 True"""
+        try:
+            cached = json.loads(self.cache_path.read_text())
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable contract cache {self.cache_path}: {e}")
+            return False
+        if cached.get("product_type") != self.product_type:
+            return False
+        self._apply(cached.get("contracts", []), float(cached.get("fetched_at", 0)))
+        logger.info(f"Loaded {len(self._specs)} {self.product_type} contract specs from {self.cache_path}")
+        return True
+
+    def _save(self, contracts: List[dict]) -> None:
+        payload = {
+            "product_type": self.product_type,
+            "fetched_at": self.fetched_at,
+            "contracts": [{k: item.get(k) for k in SPEC_FIELDS} for item in contracts],
+        }
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # 쓰는 도중 죽어도 기존 캐시가 깨지지 않도록 임시 파일 후 교체
+        fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, prefix=self.cache_path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(payload, f)
+            os.replace(tmp, self.cache_path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    async def refresh(self) -> None:
+        contracts = await self._market_client_factory().get_contracts(self.product_type)
+        if not contracts:
+            raise LookupError(f"Empty contract list for {self.product_type}")
+        self._apply(contracts, time.time())
+        try:
+            self._save(contracts)
+        except OSError as e:
+            logger.warning(f"Could not write contract cache {self.cache_path}: {e}")
+        logger.info(f"Refreshed {len(self._specs)} {self.product_type} contract specs")
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            delay = self.ttl - (time.time() - self.fetched_at) if self.fetched_at is not None else 0
+            await asyncio.sleep(max(delay, 0))
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Contract spec refresh failed, keeping cached specs: {e}")
+                await asyncio.sleep(self.retry_interval)
+
+    async def start(self, symbols: Iterable[str] = (), background: bool = True) -> bool:
+        """
+        캐시가 없거나 symbols 중 캐시에 없는 심볼이 있을 때만 시작 전에 조회.
+        background=False(한 번 실행하고 끝나는 스크립트)면 갱신 루프 없이 캐시가 만료됐을 때도 시작 전에 조회한다.
+        조회에 실패해도 예외를 던지지 않고 캐시(없으면 호출 측 기본값)로 진행하며, 이때 False 반환.
+        """
+        loaded = self.load()
+        missing = any(symbol not in self._specs for symbol in symbols)
+        ok = True
+        if not loaded or missing or (not background and self.stale):
+            try:
+                await self.refresh()
+            except Exception as e:
+                ok = False
+                logger.warning(f"Contract spec fetch failed, using {len(self._specs)} cached specs: {e}")
+        if background and self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._refresh_loop())
+        return ok
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -6,7 +6,7 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class BitgetError(Exception):
-    def __init__(self, error_resp: dict):
+    def __init__(self, error_resp: dict, status: int | None = None, retry_after: float | None = None):
         code = error_resp.get("code", "00000")
         try:
             self.code = BitgetErrorCode(code)
@@ -18,12 +18,35 @@ class BitgetError(Exception):
         self.msg = error_resp.get("msg")
         self.request_time = error_resp.get("requestTime")
         self.data = error_resp.get("data")
+        self.status = status  # HTTP 상태 코드
+        self.retry_after = retry_after  # Retry-After 헤더(초), 없으면 None
         super().__init__(f"Bitget API Error {self.code.name}({self.code.value}): {self.msg}")
 
+class BitgetDuplicateOrderError(BitgetError):
+    """
+    재시도한 주문 요청이 clientOid 중복으로 거부됨.
+    앞선 시도(타임아웃/5xx 로 응답을 못 받은 요청)가 실제로는 접수되었을 가능성이 높으므로
+    같은 주문을 다시 넣지 말고 clientOid 로 주문을 조회해야 한다.
+    """
+
+    def __init__(self, error: BitgetError, client_oid: str | None):
+        super().__init__(
+            {"code": error.original_code, "msg": error.msg, "requestTime": error.request_time, "data": error.data},
+            status=error.status,
+            retry_after=error.retry_after,
+        )
+        self.client_oid = client_oid
+
+
 class BitgetErrorCode(enum.Enum):
     INSUFFICIENT_BALANCE = "40762" # The order amount exceeds the balance
     UNKNOWN_ERROR = "00000" # Unknown error
     NO_ORDER_TO_CANCEL = "22001"
+    RATE_LIMIT = "429" # Too many requests
+    TIMESTAMP_EXPIRED = "40008" # Request timestamp expired
+    REQUEST_TIMEOUT = "40010" # Request timed out
+    SYSTEM_ERROR = "40015" # System error (system busy)
+    DUPLICATE_CLIENT_OID = "40786" # Duplicate clientOid
 
     @classmethod
     def _missing_(cls, value):
@@ -36,4 +59,13 @@ class BitgetErrorCode(enum.Enum):
             BitgetErrorCode.NO_ORDER_TO_CANCEL,
         }
 
+    def retryable(self) -> bool:
+        # 잠시 후 같은 요청을 다시 보내면 성공할 수 있는 에러인지 여부 반환
+        return self in {
+            BitgetErrorCode.RATE_LIMIT,
+            BitgetErrorCode.TIMESTAMP_EXPIRED,
+            BitgetErrorCode.REQUEST_TIMEOUT,
+            BitgetErrorCode.SYSTEM_ERROR,
+        }
+
 # ValueError("'22001' is not a valid BitgetErrorCode")
\ No newline at end of file
@@ -22,4 +22,21 @@ def test_bitget_error_parsing(error_resp, expected_code, expected_msg, expected_
     assert error.request_time == expected_request_time
     assert error.data == expected_data
     assert str(error).find(str(expected_code.value)) != -1
-    assert str(error).find(expected_msg) != -1
\ No newline at end of file
+    assert str(error).find(expected_msg) != -1
+
+
+@pytest.mark.parametrize(
+    "code, retryable",
+    [
+        ("429", True),
+        ("40008", True),
+        ("40010", True),
+        ("40015", True),
+        ("40762", False),
+        ("22001", False),
+        ("40786", False),
+        ("99999", False),
+    ]
+)
+def test_retryable_codes(code, retryable):
+    assert BitgetError({"code": code, "msg": ""}).code.retryable() is retryable
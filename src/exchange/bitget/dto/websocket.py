@@ -1,5 +1,8 @@
 import dataclasses
 
+# private `account` args identify the margin coin with `coin` instead of `instId`
+ACCOUNT_CHANNEL = "account"
+
 
 class BaseWsReq:
 
@@ -22,6 +25,21 @@ class SubscribeReq:
     def __hash__(self) -> int:
         return hash(self.inst_type + self.channel + self.inst_id)
 
+    @property
+    def key(self) -> tuple[str, str, str]:
+        """(instType, channel, instId) - the lookup key used for push routing."""
+        return self.inst_type, self.channel, self.inst_id
+
+    def to_arg(self) -> dict[str, str]:
+        """Serialize to the camelCase arg object Bitget expects on the wire."""
+        id_field = "coin" if self.channel == ACCOUNT_CHANNEL else "instId"
+        return {"instType": self.inst_type, "channel": self.channel, id_field: self.inst_id}
+
+
+def arg_key(arg: dict) -> tuple[str, str, str]:
+    """(instType, channel, instId) of an arg echoed back by the exchange."""
+    return arg.get("instType"), arg.get("channel"), arg.get("instId") or arg.get("coin")
+
 
 class WsLoginReq:
 
@@ -30,3 +48,78 @@ class WsLoginReq:
         self.passphrase = passphrase
         self.timestamp = timestamp
         self.sign = sign
+
+    def to_arg(self) -> dict[str, str]:
+        return {"apiKey": self.api_key, "passphrase": self.passphrase, "timestamp": self.timestamp, "sign": self.sign}
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class WsCandle:
+    """
+    Candle pushed on the `candle{interval}` channel.
+    ["1695685500000","27000","27000.5","26999.5","27000","0.057","1539.0155","1539.0155"]
+    """
+    symbol: str
+    interval: str
+    ts: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    quote_volume: float
+
+    @classmethod
+    def from_row(cls, symbol: str, interval: str, row: list[str]) -> "WsCandle":
+        return cls(
+            symbol,
+            interval,
+            int(row[0]),
+            float(row[1]),
+            float(row[2]),
+            float(row[3]),
+            float(row[4]),
+            float(row[5]),
+            float(row[6]),
+        )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class WsTrade:
+    """
+    Public trade pushed on the `trade` channel.
+    {"ts":"1695716760565","price":"27000.5","size":"0.001","side":"buy","tradeId":"1111111111"}
+    """
+    symbol: str
+    ts: int
+    price: float
+    size: float
+    side: str
+    trade_id: str
+
+    @classmethod
+    def from_item(cls, symbol: str, item: dict) -> "WsTrade":
+        return cls(
+            symbol,
+            int(item["ts"]),
+            float(item["price"]),
+            float(item["size"]),
+            item["side"],
+            item["tradeId"],
+        )
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Bar:
+    """Bar aggregated locally from the trade tape; `kind` is e.g. "time:7m", "volume:50"."""
+    symbol: str
+    kind: str
+    start_ts: int
+    end_ts: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    notional: float
+    trades: int
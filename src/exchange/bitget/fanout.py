@@ -0,0 +1,113 @@
+import asyncio
+import enum
+import logging
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(enum.Enum):
+    # keep everything; the receiver stops reading until the consumer catches up
+    BLOCK = "block"
+    # discard the oldest queued item to make room
+    DROP_OLDEST = "drop_oldest"
+    # keep only the latest item per key; a new key evicts the oldest key when full
+    CONFLATE = "conflate"
+
+
+class QueueSubscriber:
+    """
+    Bounded queue between a stream and one async consumer.
+
+    `offer()` is called synchronously from dispatch and never awaits, so a slow handler
+    only grows its own queue. What happens when the queue is full depends on `policy`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Awaitable[None]],
+        maxsize: int = 1000,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if policy is OverflowPolicy.CONFLATE and key is None:
+            raise ValueError("CONFLATE policy requires a key function")
+        self.name = name
+        self.policy = policy
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._handler = handler
+        self._key = key
+        self._queue: deque | OrderedDict = OrderedDict() if policy is OverflowPolicy.CONFLATE else deque()
+        self._ready = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._task: Optional[asyncio.Task] = None
+        self.disposable = None
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def full(self) -> bool:
+        return len(self._queue) >= self.maxsize
+
+    def offer(self, item: Any) -> None:
+        queue = self._queue
+        if self.policy is OverflowPolicy.CONFLATE:
+            k = self._key(item)
+            if k in queue:
+                queue[k] = item
+                self.dropped += 1
+            else:
+                if len(queue) >= self.maxsize:
+                    queue.popitem(last=False)
+                    self.dropped += 1
+                queue[k] = item
+        elif self.policy is OverflowPolicy.DROP_OLDEST:
+            if len(queue) >= self.maxsize:
+                queue.popleft()
+                self.dropped += 1
+            queue.append(item)
+        else:
+            queue.append(item)
+            if len(queue) >= self.maxsize:
+                self._space.clear()
+        self._ready.set()
+
+    def _pop(self) -> Any:
+        if self.policy is OverflowPolicy.CONFLATE:
+            return self._queue.popitem(last=False)[1]
+        return self._queue.popleft()
+
+    async def wait_space(self) -> None:
+        await self._space.wait()
+
+    async def run(self) -> None:
+        while True:
+            await self._ready.wait()
+            while self._queue:
+                item = self._pop()
+                if len(self._queue) < self.maxsize:
+                    self._space.set()
+                try:
+                    await self._handler(item)
+                except Exception as e:
+                    logger.exception(f"[{self.name}] Subscriber handler failed: {e}")
+            self._ready.clear()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self.run())
+
+    def stop(self) -> None:
+        if self.disposable is not None:
+            self.disposable.dispose()
+            self.disposable = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
@@ -1,2 +1,2 @@
 from .future_market_client import BitgetFutureMarketClient
-from .future_trade_client import BitgetFutureTradeClient
\ No newline at end of file
+from .future_trade_client import BatchOrderResult, BitgetFutureTradeClient, CancelSpec, OrderSpec
@@ -1,18 +1,30 @@
 from typing import Any
 
+from aiohttp import TCPConnector
+
+from exchange.bitget.client.rate_limiter import BitgetRateLimiter
 from exchange.bitget.client import SignatureClient
 
 
 class BitgetFutureAccountClient(SignatureClient):
 
-    def __init__(self, base_url: str, access_key: str, secret_key: str, passphrase: str):
-        super().__init__(base_url, access_key, secret_key, passphrase)
+    def __init__(
+        self,
+        base_url: str,
+        access_key: str,
+        secret_key: str,
+        passphrase: str,
+        connector: TCPConnector | None = None,
+        rate_limiter: BitgetRateLimiter | None = None,
+        coalesce: bool = False,
+    ):
+        super().__init__(base_url, access_key, secret_key, passphrase, connector, rate_limiter, coalesce=coalesce)
 
     async def __aenter__(self) -> "BitgetFutureAccountClient":
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        await self._client.close()
+        await self.close()
 
     async def get_accounts(
         self,
@@ -1,47 +1,120 @@
+import time
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 from aiohttp import TCPConnector
 
+from exchange.bitget.client.pagination import Page, paginate
+from exchange.bitget.client.rate_limiter import BitgetRateLimiter
 from exchange.bitget.typing import ProductType
+from exchange.bitget.utils.interval import interval_to_ms, to_ms
 from shared.http.tracing_client_session import TracingClientSession
 
+
 class BitgetFutureMarketClient:
 
-    def __init__(self, base_url: str, product_type: ProductType):
-        connector = TCPConnector(ssl=False)
-        self._client = TracingClientSession(base_url=base_url, headers={"Content-Type": "application/json"}, connector=connector)
+    def __init__(
+        self,
+        base_url: str,
+        product_type: ProductType,
+        connector: Optional[TCPConnector] = None,
+        rate_limiter: Optional[BitgetRateLimiter] = None,
+    ):
+        self._client = TracingClientSession(
+            base_url=base_url,
+            headers={"Content-Type": "application/json"},
+            connector=connector or TCPConnector(ssl=False),
+            connector_owner=connector is None,
+        )
         self._product_type = product_type
+        self._rate_limiter = rate_limiter
+
+    async def _throttle(self, path: str) -> None:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire(path)
 
     async def get_contract_config(self, symbol: str):
+        await self._throttle("/api/v2/mix/market/contracts")
         async with self._client.get("/api/v2/mix/market/contracts", params={ "productType": self._product_type, "symbol": symbol }) as resp:
             resp.raise_for_status()
             return await resp.json()
 
+    async def get_contracts(self, product_type: str = 'USDT-FUTURES') -> list:
+        """
+        Contract specs for every symbol of the product type in one call:
+        [{"symbol", "pricePlace", "priceEndStep", "volumePlace", "sizeMultiplier", "minTradeNum", "minTradeUSDT", ...}]
+        """
+        await self._throttle("/api/v2/mix/market/contracts")
+        async with self._client.get("/api/v2/mix/market/contracts", params={"productType": product_type}) as resp:
+            resp.raise_for_status()
+            res = await resp.json()
+            return res.get("data", [])
+
     async def ticker(self, symbol: str):
         """
         Get ticker information for a specific symbol.
         {"code":"00000","msg":"success","requestTime":1695794095685,"data":[{"symbol":"ETHUSD_231229","lastPr":"1829.3","askPr":"1829.8","bidPr":"1829.3","bidSz":"0.054","askSz":"0.785","high24h":"0","low24h":"0","ts":"1695794098184","change24h":"0","baseVolume":"0","quoteVolume":"0","usdtVolume":"0","openUtc":"0","changeUtc24h":"0","indexPrice":"1822.15","fundingRate":"0","holdingAmount":"9488.49","deliveryStartTime":"1693538723186","deliveryTime":"1703836799000","deliveryStatus":"delivery_normal","open24h":"0","markPrice":"1829"}]}
         """
+        await self._throttle("/api/v2/mix/market/ticker")
         async with self._client.get("/api/v2/mix/market/ticker", params={ "productType": "USDT-FUTURES", "symbol": symbol }) as resp:
             resp.raise_for_status()
             return await resp.json()
 
-    async def get_klines(self, symbol: str, granularity: str, product_type: str = 'USDT-FUTURES', start_time: Optional[datetime] = None, end_time: Optional[datetime] = None, limit: int = 1000):
+    async def get_klines(
+        self,
+        symbol: str,
+        granularity: str,
+        product_type: str = 'USDT-FUTURES',
+        start_time: Optional[datetime | int] = None,
+        end_time: Optional[datetime | int] = None,
+        limit: int = 1000,
+    ):
+        """
+        Historical candles, oldest first: [[ts, open, high, low, close, baseVolume, quoteVolume], ...]
+        `start_time`/`end_time` are datetimes or epoch milliseconds.
+        """
         params = {
             "symbol": symbol,
             "productType": product_type,
             "granularity": granularity,
             "limit": limit,
-            "startTime": start_time,
-            "endTime": end_time
         }
+        if start_time is not None:
+            params["startTime"] = to_ms(start_time)
+        if end_time is not None:
+            params["endTime"] = to_ms(end_time)
 
+        await self._throttle("/api/v2/mix/market/history-candles")
         async with self._client.get("/api/v2/mix/market/history-candles", params=params) as resp:
             resp.raise_for_status()
             res = await resp.json()
             return res.get("data", [])
 
+    def iter_klines(
+        self,
+        symbol: str,
+        granularity: str,
+        start_time: datetime | int,
+        end_time: Optional[datetime | int] = None,
+        product_type: str = 'USDT-FUTURES',
+        limit: int = 200,
+    ) -> AsyncIterator[list]:
+        """
+        Iterate candles oldest first from `start_time` (the watermark) to `end_time` (default: now),
+        one window of `limit` bars per request, prefetching the next window while the caller
+        processes the current one.
+        """
+        interval_ms = interval_to_ms(granularity)
+        end_ms = to_ms(end_time) if end_time is not None else int(time.time() * 1000)
+
+        async def fetch(window_start: int) -> Page[list]:
+            window_end = min(window_start + interval_ms * limit - 1, end_ms)
+            candles = await self.get_klines(symbol, granularity, product_type, window_start, window_end, limit)
+            candles = sorted((c for c in candles if window_start <= int(c[0]) <= window_end), key=lambda c: int(c[0]))
+            return Page(candles, window_end + 1 if window_end < end_ms else None)
+
+        return paginate(fetch, to_ms(start_time))
+
     async def close(self):
         await self._client.close()
 
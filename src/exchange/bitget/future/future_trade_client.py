@@ -1,9 +1,95 @@
+import asyncio
+import dataclasses
+import uuid
 from datetime import datetime
 from decimal import Decimal, ROUND_DOWN
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
 
+from aiohttp import TCPConnector
+
+from exchange.bitget.client.rate_limiter import BitgetRateLimiter
+from exchange.bitget.client.pagination import Page, id_watermark, paginate
 from exchange.bitget.client.signature_client import SignatureClient
+from exchange.bitget.dto.bitget_error import BitgetDuplicateOrderError, BitgetError
+from shared.utils.iterable import chunks
+
+# batch-place-order / batch-cancel-orders 한 번에 보낼 수 있는 최대 주문 수
+BATCH_ORDER_LIMIT = 50
+
+
+def _order_fields(
+    size: Decimal,
+    side: str,
+    order_type: str = "limit",
+    price: Optional[Decimal] = None,
+    preset_tp_price: Optional[Decimal] = None,
+    preset_sl_price: Optional[Decimal] = None,
+    trade_side: Optional[str] = None,
+    hold_side: Optional[str] = None,
+    force: Optional[str] = None,
+    client_oid: Optional[str] = None,
+) -> dict:
+    """단건/일괄 주문 공통 필드 (symbol, productType, margin 은 호출 측에서 채움)"""
+    if order_type == "limit" and price is None:
+        raise ValueError("limit 주문에는 price가 필요합니다")
+
+    # limit 주문이면 force를 gtc로 설정
+    if order_type == "limit" and force is None:
+        force = "gtc"
+
+    return {
+        "size": str(size), "side": side, "orderType": order_type,
+        **({"price": str(price)} if (order_type=="limit" and price is not None) else {}),
+        **({"tradeSide": trade_side} if trade_side else {}),
+        **({"holdSide": hold_side} if hold_side else {}),
+        **({"force": force} if (order_type=="limit" and force) else {}),
+        **({"clientOid": client_oid} if client_oid else {}),
+        **({"presetStopSurplusPrice": str(preset_tp_price)} if preset_tp_price is not None else {}),
+        **({"presetStopLossPrice": str(preset_sl_price)} if preset_sl_price is not None else {}),
+    }
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class OrderSpec:
+    """일괄 주문 한 건. 필드 의미는 place_order 와 같다."""
+    symbol: str
+    size: Decimal
+    side: str
+    order_type: str = "limit"
+    price: Optional[Decimal] = None
+    preset_tp_price: Optional[Decimal] = None
+    preset_sl_price: Optional[Decimal] = None
+    trade_side: Optional[str] = None
+    hold_side: Optional[str] = None
+    force: Optional[str] = None
+    client_oid: Optional[str] = None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CancelSpec:
+    """일괄 취소 한 건. order_id / client_oid 중 하나는 있어야 한다."""
+    symbol: str
+    order_id: Optional[str] = None
+    client_oid: Optional[str] = None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class BatchOrderResult:
+    """
+    일괄 주문/취소의 입력 한 건에 대한 결과 (입력과 같은 순서로 반환).
+    거래소가 해당 주문을 failureList 로 돌려줬거나 청크 요청 자체가 실패하면 success=False.
+    """
+    spec: OrderSpec | CancelSpec
+    success: bool
+    order_id: Optional[str] = None
+    client_oid: Optional[str] = None
+    error_code: Optional[str] = None
+    error_msg: Optional[str] = None
+
+
+def _batch_failure(spec: OrderSpec | CancelSpec, error_code: Optional[str], error_msg: str) -> BatchOrderResult:
+    return BatchOrderResult(spec, False, getattr(spec, "order_id", None), spec.client_oid, error_code, error_msg)
 
 
 class BitgetFutureTradeClient(SignatureClient):
@@ -14,14 +100,17 @@ class BitgetFutureTradeClient(SignatureClient):
         access_key: str,
         secret_key: str,
         passphrase: str,
+        connector: TCPConnector | None = None,
+        rate_limiter: BitgetRateLimiter | None = None,
+        coalesce: bool = False,
     ):
-        super().__init__(base_url, access_key, secret_key, passphrase)
+        super().__init__(base_url, access_key, secret_key, passphrase, connector, rate_limiter, coalesce=coalesce)
 
     async def __aenter__(self) -> "BitgetFutureTradeClient":
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
-        await self._client.close()
+        await self.close()
 
     async def get_history_orders(
         self,
@@ -59,6 +148,72 @@ class BitgetFutureTradeClient(SignatureClient):
 
         return await self.get(path, params=params)
 
+    async def get_order_detail(
+        self,
+        symbol: str,
+        product_type: str = "USDT-FUTURES",
+        order_id: Optional[str] = None,
+        client_oid: Optional[str] = None,
+    ):
+        """
+        Fetch one order by orderId or clientOid.
+        """
+        path = "/api/v2/mix/order/detail"
+        params = {"symbol": symbol, "productType": product_type}
+        if order_id:
+            params["orderId"] = order_id
+        if client_oid:
+            params["clientOid"] = client_oid
+        return await self.get(path, params=params)
+
+    async def _on_duplicate_order(self, method: str, path: str, json_body: dict | None, error: BitgetError) -> Any:
+        """재시도한 place-order 가 clientOid 중복이면 앞선 시도로 접수된 주문을 place-order 응답 형태로 반환"""
+        if path != "/api/v2/mix/order/place-order" or not json_body or not json_body.get("clientOid"):
+            return await super()._on_duplicate_order(method, path, json_body, error)
+        client_oid = json_body["clientOid"]
+        try:
+            res = await self.get_order_detail(json_body["symbol"], json_body["productType"], client_oid=client_oid)
+        except Exception as e:
+            raise BitgetDuplicateOrderError(error, client_oid) from e
+        order = res.get("data") or {}
+        if not order.get("orderId"):
+            raise BitgetDuplicateOrderError(error, client_oid) from error
+        return {
+            "code": "00000",
+            "msg": "success",
+            "requestTime": res.get("requestTime"),
+            "data": {"orderId": order["orderId"], "clientOid": order.get("clientOid") or client_oid},
+        }
+
+    def iter_history_orders(
+        self,
+        product_type: str,
+        symbol: str = None,
+        start_time: datetime = None,
+        end_time: datetime = None,
+        until_id: str = None,
+        limit: int = 100,
+    ) -> AsyncIterator[dict]:
+        """
+        Iterate historical orders newest first, following the `endId` cursor page by page
+        (the next page is fetched while the caller processes the current one).
+        Stops before the first order whose orderId <= `until_id` (the last one already stored).
+        """
+        async def fetch(cursor: Optional[str]) -> Page[dict]:
+            res = await self.get_history_orders(
+                product_type=product_type,
+                symbol=symbol,
+                id_less_than=cursor,
+                start_time=start_time,
+                end_time=end_time,
+                limit=limit,
+            )
+            data = res.get("data") or {}
+            orders = data.get("entrustedList") or []
+            return Page(orders, data.get("endId") if len(orders) >= limit else None)
+
+        return paginate(fetch, stop=id_watermark("orderId", until_id))
+
     async def place_order(
         self,
         *,
@@ -83,28 +238,149 @@ class BitgetFutureTradeClient(SignatureClient):
         side: buy/sell (포지션 방향 반대 청산 시 사용)
         """
         path = "/api/v2/mix/order/place-order"
-        if order_type == "limit" and price is None:
-            raise ValueError("limit 주문에는 price가 필요합니다")
-
-        # limit 주문이면 force를 gtc로 설정
-        if order_type == "limit" and force is None:
-            force = "gtc"
-
         body = {
             "symbol": symbol, "productType": product_type,
             **({"marginMode": margin_mode} if margin_mode else {}),
             **({"marginCoin": margin_coin} if margin_coin else {}),
-            "size": str(size), "side": side, "orderType": order_type,
-            **({"price": str(price)} if (order_type=="limit" and price is not None) else {}),
-            **({"tradeSide": trade_side} if trade_side else {}),
-            **({"holdSide": hold_side} if hold_side else {}),
-            **({"force": force} if (order_type=="limit" and force) else {}),
-            **({"clientOid": client_oid} if client_oid else {}),
-            **({"presetStopSurplusPrice": str(preset_tp_price)} if preset_tp_price is not None else {}),
-            **({"presetStopLossPrice": str(preset_sl_price)} if preset_sl_price is not None else {}),
+            **_order_fields(
+                size, side, order_type, price, preset_tp_price, preset_sl_price,
+                trade_side, hold_side, force, client_oid,
+            ),
         }
         return await self.post(path, json_body=body)
 
+    async def batch_place_orders(
+        self,
+        orders: Sequence[OrderSpec],
+        product_type: str = "USDT-FUTURES",
+        margin_mode: str = "crossed",
+        margin_coin: str = "USDT",
+    ) -> List[BatchOrderResult]:
+        """
+        여러 주문을 batch-place-order 로 전송.
+        심볼별로 묶어 BATCH_ORDER_LIMIT 건씩 나눈 청크를 동시에 보내고(한도는 rate limiter 가 조절),
+        successList/failureList 를 clientOid 로 입력 주문과 짝지어 입력 순서대로 돌려준다.
+        clientOid 가 없는 주문에는 새로 붙여서 응답 매칭과 재시도(중복 주문 방지)에 사용한다.
+        """
+        path = "/api/v2/mix/order/batch-place-order"
+        specs = [
+            spec if spec.client_oid else dataclasses.replace(spec, client_oid=uuid.uuid4().hex)
+            for spec in orders
+        ]
+        if len({spec.client_oid for spec in specs}) != len(specs):
+            raise ValueError("일괄 주문의 clientOid 가 중복되었습니다")
+        # 요청 전에 전부 검증해서 일부 청크만 나가는 일이 없도록 함
+        items = [
+            _order_fields(
+                spec.size, spec.side, spec.order_type, spec.price, spec.preset_tp_price,
+                spec.preset_sl_price, spec.trade_side, spec.hold_side, spec.force, spec.client_oid,
+            )
+            for spec in specs
+        ]
+
+        async def send(symbol: str, chunk: Sequence[Tuple[OrderSpec, dict]]) -> List[BatchOrderResult]:
+            body = {
+                "symbol": symbol, "productType": product_type,
+                "marginMode": margin_mode, "marginCoin": margin_coin,
+                "orderList": [item for _, item in chunk],
+            }
+            return await self._send_batch(path, body, [spec for spec, _ in chunk])
+
+        return await self._run_batches(list(zip(specs, items)), send)
+
+    async def batch_cancel_orders(
+        self,
+        orders: Sequence[CancelSpec],
+        product_type: str = "USDT-FUTURES",
+        margin_coin: str = "USDT",
+    ) -> List[BatchOrderResult]:
+        """
+        여러 주문을 batch-cancel-orders 로 취소. 분할/동시 전송/결과 매칭은 batch_place_orders 와 같고,
+        결과는 orderId(없으면 clientOid)로 입력과 짝짓는다.
+        """
+        path = "/api/v2/mix/order/batch-cancel-orders"
+        for spec in orders:
+            if not (spec.order_id or spec.client_oid):
+                raise ValueError("취소할 주문에는 order_id 또는 client_oid 가 필요합니다")
+        items = [
+            {
+                **({"orderId": spec.order_id} if spec.order_id else {}),
+                **({"clientOid": spec.client_oid} if spec.client_oid else {}),
+            }
+            for spec in orders
+        ]
+
+        async def send(symbol: str, chunk: Sequence[Tuple[CancelSpec, dict]]) -> List[BatchOrderResult]:
+            body = {
+                "symbol": symbol, "productType": product_type, "marginCoin": margin_coin,
+                "orderIdList": [item for _, item in chunk],
+            }
+            return await self._send_batch(path, body, [spec for spec, _ in chunk])
+
+        return await self._run_batches(list(zip(orders, items)), send)
+
+    @staticmethod
+    async def _run_batches(pairs: List[Tuple], send) -> List[BatchOrderResult]:
+        """(spec, item) 목록을 심볼별 청크로 나눠 동시에 보내고 결과를 입력 순서로 돌려준다."""
+        by_symbol: Dict[str, List[int]] = {}
+        for i, (spec, _) in enumerate(pairs):
+            by_symbol.setdefault(spec.symbol, []).append(i)
+        batches = [
+            chunk
+            for indexes in by_symbol.values()
+            for chunk in chunks(indexes, BATCH_ORDER_LIMIT)
+        ]
+        chunk_results = await asyncio.gather(*(
+            send(pairs[chunk[0]][0].symbol, [pairs[i] for i in chunk]) for chunk in batches
+        ))
+        results: List[Optional[BatchOrderResult]] = [None] * len(pairs)
+        for chunk, chunk_result in zip(batches, chunk_results):
+            for i, result in zip(chunk, chunk_result):
+                results[i] = result
+        return results
+
+    async def _send_batch(
+        self,
+        path: str,
+        body: dict,
+        specs: List[OrderSpec | CancelSpec],
+    ) -> List[BatchOrderResult]:
+        """청크 하나를 보내고 각 입력의 결과를 만든다. 요청이 실패하면 청크 전체를 실패로 표시."""
+        try:
+            res = await self.post(path, json_body=body)
+        except BitgetError as e:
+            return [_batch_failure(spec, e.original_code, e.msg) for spec in specs]
+        except Exception as e:
+            return [_batch_failure(spec, None, str(e)) for spec in specs]
+
+        data = res.get("data") or {}
+        by_order_id: Dict[str, Tuple[bool, dict]] = {}
+        by_client_oid: Dict[str, Tuple[bool, dict]] = {}
+        for success, key in ((True, "successList"), (False, "failureList")):
+            for item in data.get(key) or []:
+                if item.get("orderId"):
+                    by_order_id[item["orderId"]] = (success, item)
+                if item.get("clientOid"):
+                    by_client_oid[item["clientOid"]] = (success, item)
+
+        results = []
+        for spec in specs:
+            order_id = getattr(spec, "order_id", None)
+            found = (order_id and by_order_id.get(order_id)) or (spec.client_oid and by_client_oid.get(spec.client_oid))
+            if not found:
+                results.append(_batch_failure(spec, None, "no result in response"))
+                continue
+            success, item = found
+            results.append(BatchOrderResult(
+                spec,
+                success,
+                item.get("orderId") or order_id,
+                item.get("clientOid") or spec.client_oid,
+                None if success else item.get("errorCode"),
+                None if success else item.get("errorMsg"),
+            ))
+        return results
+
     async def cancel_all_orders(
         self,
         product_type: str = "USDT-FUTURES",
@@ -0,0 +1,26 @@
+import pytest
+
+from exchange.bitget.future.future_market_client import BitgetFutureMarketClient
+
+HOUR = 3_600_000
+
+
+@pytest.mark.asyncio
+async def test_iter_klines_walks_windows_oldest_first(monkeypatch):
+    windows = []
+
+    async def fake_get_klines(self, symbol, granularity, product_type, start_time, end_time, limit):
+        windows.append((start_time, end_time))
+        # newest first and one bar outside the window, both handled by the iterator
+        bars = [[str(ts), "1", "1", "1", "1", "1", "1"] for ts in range(start_time, end_time + 1, HOUR)]
+        return list(reversed(bars)) + [[str(end_time + 1), "1", "1", "1", "1", "1", "1"]]
+
+    monkeypatch.setattr(BitgetFutureMarketClient, "get_klines", fake_get_klines)
+    client = BitgetFutureMarketClient("https://api.example.com", "USDT-FUTURES")
+    try:
+        candles = [c async for c in client.iter_klines("BTCUSDT", "1H", start_time=0, end_time=5 * HOUR, limit=2)]
+    finally:
+        await client.close()
+
+    assert [int(c[0]) for c in candles] == [0, HOUR, 2 * HOUR, 3 * HOUR, 4 * HOUR, 5 * HOUR]
+    assert windows == [(0, 2 * HOUR - 1), (2 * HOUR, 4 * HOUR - 1), (4 * HOUR, 5 * HOUR)]
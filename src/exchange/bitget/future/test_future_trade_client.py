@@ -0,0 +1,170 @@
+import re
+from decimal import Decimal
+
+import pytest
+from aioresponses import aioresponses
+
+from exchange.bitget.dto.bitget_error import BitgetError
+from exchange.bitget.future.future_trade_client import (
+    BATCH_ORDER_LIMIT,
+    BitgetFutureTradeClient,
+    CancelSpec,
+    OrderSpec,
+)
+
+
+def make_client() -> BitgetFutureTradeClient:
+    return BitgetFutureTradeClient("https://api.example.com", "key", "secret", "pass")
+
+
+@pytest.mark.asyncio
+async def test_batch_place_orders_chunks_per_symbol_and_maps_results(monkeypatch):
+    bodies = []
+
+    async def fake_post(self, path, json_body=None):
+        assert path == "/api/v2/mix/order/batch-place-order"
+        bodies.append(json_body)
+        orders = json_body["orderList"]
+        # first order of every chunk is rejected
+        return {"code": "00000", "data": {
+            "successList": [{"orderId": f"id-{o['clientOid']}", "clientOid": o["clientOid"]} for o in orders[1:]],
+            "failureList": [{"orderId": "", "clientOid": orders[0]["clientOid"], "errorCode": "40762", "errorMsg": "balance"}],
+        }}
+
+    monkeypatch.setattr(BitgetFutureTradeClient, "post", fake_post)
+    specs = [
+        OrderSpec("BTCUSDT" if i % 2 else "ETHUSDT", Decimal("0.01"), "buy", price=Decimal(100 + i))
+        for i in range(BATCH_ORDER_LIMIT + 10)
+    ]
+    client = make_client()
+    try:
+        results = await client.batch_place_orders(specs)
+    finally:
+        await client.close()
+
+    # 30 ETH + 30 BTC orders -> one chunk each
+    assert sorted(len(b["orderList"]) for b in bodies) == [30, 30]
+    assert {b["symbol"] for b in bodies} == {"BTCUSDT", "ETHUSDT"}
+    assert all(o["clientOid"] and o["force"] == "gtc" for b in bodies for o in b["orderList"])
+
+    assert [r.spec.price for r in results] == [s.price for s in specs]
+    failed = [r for r in results if not r.success]
+    assert [r.spec.price for r in failed] == [Decimal(100), Decimal(101)]
+    assert failed[0].error_code == "40762" and failed[0].order_id is None
+    ok = next(r for r in results if r.success)
+    assert ok.order_id == f"id-{ok.client_oid}" and ok.error_code is None
+
+
+@pytest.mark.asyncio
+async def test_batch_place_orders_splits_at_batch_limit(monkeypatch):
+    sizes = []
+
+    async def fake_post(self, path, json_body=None):
+        sizes.append(len(json_body["orderList"]))
+        return {"data": {"successList": [{"orderId": "1", "clientOid": o["clientOid"]} for o in json_body["orderList"]]}}
+
+    monkeypatch.setattr(BitgetFutureTradeClient, "post", fake_post)
+    specs = [OrderSpec("BTCUSDT", Decimal(1), "sell", order_type="market") for _ in range(2 * BATCH_ORDER_LIMIT + 1)]
+    client = make_client()
+    try:
+        results = await client.batch_place_orders(specs)
+    finally:
+        await client.close()
+
+    assert sorted(sizes) == [1, BATCH_ORDER_LIMIT, BATCH_ORDER_LIMIT]
+    assert all(r.success for r in results)
+    assert len({r.client_oid for r in results}) == len(specs)
+
+
+@pytest.mark.asyncio
+async def test_batch_place_orders_validates_before_sending(monkeypatch):
+    async def fake_post(self, path, json_body=None):
+        raise AssertionError("should not be called")
+
+    monkeypatch.setattr(BitgetFutureTradeClient, "post", fake_post)
+    client = make_client()
+    try:
+        with pytest.raises(ValueError):
+            await client.batch_place_orders([
+                OrderSpec("BTCUSDT", Decimal(1), "buy", price=Decimal(1)),
+                OrderSpec("BTCUSDT", Decimal(1), "buy"),  # limit without price
+            ])
+        with pytest.raises(ValueError):
+            await client.batch_place_orders([
+                OrderSpec("BTCUSDT", Decimal(1), "buy", order_type="market", client_oid="a"),
+                OrderSpec("BTCUSDT", Decimal(1), "buy", order_type="market", client_oid="a"),
+            ])
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_cancel_orders_marks_failed_chunk(monkeypatch):
+    async def fake_post(self, path, json_body=None):
+        assert path == "/api/v2/mix/order/batch-cancel-orders"
+        if json_body["symbol"] == "ETHUSDT":
+            raise BitgetError({"code": "40015", "msg": "busy"}, status=500)
+        return {"data": {
+            "successList": [{"orderId": "1", "clientOid": "c1"}],
+            "failureList": [{"orderId": "2", "clientOid": "", "errorCode": "22001", "errorMsg": "no order"}],
+        }}
+
+    monkeypatch.setattr(BitgetFutureTradeClient, "post", fake_post)
+    client = make_client()
+    try:
+        results = await client.batch_cancel_orders([
+            CancelSpec("BTCUSDT", order_id="2"),
+            CancelSpec("ETHUSDT", order_id="9"),
+            CancelSpec("BTCUSDT", client_oid="c1"),
+            CancelSpec("BTCUSDT", order_id="3"),
+        ])
+        with pytest.raises(ValueError):
+            await client.batch_cancel_orders([CancelSpec("BTCUSDT")])
+    finally:
+        await client.close()
+
+    assert [(r.success, r.order_id, r.error_code) for r in results] == [
+        (False, "2", "22001"),
+        (False, "9", "40015"),
+        (True, "1", None),
+        (False, "3", None),
+    ]
+    assert results[3].error_msg == "no result in response"
+
+
+@pytest.mark.asyncio
+async def test_coalesce_is_forwarded_to_the_base_client():
+    client = BitgetFutureTradeClient("https://api.example.com", "key", "secret", "pass", coalesce=True)
+    try:
+        assert client._coalesce is True
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_place_order_retry_rejected_as_duplicate_returns_the_accepted_order(monkeypatch):
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr("exchange.bitget.client.bitget_client.asyncio.sleep", no_sleep)
+    base = "https://api.example.com"
+    with aioresponses() as mocked:
+        # the first attempt is accepted but its response is lost
+        mocked.post(f"{base}/api/v2/mix/order/place-order", status=502, body="bad gateway")
+        mocked.post(f"{base}/api/v2/mix/order/place-order", status=400, payload={"code": "40786", "msg": "Duplicate clientOid"})
+        mocked.get(
+            re.compile(re.escape(f"{base}/api/v2/mix/order/detail") + r"\?.*clientOid=oid-1"),
+            status=200,
+            payload={"code": "00000", "data": {"orderId": "123", "clientOid": "oid-1"}},
+            headers={"Content-Type": "application/json"},
+        )
+        client = make_client()
+        try:
+            res = await client.place_order(
+                symbol="BTCUSDT", product_type="USDT-FUTURES", size=Decimal(1), side="buy",
+                order_type="market", client_oid="oid-1",
+            )
+        finally:
+            await client.close()
+
+    assert res["data"] == {"orderId": "123", "clientOid": "oid-1"}
@@ -0,0 +1,238 @@
+import logging
+import math
+import struct
+import time
+from decimal import Decimal
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterator, List, Optional, Tuple, Union
+
+from exchange.bitget.dto.websocket import WsCandle
+from exchange.bitget.stream_manager import BitgetStreamManager
+from exchange.bitget.ticker_cache import Quote
+
+logger = logging.getLogger(__name__)
+
+# header: magic, capacity, record size, published record count (= next sequence number)
+_HEADER = struct.Struct("<QQQQ")
+HEADER_SIZE = 64
+_HEAD_OFFSET = 24
+_MAGIC = 0x4D414E474F425553  # "MANGOBUS"
+
+# record: seqlock tag, then the payload: kind, symbol, interval, exchange ts (ms), six float64 values
+# (candle: open, high, low, close, volume, quote volume; quote: bid, ask, last, mark or NaN, 0, 0)
+_TAG = struct.Struct("<Q")
+PAYLOAD = struct.Struct("<B23s8sq6d")
+RECORD_SIZE = _TAG.size + PAYLOAD.size  # 96
+_SYMBOL_SIZE = 23
+_INTERVAL_SIZE = 8
+
+KIND_CANDLE = 1
+KIND_QUOTE = 2
+
+BusRecord = Tuple[int, Union[WsCandle, Quote]]
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Map an existing segment without letting this process' resource tracker unlink it on exit."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no `track`
+        shm = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, "shared_memory")
+        return shm
+
+
+class SharedMarketBus:
+    """
+    Single-writer ring of fixed-size candle/quote records in POSIX shared memory.
+
+    Records get consecutive sequence numbers; record n lives in slot n % capacity. Each slot
+    starts with a seqlock tag (2n+1 while being written, 2n+2 once complete) so readers in
+    other processes can detect torn or overwritten slots without any lock. The header holds
+    the number of published records, which readers poll.
+
+    The ingest process owns the WebSocket connections and calls `attach()` so every candle
+    and quote dispatched by the stream manager is published; workers read it with
+    `MarketBusReader`.
+    """
+
+    def __init__(self, name: str, capacity: int = 65536):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=HEADER_SIZE + capacity * RECORD_SIZE)
+        self.name = self._shm.name
+        self._buf = self._shm.buf
+        _HEADER.pack_into(self._buf, 0, _MAGIC, capacity, RECORD_SIZE, 0)
+        self._seq = 0
+        self._names: dict[str, bytes] = {}
+        self._disposables = []
+
+    @property
+    def seq(self) -> int:
+        """Number of records published so far."""
+        return self._seq
+
+    def _encode(self, text: str, size: int) -> bytes:
+        encoded = self._names.get(text)
+        if encoded is None:
+            encoded = self._names[text] = text.encode()
+        if len(encoded) > size:
+            # struct would silently truncate it and readers would see another symbol
+            raise ValueError(f"{text!r} does not fit the {size}-byte bus field")
+        return encoded
+
+    def _publish(self, kind: int, symbol: str, interval: str, ts: int, values: Tuple[float, ...]) -> int:
+        seq = self._seq
+        buf = self._buf
+        offset = HEADER_SIZE + (seq % self.capacity) * RECORD_SIZE
+        symbol_raw = self._encode(symbol, _SYMBOL_SIZE)
+        interval_raw = self._encode(interval, _INTERVAL_SIZE)
+        _TAG.pack_into(buf, offset, 2 * seq + 1)
+        PAYLOAD.pack_into(buf, offset + _TAG.size, kind, symbol_raw, interval_raw, ts, *values)
+        _TAG.pack_into(buf, offset, 2 * seq + 2)
+        self._seq = seq + 1
+        _TAG.pack_into(buf, _HEAD_OFFSET, seq + 1)
+        return seq
+
+    def publish_candle(self, candle: WsCandle) -> int:
+        return self._publish(
+            KIND_CANDLE,
+            candle.symbol,
+            candle.interval,
+            candle.ts,
+            (candle.open, candle.high, candle.low, candle.close, candle.volume, candle.quote_volume),
+        )
+
+    def publish_quote(self, quote: Quote) -> int:
+        mark = math.nan if quote.mark is None else float(quote.mark)
+        return self._publish(
+            KIND_QUOTE, quote.symbol, "", quote.ts, (float(quote.bid), float(quote.ask), float(quote.last), mark, 0.0, 0.0)
+        )
+
+    def attach(self, stream_manager: BitgetStreamManager) -> None:
+        """Publish every candle and quote the stream manager emits, including channels registered later."""
+        for streams in stream_manager.candle_stream.values():
+            for subject in streams.values():
+                self._attach_candles(subject)
+        self._disposables.append(stream_manager.candle_stream_added.subscribe(self._attach_candles))
+        self._disposables.append(stream_manager.quote_stream.subscribe(self.publish_quote))
+
+    def _attach_candles(self, subject) -> None:
+        self._disposables.append(subject.subscribe(self.publish_candle))
+
+    def close(self, unlink: bool = True) -> None:
+        for disposable in self._disposables:
+            disposable.dispose()
+        self._disposables.clear()
+        self._buf = None
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+
+
+class MarketBusReader:
+    """
+    Reader side of a SharedMarketBus, for use from any process.
+
+    `views()` reads without copying: it yields each new record as a memoryview of its payload
+    in shared memory (layout `PAYLOAD`). `poll()` is the convenience on top of it that builds
+    `WsCandle`/`Quote` objects. A reader that falls more than `capacity` records behind skips
+    to the oldest record still in the ring and counts the skipped ones in `lost`.
+    Pass `start=None` to begin at the newest record.
+    """
+
+    def __init__(self, name: str, start: Optional[int] = 0):
+        self._shm = _attach(name)
+        self._buf = self._shm.buf
+        magic, capacity, record_size, head = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC or record_size != RECORD_SIZE:
+            self._shm.close()
+            raise ValueError(f"{name} is not a market bus segment")
+        self.capacity = capacity
+        self.next_seq = head if start is None else start
+        self.lost = 0
+        self._names: dict[bytes, str] = {}
+
+    def _decode(self, raw: bytes) -> str:
+        text = self._names.get(raw)
+        if text is None:
+            text = self._names[raw] = raw.rstrip(b"\0").decode()
+        return text
+
+    def _head(self) -> int:
+        return _TAG.unpack_from(self._buf, _HEAD_OFFSET)[0]
+
+    def _skip_to_oldest(self) -> None:
+        oldest = self._head() - self.capacity + 1
+        if oldest > self.next_seq:
+            self.lost += oldest - self.next_seq
+            self.next_seq = oldest
+
+    def consistent(self, seq: int) -> bool:
+        """Seqlock check: True while record `seq` is still intact in its slot."""
+        offset = HEADER_SIZE + (seq % self.capacity) * RECORD_SIZE
+        return _TAG.unpack_from(self._buf, offset)[0] == 2 * seq + 2
+
+    def views(self, max_records: Optional[int] = None) -> Iterator[Tuple[int, memoryview]]:
+        """
+        Yield (sequence, payload) for the records published since the previous read, where
+        payload is a memoryview straight onto the slot (unpack with `PAYLOAD.unpack_from`).
+        The writer may overwrite the slot at any time: read the fields you need, then confirm
+        with `consistent(seq)` before using them. The view is released when the iterator
+        advances, and a record lapped while it was held is counted in `lost`.
+        """
+        buf = self._buf
+        head = self._head()
+        if head - self.next_seq > self.capacity:
+            self._skip_to_oldest()
+        count = 0
+        while self.next_seq < head and (max_records is None or count < max_records):
+            seq = self.next_seq
+            offset = HEADER_SIZE + (seq % self.capacity) * RECORD_SIZE
+            done = 2 * seq + 2
+            tag = _TAG.unpack_from(buf, offset)[0]
+            if tag != done:
+                if tag > done:
+                    # the writer lapped us while we were reading
+                    self._skip_to_oldest()
+                    continue
+                break
+            self.next_seq = seq + 1
+            count += 1
+            view = buf[offset + _TAG.size:offset + RECORD_SIZE]
+            try:
+                yield seq, view
+            finally:
+                view.release()
+            if not self.consistent(seq):
+                self.lost += 1
+                self._skip_to_oldest()
+
+    def poll(self, max_records: Optional[int] = None) -> List[BusRecord]:
+        """Decode the new records into `WsCandle`/`Quote` objects (copies; see `views()` for zero-copy)."""
+        records = []
+        received_at = time.monotonic()
+        for seq, payload in self.views(max_records):
+            kind, symbol, interval, ts, *values = PAYLOAD.unpack_from(payload)
+            if self.consistent(seq):
+                records.append((seq, self._record(kind, symbol, interval, ts, values, received_at)))
+        return records
+
+    def _record(self, kind: int, symbol: bytes, interval: bytes, ts: int, values: list, received_at: float):
+        if kind == KIND_CANDLE:
+            return WsCandle(self._decode(symbol), self._decode(interval), ts, *values)
+        bid, ask, last, mark, _, _ = values
+        return Quote(
+            self._decode(symbol),
+            Decimal(repr(bid)),
+            Decimal(repr(ask)),
+            Decimal(repr(last)),
+            None if math.isnan(mark) else Decimal(repr(mark)),
+            ts,
+            received_at,
+        )
+
+    def close(self) -> None:
+        self._buf = None
+        self._shm.close()
@@ -0,0 +1,145 @@
+import bisect
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+CHECKSUM_DEPTH = 25
+
+# [price, size] as pushed by the exchange, e.g. ["27000.5", "8.760"]
+Level = List[str]
+
+
+class _BookSide:
+    """
+    One side of the book. Prices are kept sorted so that the best level is always at the end
+    of `_prices` (ascending for bids, descending for asks): best is O(1), insert/remove O(log n)
+    search plus a memmove.
+    """
+
+    def __init__(self, is_bid: bool):
+        self._is_bid = is_bid
+        self._prices: List[float] = []  # bids: ascending / asks: negated ascending
+        self._levels: Dict[float, Tuple[str, str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def _sort_key(self, price: float) -> float:
+        return price if self._is_bid else -price
+
+    def clear(self) -> None:
+        self._prices.clear()
+        self._levels.clear()
+
+    def apply(self, levels: List[Level]) -> None:
+        for price_str, size_str, *_ in levels:
+            price = float(price_str)
+            key = self._sort_key(price)
+            if float(size_str) == 0:
+                if self._levels.pop(price, None) is not None:
+                    del self._prices[bisect.bisect_left(self._prices, key)]
+                continue
+            if price not in self._levels:
+                bisect.insort(self._prices, key)
+            self._levels[price] = (price_str, size_str)
+
+    def best(self) -> Optional[Tuple[float, float]]:
+        if not self._prices:
+            return None
+        price = self._sort_key(self._prices[-1])
+        return price, float(self._levels[price][1])
+
+    def top(self, n: int) -> List[Tuple[str, str]]:
+        """Raw (price, size) strings of the best n levels, best first."""
+        sort_key = self._sort_key
+        levels = self._levels
+        return [levels[sort_key(key)] for key in reversed(self._prices[-n:])] if n > 0 else []
+
+    def depth(self, n: int) -> List[Tuple[float, float]]:
+        return [(float(p), float(s)) for p, s in self.top(n)]
+
+
+class OrderBook:
+    """
+    Local order book for one symbol fed by the `books`/`books5`/`books15` channels.
+
+    Snapshots replace both sides, updates apply per-level deltas (size 0 removes the level).
+    `verify()` checks the exchange CRC32 over the top 25 levels; after a mismatch the book
+    is invalid and ignores updates until the next snapshot.
+    """
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.bids = _BookSide(is_bid=True)
+        self.asks = _BookSide(is_bid=False)
+        self.ts: Optional[int] = None
+        self.seq: Optional[int] = None
+        self.valid = False
+
+    def apply_snapshot(self, entry: dict) -> None:
+        self.bids.clear()
+        self.asks.clear()
+        self.valid = True
+        self._apply(entry)
+
+    def apply_update(self, entry: dict) -> bool:
+        if not self.valid:
+            return False
+        self._apply(entry)
+        return True
+
+    def _apply(self, entry: dict) -> None:
+        self.bids.apply(entry.get("bids", ()))
+        self.asks.apply(entry.get("asks", ()))
+        if entry.get("ts") is not None:
+            self.ts = int(entry["ts"])
+        if entry.get("seq") is not None:
+            self.seq = int(entry["seq"])
+
+    def invalidate(self) -> None:
+        self.valid = False
+        self.bids.clear()
+        self.asks.clear()
+
+    def checksum(self) -> int:
+        """Signed CRC32 of "bid1:size1:ask1:size1:..." over the top 25 levels, as Bitget computes it."""
+        bids = self.bids.top(CHECKSUM_DEPTH)
+        asks = self.asks.top(CHECKSUM_DEPTH)
+        parts = []
+        for i in range(max(len(bids), len(asks))):
+            if i < len(bids):
+                parts.extend(bids[i])
+            if i < len(asks):
+                parts.extend(asks[i])
+        value = zlib.crc32(":".join(parts).encode())
+        return value - (1 << 32) if value >= (1 << 31) else value
+
+    def verify(self, checksum: int) -> bool:
+        return self.checksum() == int(checksum)
+
+    def best_bid(self) -> Optional[Tuple[float, float]]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Tuple[float, float]]:
+        return self.asks.best()
+
+    def mid(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def depth(self, n: int = 5) -> Dict[str, List[Tuple[float, float]]]:
+        return {"bids": self.bids.depth(n), "asks": self.asks.depth(n)}
+
+    def price_for_size(self, side: str, size: float) -> Optional[float]:
+        """
+        Worst price reached when taking `size` from the book:
+        side="buy" walks the asks, side="sell" walks the bids. None if the book is too thin.
+        """
+        book_side = self.asks if side == "buy" else self.bids
+        remaining = size
+        for price, level_size in book_side.depth(len(book_side)):
+            remaining -= level_size
+            if remaining <= 0:
+                return price
+        return None
@@ -0,0 +1,106 @@
+import asyncio
+import time
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from exchange.bitget.dto.websocket import ACCOUNT_CHANNEL
+
+ORDERS_CHANNEL = "orders"
+POSITIONS_CHANNEL = "positions"
+PRIVATE_CHANNELS = (ORDERS_CHANNEL, POSITIONS_CHANNEL, ACCOUNT_CHANNEL)
+
+# orders in these states never come back, so they leave the open order book
+TERMINAL_ORDER_STATUSES = frozenset({"filled", "canceled", "cancelled"})
+
+
+class BitgetPrivateState:
+    """
+    In-memory snapshot of the private `orders` / `positions` / `account` channels.
+
+    Each channel counts as ready once its first push arrived; `fresh()` tells callers whether
+    they can read from here or should fall back to REST. Entries keep the exchange field names,
+    plus the REST names (`symbol`, `accountEquity`) so callers can treat both sources alike.
+    """
+
+    def __init__(self):
+        self.orders: Dict[str, dict] = {}
+        # (symbol, holdSide)
+        self.positions: Dict[Tuple[str, str], dict] = {}
+        # marginCoin
+        self.accounts: Dict[str, dict] = {}
+        self._updated_at: Dict[str, float] = {}
+        self._ready = {channel: asyncio.Event() for channel in PRIVATE_CHANNELS}
+
+    def handler(self, channel: str):
+        return {
+            ORDERS_CHANNEL: self.on_orders,
+            POSITIONS_CHANNEL: self.on_positions,
+            ACCOUNT_CHANNEL: self.on_account,
+        }[channel]
+
+    def _touch(self, channel: str) -> None:
+        self._updated_at[channel] = time.monotonic()
+        self._ready[channel].set()
+
+    def on_orders(self, action: str, data: list) -> None:
+        if action == "snapshot":
+            self.orders.clear()
+        for item in data:
+            order = {**item, "symbol": item.get("instId")}
+            if order.get("status") in TERMINAL_ORDER_STATUSES:
+                self.orders.pop(order["orderId"], None)
+            else:
+                self.orders[order["orderId"]] = order
+        self._touch(ORDERS_CHANNEL)
+
+    def on_positions(self, action: str, data: list) -> None:
+        if action == "snapshot":
+            self.positions.clear()
+        for item in data:
+            position = {**item, "symbol": item.get("instId")}
+            key = (position["symbol"], position.get("holdSide"))
+            if Decimal(position.get("total") or "0") == 0:
+                self.positions.pop(key, None)
+            else:
+                self.positions[key] = position
+        self._touch(POSITIONS_CHANNEL)
+
+    def on_account(self, action: str, data: list) -> None:
+        for item in data:
+            # the push calls it `equity`, the REST accounts endpoint `accountEquity`
+            self.accounts[item["marginCoin"]] = {"accountEquity": item.get("equity"), **item}
+        self._touch(ACCOUNT_CHANNEL)
+
+    def reset(self) -> None:
+        """Forget everything, e.g. after a disconnect; the resubscribe snapshots rebuild it."""
+        self.orders.clear()
+        self.positions.clear()
+        self.accounts.clear()
+        self._updated_at.clear()
+        for event in self._ready.values():
+            event.clear()
+
+    def fresh(self, channel: str, max_age: Optional[float] = None) -> bool:
+        updated_at = self._updated_at.get(channel)
+        if updated_at is None:
+            return False
+        return max_age is None or time.monotonic() - updated_at <= max_age
+
+    async def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every channel received its first push; False on timeout."""
+        try:
+            async with asyncio.timeout(timeout):
+                for event in self._ready.values():
+                    await event.wait()
+            return True
+        except TimeoutError:
+            return False
+
+    def open_orders(self, symbol: Optional[str] = None) -> List[dict]:
+        return [o for o in self.orders.values() if symbol is None or o["symbol"] == symbol]
+
+    def get_positions(self, symbol: str) -> List[dict]:
+        return [p for (sym, _), p in self.positions.items() if sym == symbol]
+
+    def get_account(self, margin_coin: str = "USDT") -> Optional[dict]:
+        return self.accounts.get(margin_coin)
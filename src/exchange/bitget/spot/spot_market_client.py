@@ -1,15 +1,23 @@
 from aiohttp import TCPConnector
+from exchange.bitget.client.rate_limiter import BitgetRateLimiter
 from exchange.bitget.typing import Granularity
 from shared.http import TracingClientSession
 
 class BitgetSpotMarketClient:
 
-    def __init__(self, base_url: str = "https://api.bitget.com"):
+    def __init__(
+        self,
+        base_url: str = "https://api.bitget.com",
+        connector: TCPConnector | None = None,
+        rate_limiter: BitgetRateLimiter | None = None,
+    ):
         self._client = TracingClientSession(
             base_url=base_url,
             headers={"Content-Type": "application/json"},
-            connector=TCPConnector(ssl=False)
+            connector=connector or TCPConnector(ssl=False),
+            connector_owner=connector is None,
         )
+        self._rate_limiter = rate_limiter
 
     async def get_candlesticks(self, symbol: str, granularity: Granularity = "1day", start_time: int = None, end_time: int = None, limit: int = 1000) -> dict:
         """
@@ -29,6 +37,8 @@ class BitgetSpotMarketClient:
             "limit": limit
         }
 
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire("/api/v2/spot/market/candles")
         async with self._client.get("/api/v2/spot/market/candles", params=params) as resp:
             resp.raise_for_status()
             return await resp.json()
@@ -1,6 +1,10 @@
 from datetime import datetime
-from typing import Optional
+from typing import AsyncIterator, Optional
 
+from aiohttp import TCPConnector
+
+from exchange.bitget.client.pagination import Page, id_watermark, paginate
+from exchange.bitget.client.rate_limiter import BitgetRateLimiter
 from exchange.bitget.client.signature_client import SignatureClient
 
 
@@ -12,8 +16,11 @@ class BitgetSpotTradeClient(SignatureClient):
             access_key: str,
             secret_key: str,
             passphrase: str,
+            connector: TCPConnector | None = None,
+            rate_limiter: BitgetRateLimiter | None = None,
+            coalesce: bool = False,
     ):
-        super().__init__(base_url, access_key, secret_key, passphrase)
+        super().__init__(base_url, access_key, secret_key, passphrase, connector, rate_limiter, coalesce=coalesce)
 
 
     async def get_history_orders(
@@ -45,4 +52,30 @@ class BitgetSpotTradeClient(SignatureClient):
             "receiveWindow": receive_window
         }
 
-        return await self.get(path, params=params)
\ No newline at end of file
+        return await self.get(path, params=params)
+
+    def iter_history_orders(
+        self,
+        symbol: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        until_id: Optional[str] = None,
+        limit: int = 100,
+    ) -> AsyncIterator[dict]:
+        """
+        Iterate historical spot orders newest first, paging with `idLessThan` set to the last
+        orderId of the previous page (prefetched while the caller processes the current one).
+        Stops before the first order whose orderId <= `until_id`.
+        """
+        async def fetch(cursor: Optional[str]) -> Page[dict]:
+            res = await self.get_history_orders(
+                symbol=symbol,
+                start_time=start_time,
+                end_time=end_time,
+                id_less_than=cursor,
+                limit=limit,
+            )
+            orders = res.get("data") or []
+            return Page(orders, orders[-1]["orderId"] if len(orders) >= limit else None)
+
+        return paginate(fetch, stop=id_watermark("orderId", until_id))
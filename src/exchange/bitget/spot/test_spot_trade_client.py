@@ -46,4 +46,24 @@ async def test_get_history_orders_returns_example_payload():
         ) as client:
             resp = await client.get_history_orders(symbol="ETHUSDT")
 
-    assert resp == payload
\ No newline at end of file
+    assert resp == payload
+
+@pytest.mark.asyncio
+async def test_iter_history_orders_pages_with_id_less_than(monkeypatch):
+    calls = []
+
+    async def fake_get_history_orders(self, symbol, start_time=None, end_time=None, id_less_than=None, limit=100, **kwargs):
+        calls.append(id_less_than)
+        pages = {None: ["30", "29"], "29": ["28", "27"], "27": ["26"]}
+        return {"code": "00000", "data": [{"orderId": oid} for oid in pages[id_less_than]]}
+
+    monkeypatch.setattr(BitgetSpotTradeClient, "get_history_orders", fake_get_history_orders)
+    async with BitgetSpotTradeClient(base_url=BASE_URL, access_key="ak", secret_key="sk", passphrase="pp") as client:
+        ids = [o["orderId"] async for o in client.iter_history_orders("ETHUSDT", limit=2)]
+        assert ids == ["30", "29", "28", "27", "26"]
+        assert calls == [None, "29", "27"]
+
+        calls.clear()
+        ids = [o["orderId"] async for o in client.iter_history_orders("ETHUSDT", until_id="28", limit=2)]
+        assert ids == ["30", "29"]
+        assert calls == [None, "29"]
@@ -1,17 +1,59 @@
 import logging
 
 from collections import defaultdict
-from typing import Any
+from typing import Any, Awaitable, Callable, Hashable, Optional
 from reactivex import Subject
-from exchange.bitget.dto.websocket import SubscribeReq
+from exchange.bitget.bar_aggregator import BarAggregator, create_aggregator
+from exchange.bitget.candle_store import CandleStore
+from exchange.bitget.dto.websocket import SubscribeReq, WsCandle, WsTrade
+from exchange.bitget.fanout import OverflowPolicy, QueueSubscriber
+from exchange.bitget.order_book import OrderBook
+from exchange.bitget.ticker_cache import Quote, TickerCache
+
+CANDLE_CHANNEL_PREFIX = "candle"
+BOOK_CHANNELS = ("books", "books1", "books5", "books15")
+# only the incremental channel carries a CRC32; books1/5/15 are full snapshots sent with "checksum": 0
+CHECKSUM_BOOK_CHANNEL = "books"
+TRADE_CHANNEL = "trade"
+TICKER_CHANNEL = "ticker"
+
+# (action, data) -> None
+PushHandler = Callable[[str, list], None]
 
 
 class BitgetStreamManager:
     # symbol, interval
-    candle_stream: dict[str, dict[str, Subject]] = defaultdict(dict)
+    candle_stream: dict[str, dict[str, Subject]]
+    # symbol
+    book_stream: dict[str, Subject]
+    # symbol
+    trade_stream: dict[str, Subject]
+    # symbol, bar kind (e.g. "time:7m", "volume:50")
+    bar_stream: dict[str, dict[str, Subject]]
     logger = logging.getLogger(__name__)
 
-    def __init__(self, strategies: dict[str, Any]):
+    def __init__(
+        self,
+        strategies: dict[str, Any],
+        candle_capacity: int = 1000,
+        ticker_cache: TickerCache | None = None,
+    ):
+        self.candle_stream = defaultdict(dict)
+        self.candle_store = CandleStore(candle_capacity)
+        self.book_stream = {}
+        self.order_books: dict[str, OrderBook] = {}
+        # emits the SubscribeReq of a channel whose local state must be rebuilt from a fresh snapshot
+        self.resync_stream = Subject()
+        self.trade_stream = {}
+        self.bar_stream = defaultdict(dict)
+        self._aggregators: dict[str, list[BarAggregator]] = defaultdict(list)
+        self.ticker_cache = ticker_cache or TickerCache()
+        # every quote from the `ticker` channel, all symbols
+        self.quote_stream = Subject()
+        # emits each candle Subject when its channel is first registered, for consumers of all candles
+        self.candle_stream_added = Subject()
+        self.subscribers: list[QueueSubscriber] = []
+        self._blocking: list[QueueSubscriber] = []
         self.channels = [
             SubscribeReq(
                 inst_type=strat["product_type"],
@@ -21,4 +63,192 @@ class BitgetStreamManager:
             for strat in strategies.values()
             for interval in strat["intervals"]
             for symbol in strat["universe"]
-        ]
\ No newline at end of file
+        ]
+        self.channels += [
+            SubscribeReq(inst_type=strat["product_type"], channel=strat["books"], inst_id=symbol)
+            for strat in strategies.values()
+            if strat.get("books")
+            for symbol in strat["universe"]
+        ]
+        for strat in strategies.values():
+            for spec in strat.get("bars") or ():
+                for symbol in strat["universe"]:
+                    self.add_bar_aggregator(create_aggregator(symbol, spec))
+                    trade = SubscribeReq(strat["product_type"], TRADE_CHANNEL, symbol)
+                    if trade not in self.channels:
+                        self.channels.append(trade)
+        self.channels += [
+            SubscribeReq(inst_type=strat["product_type"], channel=TICKER_CHANNEL, inst_id=symbol)
+            for strat in strategies.values()
+            if strat.get("ticker")
+            for symbol in strat["universe"]
+        ]
+        # (instType, channel, instId) -> handler, built once so dispatch is a single dict lookup
+        self._routes: dict[tuple[str, str, str], PushHandler] = {}
+        for ch in self.channels:
+            self.register(ch)
+
+    def register(self, req: SubscribeReq, handler: Optional[PushHandler] = None) -> None:
+        """Create the target stream for a channel and its push route (idempotent)."""
+        if req.key in self._routes:
+            return
+        if handler is not None:
+            self._routes[req.key] = handler
+        elif req.channel.startswith(CANDLE_CHANNEL_PREFIX):
+            self._routes[req.key] = self._candle_handler(req)
+        elif req.channel in BOOK_CHANNELS:
+            self._routes[req.key] = self._book_handler(req)
+        elif req.channel == TRADE_CHANNEL:
+            self._routes[req.key] = self._trade_handler(req)
+        elif req.channel == TICKER_CHANNEL:
+            self._routes[req.key] = self._ticker_handler(req)
+        else:
+            self.logger.warning(f"No stream for channel {req.channel}, pushes will be dropped")
+
+    def _candle_handler(self, req: SubscribeReq) -> PushHandler:
+        symbol = req.inst_id
+        interval = req.channel[len(CANDLE_CHANNEL_PREFIX):]
+        subject = self.candle_stream[symbol].get(interval)
+        if subject is None:
+            subject = self.candle_stream[symbol][interval] = Subject()
+            self.candle_stream_added.on_next(subject)
+        buffer = self.candle_store.buffer(symbol, interval)
+        from_row = WsCandle.from_row
+
+        def handle(action: str, data: list) -> None:
+            candles = [from_row(symbol, interval, row) for row in data]
+            # subscribers only move forward: bars older than the last one emitted (snapshot
+            # replays after a resubscribe, stale backfill rows) are stored but not re-emitted
+            last_ts = buffer.last_ts
+            if action == "snapshot":
+                buffer.apply_snapshot(candles)
+            else:
+                buffer.apply_update(candles)
+            for candle in candles:
+                if last_ts is None or candle.ts >= last_ts:
+                    last_ts = candle.ts
+                    subject.on_next(candle)
+
+        return handle
+
+    def _book_handler(self, req: SubscribeReq) -> PushHandler:
+        symbol = req.inst_id
+        book = self.order_books.setdefault(symbol, OrderBook(symbol))
+        subject = self.book_stream.setdefault(symbol, Subject())
+        verify = req.channel == CHECKSUM_BOOK_CHANNEL
+
+        def handle(action: str, data: list) -> None:
+            for entry in data:
+                if action == "snapshot":
+                    book.apply_snapshot(entry)
+                elif not book.apply_update(entry):
+                    continue
+                checksum = entry.get("checksum") if verify else None
+                if checksum is not None and not book.verify(checksum):
+                    self.logger.warning(f"Order book checksum mismatch for {symbol}, resyncing {req.channel}")
+                    book.invalidate()
+                    self.resync_stream.on_next(req)
+                    return
+                subject.on_next(book)
+
+        return handle
+
+    def add_bar_aggregator(self, aggregator: BarAggregator) -> Subject:
+        """Attach a bar aggregator to a symbol's trade tape; returns its bar stream."""
+        streams = self.bar_stream[aggregator.symbol]
+        if aggregator.kind not in streams:
+            streams[aggregator.kind] = Subject()
+            self._aggregators[aggregator.symbol].append(aggregator)
+        return streams[aggregator.kind]
+
+    def _trade_handler(self, req: SubscribeReq) -> PushHandler:
+        symbol = req.inst_id
+        subject = self.trade_stream.setdefault(symbol, Subject())
+        aggregators = self._aggregators[symbol]
+        bar_streams = self.bar_stream[symbol]
+        from_item = WsTrade.from_item
+        # the snapshot sent on (re)subscribe repeats recent trades: skip what was already seen
+        last = {"ts": 0, "ids": set()}
+
+        def handle(action: str, data: list) -> None:
+            trades = sorted((from_item(symbol, item) for item in data), key=lambda t: t.ts)
+            for trade in trades:
+                if trade.ts < last["ts"] or (trade.ts == last["ts"] and trade.trade_id in last["ids"]):
+                    continue
+                if trade.ts > last["ts"]:
+                    last["ts"] = trade.ts
+                    last["ids"] = set()
+                last["ids"].add(trade.trade_id)
+                subject.on_next(trade)
+                for aggregator in aggregators:
+                    for bar in aggregator.add(trade):
+                        bar_streams[aggregator.kind].on_next(bar)
+
+        return handle
+
+    def _ticker_handler(self, req: SubscribeReq) -> PushHandler:
+        update = self.ticker_cache.update
+        from_ticker = Quote.from_ticker
+        subject = self.quote_stream
+
+        def handle(action: str, data: list) -> None:
+            for item in data:
+                quote = from_ticker(item)
+                update(quote)
+                subject.on_next(quote)
+
+        return handle
+
+    def subscribe(
+        self,
+        stream: Subject,
+        handler: Callable[[Any], Awaitable[None]],
+        name: str,
+        policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        maxsize: int = 1000,
+        key: Optional[Callable[[Any], Hashable]] = None,
+    ) -> QueueSubscriber:
+        """
+        Consume a stream through its own bounded queue and task, so a slow handler never
+        holds up dispatch for other symbols. Must be called from a running event loop.
+        """
+        subscriber = QueueSubscriber(name, handler, maxsize=maxsize, policy=policy, key=key)
+        subscriber.disposable = stream.subscribe(subscriber.offer)
+        subscriber.start()
+        self.subscribers.append(subscriber)
+        if policy is OverflowPolicy.BLOCK:
+            self._blocking.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: QueueSubscriber) -> None:
+        subscriber.stop()
+        self.subscribers.remove(subscriber)
+        if subscriber in self._blocking:
+            self._blocking.remove(subscriber)
+
+    def drop_counts(self) -> dict[str, int]:
+        return {subscriber.name: subscriber.dropped for subscriber in self.subscribers}
+
+    @property
+    def backpressured(self) -> bool:
+        """True while a BLOCK subscriber is full; the receiver should await wait_writable()."""
+        return any(subscriber.full for subscriber in self._blocking) if self._blocking else False
+
+    async def wait_writable(self) -> None:
+        for subscriber in self._blocking:
+            await subscriber.wait_space()
+
+    def dispatch(self, msg: dict) -> bool:
+        """
+        Route a decoded push frame `{"arg": {...}, "action": ..., "data": [...]}` to its stream.
+        Returns False when the frame is not a data push (events, unknown channels).
+        """
+        data = msg.get("data")
+        arg = msg.get("arg")
+        if data is None or arg is None:
+            return False
+        handler = self._routes.get((arg["instType"], arg["channel"], arg.get("instId") or arg.get("coin")))
+        if handler is None:
+            return False
+        handler(msg.get("action", "update"), data)
+        return True
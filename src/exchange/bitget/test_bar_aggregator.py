@@ -0,0 +1,80 @@
+import pytest
+
+from exchange.bitget.bar_aggregator import (
+    DollarBarAggregator,
+    ThresholdBarAggregator,
+    TimeBarAggregator,
+    VolumeBarAggregator,
+    create_aggregator,
+)
+from exchange.bitget.dto.websocket import WsTrade
+
+MINUTE = 60_000
+
+
+def _trade(ts: int, price: float, size: float, trade_id: str = "1") -> WsTrade:
+    return WsTrade("BTCUSDT", ts, price, size, "buy", trade_id)
+
+
+def test_time_bars_close_on_first_trade_of_next_interval():
+    agg = TimeBarAggregator("BTCUSDT", "7m")
+    assert agg.add(_trade(0, 100, 1)) == []
+    assert agg.add(_trade(MINUTE, 105, 2)) == []
+    assert agg.add(_trade(2 * MINUTE, 95, 1)) == []
+
+    (bar,) = agg.add(_trade(7 * MINUTE + 1, 101, 1))
+
+    assert bar.kind == "time:7m"
+    assert (bar.start_ts, bar.end_ts) == (0, 7 * MINUTE - 1)
+    assert (bar.open, bar.high, bar.low, bar.close) == (100, 105, 95, 95)
+    assert bar.volume == 4 and bar.trades == 3
+    assert bar.notional == pytest.approx(100 + 210 + 95)
+
+
+def test_time_bars_skip_empty_intervals():
+    agg = TimeBarAggregator("BTCUSDT", "1m")
+    agg.add(_trade(0, 100, 1))
+    (bar,) = agg.add(_trade(5 * MINUTE, 100, 1))
+    assert bar.start_ts == 0
+
+
+def test_volume_bars_close_when_threshold_reached():
+    agg = VolumeBarAggregator("BTCUSDT", 3)
+    assert agg.add(_trade(1, 100, 1)) == []
+    (bar,) = agg.add(_trade(2, 101, 2.5))
+    assert bar.kind == "volume:3"
+    assert bar.volume == 3.5 and (bar.start_ts, bar.end_ts) == (1, 2)
+    # next bar starts fresh
+    assert agg.add(_trade(3, 102, 1)) == []
+
+
+def test_dollar_bars_close_on_notional():
+    agg = DollarBarAggregator("BTCUSDT", 1000)
+    assert agg.add(_trade(1, 100, 5)) == []
+    (bar,) = agg.add(_trade(2, 100, 5))
+    assert bar.kind == "dollar:1000" and bar.notional == 1000
+
+
+@pytest.mark.parametrize(
+    "spec, cls",
+    [
+        ({"type": "time", "size": "90s"}, TimeBarAggregator),
+        ({"type": "volume", "size": 50}, VolumeBarAggregator),
+        ({"type": "dollar", "size": 1_000_000}, DollarBarAggregator),
+    ],
+)
+def test_create_aggregator_from_config(spec, cls):
+    assert isinstance(create_aggregator("BTCUSDT", spec), cls)
+
+
+def test_create_aggregator_rejects_unknown_type():
+    with pytest.raises(ValueError):
+        create_aggregator("BTCUSDT", {"type": "tick", "size": 10})
+
+
+def test_threshold_aggregator_without_measure_cannot_be_built():
+    class TickBarAggregator(ThresholdBarAggregator):
+        pass
+
+    with pytest.raises(TypeError):
+        TickBarAggregator("BTCUSDT", "tick:10", 10)
@@ -0,0 +1,153 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from exchange.bitget.candle_backfill import (
+    HISTORY_CANDLES_LIMIT,
+    BackfillError,
+    CandleBackfiller,
+    fetch_candles,
+    split_windows,
+)
+from exchange.bitget.stream_manager import BitgetStreamManager
+
+MINUTE = 60_000
+
+
+class FakeMarketClient:
+    def __init__(self, fail: bool = False):
+        self.calls: list[tuple] = []
+        self._fail = fail
+
+    async def get_klines(self, symbol, granularity, product_type, start_time, end_time, limit):
+        self.calls.append((symbol, granularity, start_time, end_time))
+        if self._fail:
+            raise RuntimeError("boom")
+        first = start_time - start_time % MINUTE
+        # repeat the bar at the window start to check de-duplication
+        return [[str(ts), "1", "1", "1", "1", "1", "1"] for ts in range(first, end_time + 1, MINUTE)]
+
+
+def _manager() -> BitgetStreamManager:
+    return BitgetStreamManager({
+        "squirrel": {"product_type": "USDT-FUTURES", "intervals": ["1m"], "universe": ["BTCUSDT", "ETHUSDT"]}
+    })
+
+
+def _seed(manager: BitgetStreamManager, symbol: str, last_ts: int):
+    manager.dispatch({
+        "action": "snapshot",
+        "arg": {"instType": "USDT-FUTURES", "channel": "candle1m", "instId": symbol},
+        "data": [[str(last_ts), "1", "1", "1", "1", "1", "1", "1"]],
+    })
+
+
+@pytest.mark.asyncio
+async def test_fill_fetches_gap_in_pages_and_emits_in_order():
+    manager = _manager()
+    now = int(time.time() * 1000)
+    last_ts = now - now % MINUTE - (HISTORY_CANDLES_LIMIT + 10) * MINUTE
+    _seed(manager, "BTCUSDT", last_ts)
+    received = []
+    manager.candle_stream["BTCUSDT"]["1m"].subscribe(received.append)
+    client = FakeMarketClient()
+
+    dispatched = await CandleBackfiller(manager, lambda: client).fill(manager.channels)
+
+    # ETHUSDT has no history yet, so only BTCUSDT is backfilled, in two pages
+    assert {call[0] for call in client.calls} == {"BTCUSDT"}
+    assert len(client.calls) == 2
+    ts = [c.ts for c in received]
+    assert ts == sorted(set(ts))
+    assert ts[0] == last_ts
+    assert dispatched == len(ts) == HISTORY_CANDLES_LIMIT + 11
+    assert manager.candle_store.get("BTCUSDT", "1m").last_ts == ts[-1]
+
+
+@pytest.mark.asyncio
+async def test_fill_shares_one_concurrency_budget_across_channels():
+    class SlowMarketClient(FakeMarketClient):
+        in_flight = peak = 0
+
+        async def get_klines(self, *args):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return await super().get_klines(*args)
+
+    manager = _manager()
+    now = int(time.time() * 1000)
+    for symbol in ("BTCUSDT", "ETHUSDT"):
+        _seed(manager, symbol, now - now % MINUTE - (HISTORY_CANDLES_LIMIT + 10) * MINUTE)
+    client = SlowMarketClient()
+
+    await CandleBackfiller(manager, lambda: client, max_concurrency=3).fill(manager.channels)
+
+    assert len(client.calls) == 4
+    assert client.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_fill_raises_and_keeps_the_gap_for_a_retry():
+    manager = _manager()
+    now = int(time.time() * 1000)
+    gap_start = now - now % MINUTE - 5 * MINUTE
+    _seed(manager, "BTCUSDT", gap_start)
+    client = FakeMarketClient(fail=True)
+    backfiller = CandleBackfiller(manager, lambda: client)
+
+    with pytest.raises(BackfillError) as exc_info:
+        await backfiller.fill(manager.channels)
+    btc = next(ch for ch in manager.channels if ch.inst_id == "BTCUSDT")
+    assert exc_info.value.channels == [btc]
+    assert backfiller.pending == {btc}
+
+    # live pushes resume past the gap before the retry succeeds
+    _seed(manager, "BTCUSDT", now - now % MINUTE)
+    client._fail = False
+    client.calls.clear()
+    dispatched = await backfiller.fill(manager.channels)
+
+    assert client.calls[0][2] == gap_start
+    assert backfiller.pending == set()
+    buffer = manager.candle_store.get("BTCUSDT", "1m")
+    assert list(buffer.column("ts")) == list(range(gap_start, now - now % MINUTE + 1, MINUTE))
+    assert dispatched == len(buffer)
+
+
+def test_split_windows_covers_range_without_overlap():
+    windows = split_windows(0, 450 * MINUTE, MINUTE)
+    assert windows == [(0, 200 * MINUTE - 1), (200 * MINUTE, 400 * MINUTE - 1), (400 * MINUTE, 450 * MINUTE - 1)]
+    assert split_windows(5, 5, MINUTE) == []
+
+
+@pytest.mark.asyncio
+async def test_fetch_candles_downloads_windows_concurrently_in_order():
+    class SlowMarketClient(FakeMarketClient):
+        def __init__(self):
+            super().__init__()
+            self.in_flight = self.peak = 0
+
+        async def get_klines(self, *args):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            rows = await super().get_klines(*args)
+            # pages come back newest first, as history-candles may
+            return list(reversed(rows))
+
+    client = SlowMarketClient()
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    start_ms = int(start.timestamp() * 1000)
+    end_ms = start_ms + 1000 * MINUTE
+
+    rows = await fetch_candles(client, "BTCUSDT", "1m", start, end_ms, max_concurrency=3)
+
+    assert len(client.calls) == 5
+    assert client.peak == 3
+    ts = [int(row[0]) for row in rows]
+    assert ts == list(range(start_ms, end_ms, MINUTE))
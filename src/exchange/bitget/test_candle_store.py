@@ -0,0 +1,74 @@
+import pytest
+
+from exchange.bitget.candle_store import CandleBuffer, CandleStore
+from exchange.bitget.dto.websocket import WsCandle
+
+MINUTE = 60_000
+
+
+def _candle(i: int, close: float = None) -> WsCandle:
+    close = float(i) if close is None else close
+    return WsCandle("BTCUSDT", "1m", i * MINUTE, close, close + 1, close - 1, close, 1.0, close)
+
+
+def test_update_same_ts_overwrites_and_newer_appends():
+    buf = CandleBuffer(capacity=5)
+    buf.apply_update([_candle(1), _candle(2)])
+    buf.apply_update([_candle(2, close=20.0)])
+
+    assert len(buf) == 2
+    assert list(buf.column("close")) == [1.0, 20.0]
+    assert buf.last_ts == 2 * MINUTE
+
+
+def test_update_older_ts_is_ignored():
+    buf = CandleBuffer(capacity=5)
+    buf.apply_update([_candle(3)])
+    assert buf.upsert(2 * MINUTE, 1, 1, 1, 1, 1) is False
+    assert list(buf.column("ts")) == [3 * MINUTE]
+
+
+def test_ring_wraps_and_window_stays_contiguous_oldest_first():
+    buf = CandleBuffer(capacity=4)
+    buf.apply_update([_candle(i) for i in range(1, 8)])
+
+    window = buf.window()
+    assert len(buf) == 4
+    assert list(window["ts"]) == [i * MINUTE for i in range(4, 8)]
+    assert list(window["close"]) == [4.0, 5.0, 6.0, 7.0]
+    assert list(buf.window(2)["close"]) == [6.0, 7.0]
+    assert all(view.contiguous for view in window.values())
+
+
+def test_window_is_a_zero_copy_view():
+    buf = CandleBuffer(capacity=4)
+    buf.apply_update([_candle(1), _candle(2)])
+    view = buf.column("close")
+
+    buf.apply_update([_candle(2, close=99.0)])
+
+    assert view[-1] == 99.0
+
+
+def test_snapshot_replaces_overlapping_tail():
+    buf = CandleBuffer(capacity=10)
+    buf.apply_update([_candle(i) for i in range(1, 6)])
+
+    buf.apply_snapshot([_candle(5, close=50.0), _candle(4, close=40.0), _candle(6, close=60.0)])
+
+    assert list(buf.column("ts")) == [i * MINUTE for i in range(1, 7)]
+    assert list(buf.column("close")) == [1.0, 2.0, 3.0, 40.0, 50.0, 60.0]
+
+
+def test_store_routes_actions_per_symbol_interval():
+    store = CandleStore(capacity=3)
+    store.apply("BTCUSDT", "1m", "snapshot", [_candle(1), _candle(2)])
+    store.apply("BTCUSDT", "1m", "update", [_candle(3)])
+
+    assert list(store.window("BTCUSDT", "1m")["ts"]) == [MINUTE, 2 * MINUTE, 3 * MINUTE]
+    assert store.get("ETHUSDT", "1m") is None
+
+
+def test_invalid_capacity_raises():
+    with pytest.raises(ValueError):
+        CandleBuffer(capacity=0)
@@ -0,0 +1,147 @@
+import asyncio
+import json
+import time
+from decimal import Decimal
+
+import pytest
+
+from exchange.bitget.contract_registry import ContractRegistry, ContractSpec
+
+BTC = {
+    "symbol": "BTCUSDT", "pricePlace": "1", "priceEndStep": "1", "volumePlace": "4",
+    "sizeMultiplier": "0.0001", "minTradeNum": "0.0001", "minTradeUSDT": "5", "maxLever": "125",
+}
+ETH = {
+    "symbol": "ETHUSDT", "pricePlace": "2", "priceEndStep": "5", "volumePlace": "2",
+    "sizeMultiplier": "", "minTradeNum": "0.01", "minTradeUSDT": "5",
+}
+
+
+class FakeMarketClient:
+    def __init__(self, contracts):
+        self.contracts = contracts
+        self.calls = 0
+
+    async def get_contracts(self, product_type):
+        self.calls += 1
+        return self.contracts
+
+
+def test_spec_precomputes_steps_and_rounds_down():
+    btc = ContractSpec.from_contract(BTC)
+    eth = ContractSpec.from_contract(ETH)
+    assert (btc.tick, btc.qty_step, btc.min_qty, btc.min_notional) == (
+        Decimal("0.1"), Decimal("0.0001"), Decimal("0.0001"), Decimal("5"),
+    )
+    assert (eth.tick, eth.qty_step) == (Decimal("0.05"), Decimal("0.01"))
+    assert eth.round_price(Decimal("2501.29")) == Decimal("2501.25")
+    assert btc.round_qty(Decimal("0.123456")) == Decimal("0.1234")
+    assert "notional" in btc.validate(Decimal("40000"), Decimal("0.0001"))  # 4 USDT < 5 USDT
+    assert btc.validate(Decimal("60000"), Decimal("0.001")) is None
+    assert "min" in btc.validate(Decimal("60000"), Decimal("0.00001"))
+
+
+@pytest.mark.asyncio
+async def test_cold_start_fetches_and_writes_cache(tmp_path):
+    client = FakeMarketClient([BTC, ETH])
+    registry = ContractRegistry(lambda: client, cache_path=tmp_path / "contracts.json")
+    await registry.start()
+    try:
+        assert client.calls == 1
+        assert registry.get("ETHUSDT").tick == Decimal("0.05")
+        cached = json.loads((tmp_path / "contracts.json").read_text())
+        assert cached["product_type"] == "USDT-FUTURES"
+        assert {c["symbol"] for c in cached["contracts"]} == {"BTCUSDT", "ETHUSDT"}
+        assert "maxLever" not in cached["contracts"][0]
+    finally:
+        await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_warm_start_uses_cache_without_network(tmp_path):
+    path = tmp_path / "contracts.json"
+    await ContractRegistry(lambda: FakeMarketClient([BTC]), cache_path=path).refresh()
+
+    client = FakeMarketClient([BTC, ETH])
+    registry = ContractRegistry(lambda: client, cache_path=path)
+    await registry.start(["BTCUSDT"])
+    try:
+        assert client.calls == 0
+        assert "BTCUSDT" in registry and not registry.stale
+        with pytest.raises(LookupError):
+            registry.get("ETHUSDT")
+    finally:
+        await registry.close()
+
+    # a symbol missing from the cache forces a fetch before use
+    await registry.start(["ETHUSDT"])
+    try:
+        assert client.calls == 1
+        assert registry.get("ETHUSDT").min_qty == Decimal("0.01")
+    finally:
+        await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_expired_cache_is_refreshed_in_background(tmp_path):
+    path = tmp_path / "contracts.json"
+    path.write_text(json.dumps({"product_type": "USDT-FUTURES", "fetched_at": time.time() - 100, "contracts": [BTC]}))
+    client = FakeMarketClient([BTC, ETH])
+    registry = ContractRegistry(lambda: client, cache_path=path, ttl=10)
+    await registry.start()
+    try:
+        # usable immediately from the expired cache
+        assert registry.stale and len(registry) == 1
+        for _ in range(100):
+            if client.calls:
+                break
+            await asyncio.sleep(0.01)
+        assert client.calls == 1 and len(registry) == 2 and not registry.stale
+    finally:
+        await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_cached_specs(tmp_path):
+    path = tmp_path / "contracts.json"
+    path.write_text(json.dumps({"product_type": "USDT-FUTURES", "fetched_at": 0, "contracts": [BTC]}))
+
+    class FailingClient:
+        async def get_contracts(self, product_type):
+            raise ConnectionError("down")
+
+    registry = ContractRegistry(lambda: FailingClient(), cache_path=path, ttl=10, retry_interval=60)
+    await registry.start()
+    await asyncio.sleep(0.01)
+    try:
+        assert registry.get("BTCUSDT").tick == Decimal("0.1")
+    finally:
+        await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_cold_start_does_not_raise(tmp_path):
+    class FailingClient:
+        async def get_contracts(self, product_type):
+            raise ConnectionError("down")
+
+    registry = ContractRegistry(lambda: FailingClient(), cache_path=tmp_path / "contracts.json")
+    try:
+        assert await registry.start(["BTCUSDT"], background=False) is False
+        assert "BTCUSDT" not in registry
+    finally:
+        await registry.close()
+
+
+@pytest.mark.asyncio
+async def test_one_shot_start_refreshes_expired_cache_without_background_loop(tmp_path):
+    path = tmp_path / "contracts.json"
+    path.write_text(json.dumps({"product_type": "USDT-FUTURES", "fetched_at": 0, "contracts": [BTC]}))
+    client = FakeMarketClient([BTC, ETH])
+    registry = ContractRegistry(lambda: client, cache_path=path, ttl=10)
+
+    assert await registry.start(["BTCUSDT"], background=False) is True
+
+    assert client.calls == 1
+    assert "ETHUSDT" in registry
+    assert registry._task is None
@@ -0,0 +1,95 @@
+import asyncio
+
+import pytest
+from reactivex import Subject
+
+from exchange.bitget.fanout import OverflowPolicy, QueueSubscriber
+from exchange.bitget.stream_manager import BitgetStreamManager
+
+
+async def _noop(_):
+    pass
+
+
+def test_drop_oldest_keeps_latest_items_and_counts_drops():
+    sub = QueueSubscriber("s", _noop, maxsize=3, policy=OverflowPolicy.DROP_OLDEST)
+    for i in range(5):
+        sub.offer(i)
+    assert list(sub._queue) == [2, 3, 4]
+    assert sub.dropped == 2
+
+
+def test_conflate_keeps_latest_value_per_key():
+    sub = QueueSubscriber("s", _noop, maxsize=2, policy=OverflowPolicy.CONFLATE, key=lambda x: x[0])
+    sub.offer(("BTC", 1))
+    sub.offer(("ETH", 1))
+    sub.offer(("BTC", 2))
+    assert list(sub._queue.values()) == [("BTC", 2), ("ETH", 1)]
+    sub.offer(("SOL", 1))  # new key while full evicts the oldest key
+    assert list(sub._queue) == ["ETH", "SOL"]
+    assert sub.dropped == 2
+
+
+def test_block_keeps_everything_and_reports_full():
+    sub = QueueSubscriber("s", _noop, maxsize=2, policy=OverflowPolicy.BLOCK)
+    for i in range(3):
+        sub.offer(i)
+    assert len(sub) == 3 and sub.full and sub.dropped == 0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"maxsize": 0}, {"policy": OverflowPolicy.CONFLATE}],
+)
+def test_invalid_configuration_raises(kwargs):
+    with pytest.raises(ValueError):
+        QueueSubscriber("s", _noop, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_does_not_delay_fast_one():
+    manager = BitgetStreamManager({})
+    stream = Subject()
+    fast, release = [], asyncio.Event()
+
+    async def slow_handler(_):
+        await release.wait()
+
+    async def fast_handler(item):
+        fast.append(item)
+
+    slow = manager.subscribe(stream, slow_handler, name="slow", maxsize=2)
+    manager.subscribe(stream, fast_handler, name="fast", maxsize=100)
+
+    stream.on_next(0)
+    await asyncio.sleep(0)  # slow handler picks up item 0 and stalls
+    for i in range(1, 10):
+        stream.on_next(i)
+    await asyncio.sleep(0.01)
+
+    assert fast == list(range(10))
+    assert manager.drop_counts() == {"slow": 7, "fast": 0}  # 1 in flight + 2 queued
+    release.set()
+    manager.unsubscribe(slow)
+    assert [s.name for s in manager.subscribers] == ["fast"]
+
+
+@pytest.mark.asyncio
+async def test_block_subscriber_backpressures_until_drained():
+    manager = BitgetStreamManager({})
+    stream = Subject()
+    seen = []
+
+    async def handler(item):
+        seen.append(item)
+
+    manager.subscribe(stream, handler, name="block", maxsize=2, policy=OverflowPolicy.BLOCK)
+    for i in range(3):
+        stream.on_next(i)
+    assert manager.backpressured
+
+    await asyncio.wait_for(manager.wait_writable(), timeout=1)
+    await asyncio.sleep(0.01)
+
+    assert seen == [0, 1, 2]
+    assert not manager.backpressured
@@ -0,0 +1,154 @@
+import multiprocessing
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from exchange.bitget.dto.websocket import WsCandle
+from exchange.bitget.dto.websocket import SubscribeReq
+from exchange.bitget.market_bus import KIND_CANDLE, PAYLOAD, MarketBusReader, SharedMarketBus
+from exchange.bitget.stream_manager import BitgetStreamManager
+from exchange.bitget.ticker_cache import Quote
+
+
+def _candle(ts: int, symbol: str = "BTCUSDT") -> WsCandle:
+    return WsCandle(symbol, "1m", ts, 1.0, 2.0, 0.5, 1.5, 10.0, 15.0)
+
+
+@pytest.fixture
+def bus():
+    bus = SharedMarketBus(f"test-bus-{uuid.uuid4().hex[:8]}", capacity=8)
+    yield bus
+    bus.close()
+
+
+def test_reader_sees_records_in_sequence(bus):
+    reader = MarketBusReader(bus.name)
+    bus.publish_candle(_candle(60_000))
+    bus.publish_quote(Quote("ETHUSDT", Decimal("1.5"), Decimal("1.75"), Decimal("1.6"), None, 123, 0.0))
+
+    (seq0, candle), (seq1, quote) = reader.poll()
+    assert (seq0, seq1) == (0, 1)
+    assert candle == _candle(60_000)
+    assert (quote.symbol, quote.bid, quote.ask, quote.last, quote.mark, quote.ts) == (
+        "ETHUSDT", Decimal("1.5"), Decimal("1.75"), Decimal("1.6"), None, 123
+    )
+    assert reader.poll() == []
+    reader.close()
+
+
+def test_lagging_reader_skips_overwritten_records(bus):
+    reader = MarketBusReader(bus.name)
+    for i in range(20):
+        bus.publish_candle(_candle(i))
+
+    seqs = [seq for seq, _ in reader.poll()]
+    assert seqs == list(range(13, 20))
+    assert reader.lost == 13
+    reader.close()
+
+
+def test_reader_can_start_at_head(bus):
+    bus.publish_candle(_candle(1))
+    reader = MarketBusReader(bus.name, start=None)
+    bus.publish_candle(_candle(2))
+
+    assert [c.ts for _, c in reader.poll()] == [2]
+    reader.close()
+
+
+def test_attach_publishes_stream_manager_output(bus):
+    manager = BitgetStreamManager({
+        "s": {"product_type": "USDT-FUTURES", "intervals": ["1m"], "universe": ["BTCUSDT"], "ticker": True}
+    })
+    bus.attach(manager)
+    reader = MarketBusReader(bus.name)
+    manager.dispatch({
+        "action": "update",
+        "arg": {"instType": "USDT-FUTURES", "channel": "candle1m", "instId": "BTCUSDT"},
+        "data": [["60000", "1", "2", "0.5", "1.5", "10", "15", "15"]],
+    })
+    manager.dispatch({
+        "action": "snapshot",
+        "arg": {"instType": "USDT-FUTURES", "channel": "ticker", "instId": "BTCUSDT"},
+        "data": [{"instId": "BTCUSDT", "bidPr": "1", "askPr": "2", "lastPr": "1.5", "markPrice": "1.5", "ts": "1"}],
+    })
+
+    records = [record for _, record in reader.poll()]
+    assert records[0] == _candle(60_000)
+    assert records[1].mark == Decimal("1.5")
+    reader.close()
+
+
+def test_attach_publishes_candle_channels_registered_later(bus):
+    manager = BitgetStreamManager({})
+    bus.attach(manager)
+    manager.register(SubscribeReq("USDT-FUTURES", "candle1m", "ETHUSDT"))
+    reader = MarketBusReader(bus.name)
+
+    manager.dispatch({
+        "action": "update",
+        "arg": {"instType": "USDT-FUTURES", "channel": "candle1m", "instId": "ETHUSDT"},
+        "data": [["60000", "1", "2", "0.5", "1.5", "10", "15", "15"]],
+    })
+
+    assert [record for _, record in reader.poll()] == [_candle(60_000, "ETHUSDT")]
+    reader.close()
+
+
+def test_views_read_the_slot_without_building_records(bus):
+    reader = MarketBusReader(bus.name)
+    bus.publish_candle(_candle(60_000))
+
+    views = []
+    for seq, payload in reader.views():
+        assert isinstance(payload, memoryview) and payload.nbytes == PAYLOAD.size
+        kind, symbol, interval, ts, *values = PAYLOAD.unpack_from(payload)
+        assert reader.consistent(seq)
+        assert (kind, symbol.rstrip(b"\0"), ts, values[3]) == (KIND_CANDLE, b"BTCUSDT", 60_000, 1.5)
+        views.append(payload)
+
+    # released once the iterator moved on, so nothing keeps the segment mapped
+    with pytest.raises(ValueError):
+        views[0].tobytes()
+    assert reader.next_seq == 1
+    reader.close()
+
+
+def test_view_lapped_while_held_counts_as_lost(bus):
+    reader = MarketBusReader(bus.name)
+    bus.publish_candle(_candle(0))
+
+    for seq, _ in reader.views():
+        for i in range(1, 10):
+            bus.publish_candle(_candle(i))
+        assert not reader.consistent(seq)
+
+    # the held record plus everything before the oldest slot still safe to read
+    assert reader.lost == 3
+    assert [c.ts for _, c in reader.poll()] == list(range(3, 10))
+    reader.close()
+
+
+def test_symbol_too_long_for_the_record_is_rejected(bus):
+    with pytest.raises(ValueError):
+        bus.publish_candle(_candle(1, symbol="X" * 24))
+    assert bus.seq == 0
+
+
+def _read_in_worker(name: str, count: int, out):
+    reader = MarketBusReader(name)
+    out.put([candle.ts for _, candle in reader.poll(max_records=count)])
+    reader.close()
+
+
+def test_reader_in_another_process(bus):
+    for i in range(5):
+        bus.publish_candle(_candle(i))
+    ctx = multiprocessing.get_context("spawn")
+    out = ctx.Queue()
+    worker = ctx.Process(target=_read_in_worker, args=(bus.name, 5, out))
+    worker.start()
+    assert out.get(timeout=30) == [0, 1, 2, 3, 4]
+    worker.join(timeout=30)
+    assert worker.exitcode == 0
@@ -0,0 +1,75 @@
+import zlib
+
+import pytest
+
+from exchange.bitget.order_book import OrderBook
+
+SNAPSHOT = {
+    "asks": [["27001.0", "1.5"], ["27000.5", "2.0"], ["27002.0", "0.3"]],
+    "bids": [["26999.5", "1.0"], ["27000.0", "0.5"], ["26998.0", "4.0"]],
+    "checksum": 0,
+    "seq": 10,
+    "ts": "1695710946294",
+}
+
+
+def _signed_crc(text: str) -> int:
+    value = zlib.crc32(text.encode())
+    return value - (1 << 32) if value >= (1 << 31) else value
+
+
+def _book() -> OrderBook:
+    book = OrderBook("BTCUSDT")
+    book.apply_snapshot(SNAPSHOT)
+    return book
+
+
+def test_snapshot_sorts_levels_and_exposes_best_prices():
+    book = _book()
+    assert book.best_bid() == (27000.0, 0.5)
+    assert book.best_ask() == (27000.5, 2.0)
+    assert book.mid() == pytest.approx(27000.25)
+    assert book.depth(2) == {
+        "bids": [(27000.0, 0.5), (26999.5, 1.0)],
+        "asks": [(27000.5, 2.0), (27001.0, 1.5)],
+    }
+    assert book.seq == 10 and book.ts == 1695710946294
+
+
+def test_update_inserts_changes_and_removes_levels():
+    book = _book()
+    book.apply_update({
+        "asks": [["27000.5", "0"], ["27000.2", "0.7"]],
+        "bids": [["27000.0", "2.5"], ["26999.5", "0"]],
+    })
+    assert book.best_ask() == (27000.2, 0.7)
+    assert book.best_bid() == (27000.0, 2.5)
+    assert book.depth(5)["bids"] == [(27000.0, 2.5), (26998.0, 4.0)]
+
+
+def test_checksum_interleaves_top_levels_with_original_strings():
+    book = _book()
+    expected = _signed_crc(
+        "27000.0:0.5:27000.5:2.0:26999.5:1.0:27001.0:1.5:26998.0:4.0:27002.0:0.3"
+    )
+    assert book.checksum() == expected
+    assert book.verify(expected)
+    assert not book.verify(expected + 1)
+
+
+def test_invalid_book_ignores_updates_until_next_snapshot():
+    book = _book()
+    book.invalidate()
+    assert book.apply_update({"bids": [["1", "1"]]}) is False
+    assert book.best_bid() is None
+
+    book.apply_snapshot(SNAPSHOT)
+    assert book.valid and book.best_bid() == (27000.0, 0.5)
+
+
+@pytest.mark.parametrize(
+    "side, size, expected",
+    [("buy", 1.0, 27000.5), ("buy", 3.0, 27001.0), ("sell", 1.2, 26999.5), ("sell", 100, None)],
+)
+def test_price_for_size_walks_the_book(side, size, expected):
+    assert _book().price_for_size(side, size) == expected
@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from exchange.bitget.private_state import BitgetPrivateState
+
+
+def _position(symbol: str = "BTCUSDT", side: str = "long", total: str = "0.01") -> dict:
+    return {"instId": symbol, "holdSide": side, "total": total, "leverage": "5", "marginSize": "50"}
+
+
+def test_orders_drop_terminal_states():
+    state = BitgetPrivateState()
+    state.on_orders("snapshot", [
+        {"orderId": "1", "instId": "BTCUSDT", "status": "live"},
+        {"orderId": "2", "instId": "ETHUSDT", "status": "live"},
+    ])
+    state.on_orders("update", [{"orderId": "1", "instId": "BTCUSDT", "status": "filled"}])
+
+    assert [o["orderId"] for o in state.open_orders()] == ["2"]
+    assert state.open_orders("BTCUSDT") == []
+
+
+def test_positions_snapshot_replaces_and_zero_total_removes():
+    state = BitgetPrivateState()
+    state.on_positions("snapshot", [_position(), _position("ETHUSDT")])
+    state.on_positions("snapshot", [_position(total="0.02")])
+
+    positions = state.get_positions("BTCUSDT")
+    assert positions[0]["total"] == "0.02"
+    assert positions[0]["symbol"] == "BTCUSDT"
+    assert state.get_positions("ETHUSDT") == []
+
+    state.on_positions("update", [_position(total="0")])
+    assert state.get_positions("BTCUSDT") == []
+
+
+def test_account_exposes_rest_equity_name():
+    state = BitgetPrivateState()
+    state.on_account("snapshot", [{"marginCoin": "USDT", "equity": "1234.5", "available": "1000"}])
+
+    assert state.get_account()["accountEquity"] == "1234.5"
+    assert state.get_account("BTC") is None
+
+
+@pytest.mark.asyncio
+async def test_fresh_and_wait_ready():
+    state = BitgetPrivateState()
+    assert not state.fresh("account")
+    assert not await state.wait_ready(timeout=0.01)
+
+    state.on_orders("snapshot", [])
+    state.on_positions("snapshot", [])
+    waiter = asyncio.create_task(state.wait_ready(timeout=1))
+    await asyncio.sleep(0)
+    state.on_account("snapshot", [])
+
+    assert await waiter
+    assert state.fresh("account", max_age=1)
+
+    state.reset()
+    assert not state.fresh("orders")
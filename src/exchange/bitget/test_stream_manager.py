@@ -0,0 +1,188 @@
+import pytest
+
+from exchange.bitget.dto.websocket import SubscribeReq, WsCandle
+from exchange.bitget.order_book import OrderBook
+from exchange.bitget.stream_manager import BitgetStreamManager
+
+STRATEGIES = {
+    "squirrel": {
+        "product_type": "USDT-FUTURES",
+        "intervals": ["1m", "5m"],
+        "universe": ["BTCUSDT", "ETHUSDT"],
+    }
+}
+
+ROW = ["1695685500000", "27000", "27000.5", "26999.5", "27000", "0.057", "1539.0155", "1539.0155"]
+
+
+def _push(channel="candle5m", inst_id="BTCUSDT", action="update", data=None):
+    return {
+        "action": action,
+        "arg": {"instType": "USDT-FUTURES", "channel": channel, "instId": inst_id},
+        "data": data if data is not None else [ROW],
+        "ts": 1695685501000,
+    }
+
+
+def test_channels_and_streams_built_from_strategies():
+    manager = BitgetStreamManager(STRATEGIES)
+    assert len(manager.channels) == 4
+    assert set(manager.candle_stream) == {"BTCUSDT", "ETHUSDT"}
+    assert set(manager.candle_stream["BTCUSDT"]) == {"1m", "5m"}
+
+
+def test_dispatch_emits_typed_candle_to_matching_subject():
+    manager = BitgetStreamManager(STRATEGIES)
+    received, other = [], []
+    manager.candle_stream["BTCUSDT"]["5m"].subscribe(received.append)
+    manager.candle_stream["BTCUSDT"]["1m"].subscribe(other.append)
+
+    assert manager.dispatch(_push()) is True
+
+    assert other == []
+    assert received == [
+        WsCandle("BTCUSDT", "5m", 1695685500000, 27000.0, 27000.5, 26999.5, 27000.0, 0.057, 1539.0155)
+    ]
+
+
+def test_dispatch_snapshot_emits_every_row_in_order():
+    manager = BitgetStreamManager(STRATEGIES)
+    received = []
+    manager.candle_stream["ETHUSDT"]["1m"].subscribe(received.append)
+    rows = [[str(1695685500000 + i * 60_000), *ROW[1:]] for i in range(3)]
+
+    manager.dispatch(_push(channel="candle1m", inst_id="ETHUSDT", action="snapshot", data=rows))
+
+    assert [c.ts for c in received] == [int(r[0]) for r in rows]
+
+
+@pytest.mark.parametrize(
+    "msg",
+    [
+        {"event": "subscribe", "arg": {"instType": "USDT-FUTURES", "channel": "candle5m", "instId": "BTCUSDT"}},
+        {"event": "error", "code": 30001, "msg": "instType:USDT-FUTURES,channel:candle5m,instId:XXX doesn't exist"},
+        _push(inst_id="SOLUSDT"),
+    ],
+)
+def test_dispatch_ignores_events_and_unknown_routes(msg):
+    manager = BitgetStreamManager(STRATEGIES)
+    assert manager.dispatch(msg) is False
+
+
+def test_register_adds_route_for_runtime_subscription():
+    manager = BitgetStreamManager(STRATEGIES)
+    manager.register(SubscribeReq("USDT-FUTURES", "candle15m", "SOLUSDT"))
+    received = []
+    manager.candle_stream["SOLUSDT"]["15m"].subscribe(received.append)
+
+    assert manager.dispatch(_push(channel="candle15m", inst_id="SOLUSDT")) is True
+    assert len(received) == 1
+
+
+def test_subscribe_req_serializes_camel_case_arg():
+    req = SubscribeReq("USDT-FUTURES", "candle5m", "BTCUSDT")
+    assert req.to_arg() == {"instType": "USDT-FUTURES", "channel": "candle5m", "instId": "BTCUSDT"}
+    assert req.key == ("USDT-FUTURES", "candle5m", "BTCUSDT")
+
+
+def test_dispatch_keeps_rolling_history_in_candle_store():
+    manager = BitgetStreamManager(STRATEGIES)
+    rows = [[str(1695685500000 + i * 300_000), *ROW[1:]] for i in range(3)]
+    manager.dispatch(_push(action="snapshot", data=rows))
+    manager.dispatch(_push(data=[[rows[-1][0], "1", "2", "0.5", "1.5", "3", "4", "4"]]))
+
+    window = manager.candle_store.window("BTCUSDT", "5m")
+    assert list(window["ts"]) == [int(r[0]) for r in rows]
+    assert window["close"][-1] == 1.5
+
+
+def test_resubscribe_snapshot_does_not_replay_emitted_candles():
+    manager = BitgetStreamManager(STRATEGIES)
+    rows = [[str(1695685500000 + i * 300_000), *ROW[1:]] for i in range(4)]
+    received = []
+    manager.candle_stream["BTCUSDT"]["5m"].subscribe(received.append)
+
+    manager.dispatch(_push(action="snapshot", data=rows[:3]))
+    manager.dispatch(_push(action="snapshot", data=rows))
+
+    assert [c.ts for c in received] == [int(r[0]) for r in rows[:3]] + [int(rows[2][0]), int(rows[3][0])]
+
+
+def _book_manager() -> BitgetStreamManager:
+    return BitgetStreamManager({"squirrel": {**STRATEGIES["squirrel"], "books": "books"}})
+
+
+def test_books_channel_is_subscribed_per_symbol_and_feeds_local_book():
+    manager = _book_manager()
+    assert SubscribeReq("USDT-FUTURES", "books", "BTCUSDT") in manager.channels
+    updates = []
+    manager.book_stream["BTCUSDT"].subscribe(updates.append)
+    snapshot = {"asks": [["101", "1"]], "bids": [["100", "2"]], "ts": "1"}
+    expected = OrderBook("BTCUSDT")
+    expected.apply_snapshot(snapshot)
+    snapshot["checksum"] = expected.checksum()
+
+    manager.dispatch(_push(channel="books", action="snapshot", data=[snapshot]))
+
+    book = manager.order_books["BTCUSDT"]
+    assert updates == [book]
+    assert book.best_bid() == (100.0, 2.0) and book.best_ask() == (101.0, 1.0)
+
+
+def test_book_checksum_mismatch_invalidates_and_requests_resync():
+    manager = _book_manager()
+    resyncs = []
+    manager.resync_stream.subscribe(resyncs.append)
+    manager.dispatch(_push(channel="books", action="snapshot", data=[{"asks": [["101", "1"]], "bids": [["100", "2"]]}]))
+
+    manager.dispatch(_push(channel="books", data=[{"asks": [["102", "1"]], "bids": [], "checksum": 12345}]))
+
+    assert resyncs == [SubscribeReq("USDT-FUTURES", "books", "BTCUSDT")]
+    assert manager.order_books["BTCUSDT"].valid is False
+
+
+def test_snapshot_only_book_channel_ignores_its_zero_checksum():
+    manager = BitgetStreamManager({"squirrel": {**STRATEGIES["squirrel"], "books": "books5"}})
+    resyncs, updates = [], []
+    manager.resync_stream.subscribe(resyncs.append)
+    manager.book_stream["BTCUSDT"].subscribe(updates.append)
+
+    manager.dispatch(_push(channel="books5", action="snapshot", data=[
+        {"asks": [["101", "1"]], "bids": [["100", "2"]], "checksum": 0}
+    ]))
+
+    assert resyncs == []
+    assert updates == [manager.order_books["BTCUSDT"]]
+    assert manager.order_books["BTCUSDT"].best_bid() == (100.0, 2.0)
+
+
+def test_trade_channel_feeds_configured_bars_and_skips_replayed_trades():
+    manager = BitgetStreamManager({
+        "squirrel": {**STRATEGIES["squirrel"], "bars": [{"type": "volume", "size": 2}, {"type": "time", "size": "1m"}]}
+    })
+    assert SubscribeReq("USDT-FUTURES", "trade", "BTCUSDT") in manager.channels
+    assert sum(ch.channel == "trade" for ch in manager.channels) == 2  # one per symbol
+    bars, trades = [], []
+    manager.bar_stream["BTCUSDT"]["volume:2"].subscribe(bars.append)
+    manager.trade_stream["BTCUSDT"].subscribe(trades.append)
+
+    items = [
+        {"ts": "2000", "price": "101", "size": "1", "side": "sell", "tradeId": "2"},
+        {"ts": "1000", "price": "100", "size": "1", "side": "buy", "tradeId": "1"},
+    ]
+    manager.dispatch(_push(channel="trade", action="snapshot", data=items))
+    # a resubscribe snapshot repeats the same trades
+    manager.dispatch(_push(channel="trade", action="snapshot", data=items))
+
+    assert [t.trade_id for t in trades] == ["1", "2"]
+    assert len(bars) == 1 and bars[0].open == 100 and bars[0].close == 101
+
+
+def test_ticker_channel_updates_ticker_cache():
+    manager = BitgetStreamManager({"squirrel": {**STRATEGIES["squirrel"], "ticker": True}})
+    assert SubscribeReq("USDT-FUTURES", "ticker", "ETHUSDT") in manager.channels
+    item = {"instId": "ETHUSDT", "lastPr": "1600", "bidPr": "1599.9", "askPr": "1600.1", "markPrice": "1600", "ts": "1"}
+
+    assert manager.dispatch(_push(channel="ticker", inst_id="ETHUSDT", action="snapshot", data=[item])) is True
+
+    assert str(manager.ticker_cache.get("ETHUSDT").ask) == "1600.1"
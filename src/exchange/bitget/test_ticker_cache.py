@@ -0,0 +1,90 @@
+import time
+from decimal import Decimal
+
+import pytest
+
+from exchange.bitget.ticker_cache import Quote, TickerCache
+
+WS_ITEM = {
+    "instId": "BTCUSDT", "lastPr": "27000.5", "bidPr": "27000", "askPr": "27000.5",
+    "bidSz": "2.71", "askSz": "8.76", "markPrice": "27000", "ts": "1695702438018",
+}
+REST_ITEM = {
+    "symbol": "BTCUSDT", "lastPr": "27100", "askPr": "27100.5", "bidPr": "27100",
+    "markPrice": "27100", "ts": "1695702440000",
+}
+
+
+class FakeMarketClient:
+    def __init__(self):
+        self.calls = 0
+
+    async def ticker(self, symbol):
+        self.calls += 1
+        return {"code": "00000", "data": [REST_ITEM]}
+
+
+def test_quote_from_ws_and_rest_items():
+    ws = Quote.from_ticker(WS_ITEM)
+    rest = Quote.from_ticker(REST_ITEM)
+    assert (ws.symbol, ws.bid, ws.ask, ws.last, ws.mark) == (
+        "BTCUSDT", Decimal("27000"), Decimal("27000.5"), Decimal("27000.5"), Decimal("27000"),
+    )
+    assert rest.symbol == "BTCUSDT" and rest.ts == 1695702440000
+    assert (ws.source, rest.source) == ("ws", "rest")
+
+
+@pytest.mark.asyncio
+async def test_fresh_cached_quote_skips_rest():
+    client = FakeMarketClient()
+    cache = TickerCache(lambda: client)
+    cache.update(Quote.from_ticker(WS_ITEM))
+
+    quote = await cache.get_quote("BTCUSDT", max_age=5)
+
+    assert quote.bid == Decimal("27000")
+    assert client.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_quote_falls_back_to_rest_and_refreshes_cache():
+    client = FakeMarketClient()
+    cache = TickerCache(lambda: client)
+    cache.update(Quote.from_ticker(WS_ITEM, received_at=time.monotonic() - 10))
+
+    quote = await cache.get_quote("BTCUSDT", max_age=1)
+
+    assert client.calls == 1
+    assert quote.bid == Decimal("27100")
+    assert cache.get("BTCUSDT") == quote
+
+
+def test_older_exchange_ts_does_not_overwrite_newer_quote():
+    cache = TickerCache()
+    newer = Quote.from_ticker({**WS_ITEM, "ts": "2000"})
+    cache.update(newer)
+    cache.update(Quote.from_ticker({**WS_ITEM, "ts": "1000"}))
+    assert cache.get("BTCUSDT") is newer
+
+
+def test_later_quote_from_the_other_source_wins_despite_clock_skew():
+    cache = TickerCache()
+    # REST fallback stamped ahead of the push stream
+    cache.update(Quote.from_ticker({**REST_ITEM, "ts": "5000"}, received_at=1.0))
+    ws = Quote.from_ticker({**WS_ITEM, "ts": "3000"}, received_at=2.0)
+    cache.update(ws)
+    assert cache.get("BTCUSDT") is ws
+
+    # a WS push that is older on the exchange clock is still dropped
+    cache.update(Quote.from_ticker({**WS_ITEM, "ts": "2000"}, received_at=3.0))
+    assert cache.get("BTCUSDT") is ws
+
+    rest = Quote.from_ticker({**REST_ITEM, "ts": "1000"}, received_at=4.0)
+    cache.update(rest)
+    assert cache.get("BTCUSDT") is rest
+
+
+@pytest.mark.asyncio
+async def test_missing_quote_without_fallback_raises():
+    with pytest.raises(LookupError):
+        await TickerCache().get_quote("BTCUSDT")
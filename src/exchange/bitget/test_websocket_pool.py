@@ -0,0 +1,62 @@
+import pytest
+
+from exchange.bitget.dto.websocket import SubscribeReq
+from exchange.bitget.stream_manager import BitgetStreamManager
+from exchange.bitget.websocket_pool import BitgetWebsocketPool
+
+URL = "wss://ws.example.com/v2/ws/public"
+
+
+def _manager(symbols: int, intervals=("1m", "5m")) -> BitgetStreamManager:
+    return BitgetStreamManager({
+        "squirrel": {
+            "product_type": "USDT-FUTURES",
+            "intervals": list(intervals),
+            "universe": [f"SYM{i}USDT" for i in range(symbols)],
+        }
+    })
+
+
+@pytest.mark.asyncio
+async def test_channels_are_spread_evenly_under_cap():
+    manager = _manager(symbols=25)  # 50 channels
+    pool = BitgetWebsocketPool(URL, manager, max_channels_per_connection=20)
+
+    sizes = [len(shard.channels) for shard in pool.shards]
+    assert sizes == [17, 17, 16]
+    # every channel lives on exactly one shard
+    all_channels = [ch for shard in pool.shards for ch in shard.channels]
+    assert len(all_channels) == len(set(all_channels)) == 50
+    assert len({shard.name for shard in pool.shards}) == 3
+
+
+@pytest.mark.asyncio
+async def test_subscribe_fills_least_loaded_shard_then_opens_new_one():
+    manager = _manager(symbols=2)  # 4 channels
+    pool = BitgetWebsocketPool(URL, manager, max_channels_per_connection=5)
+    assert len(pool.shards) == 1
+
+    new = [SubscribeReq("USDT-FUTURES", "candle15m", f"NEW{i}USDT") for i in range(3)]
+    await pool.subscribe(new)
+
+    assert len(pool.shards) == 2
+    assert [len(shard.channels) for shard in pool.shards] == [5, 2]
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_only_touches_owning_shard():
+    manager = _manager(symbols=4)  # 8 channels
+    pool = BitgetWebsocketPool(URL, manager, max_channels_per_connection=4)
+    first, second = pool.shards
+    target = next(iter(second.channels))
+
+    await pool.unsubscribe([target])
+
+    assert target not in second.channels
+    assert len(first.channels) == 4
+    assert len(second.channels) == 3
+
+
+def test_invalid_cap_raises():
+    with pytest.raises(ValueError):
+        BitgetWebsocketPool(URL, _manager(symbols=1), max_channels_per_connection=0)
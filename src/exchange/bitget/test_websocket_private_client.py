@@ -0,0 +1,75 @@
+import json
+
+import pytest
+
+from exchange.bitget.dto.bitget_error import BitgetError
+from exchange.bitget.private_state import BitgetPrivateState
+from exchange.bitget.utils.signature import generate_signature
+from exchange.bitget.websocket_private_client import BitgetPrivateWebsocketClient
+
+URL = "wss://ws.example.com/v2/ws/private"
+
+
+class FakeWs:
+    def __init__(self, incoming: list):
+        self.sent: list[str] = []
+        self._incoming = [m if isinstance(m, str) else json.dumps(m) for m in incoming]
+
+    async def send(self, msg: str):
+        self.sent.append(msg)
+
+    async def recv(self) -> str:
+        return self._incoming.pop(0)
+
+    @property
+    def ops(self) -> list[dict]:
+        return [json.loads(m) for m in self.sent]
+
+
+def _client(incoming: list) -> tuple[BitgetPrivateWebsocketClient, FakeWs]:
+    client = BitgetPrivateWebsocketClient(URL, "key", "secret", "pass", BitgetPrivateState(), send_rate=1000)
+    ws = FakeWs(incoming)
+    client._ws = ws
+    return client, ws
+
+
+@pytest.mark.asyncio
+async def test_login_is_signed_and_waits_for_ack():
+    client, ws = _client(["pong", {"event": "login", "code": 0}])
+
+    await client._on_connected()
+
+    (login,) = ws.ops
+    assert login["op"] == "login"
+    arg = login["args"][0]
+    assert arg["apiKey"] == "key"
+    assert arg["passphrase"] == "pass"
+    assert arg["sign"] == generate_signature("secret", arg["timestamp"], "GET", "/user/verify")
+
+
+@pytest.mark.asyncio
+async def test_login_failure_raises():
+    client, _ = _client([{"event": "error", "code": 30005, "msg": "Invalid sign"}])
+
+    with pytest.raises(BitgetError):
+        await client._on_connected()
+
+
+@pytest.mark.asyncio
+async def test_subscribes_private_channels_and_feeds_state():
+    client, ws = _client([])
+
+    await client._resubscribe_all()
+    args = ws.ops[0]["args"]
+    assert {"instType": "USDT-FUTURES", "channel": "account", "coin": "default"} in args
+    assert {"instType": "USDT-FUTURES", "channel": "positions", "instId": "default"} in args
+
+    client._stream_manager.dispatch({
+        "action": "snapshot",
+        "arg": {"instType": "USDT-FUTURES", "channel": "account", "coin": "default"},
+        "data": [{"marginCoin": "USDT", "equity": "100"}],
+    })
+    client._handle_event({"event": "subscribe", "arg": {"instType": "USDT-FUTURES", "channel": "account", "coin": "default"}})
+
+    assert client.state.get_account()["accountEquity"] == "100"
+    assert {ch.channel for ch in client.live_channels} == {"account"}
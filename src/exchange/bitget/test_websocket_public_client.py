@@ -0,0 +1,209 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from exchange.bitget.candle_backfill import BackfillError
+from exchange.bitget.dto.websocket import SubscribeReq
+from exchange.bitget.stream_manager import BitgetStreamManager
+from exchange.bitget.websocket_public_client import BitgetWebsocketClient
+
+URL = "wss://ws.example.com/v2/ws/public"
+
+
+class FakeWs:
+    def __init__(self):
+        self.sent: list[str] = []
+
+    async def send(self, msg: str):
+        self.sent.append(msg)
+
+    @property
+    def ops(self) -> list[dict]:
+        return [json.loads(m) for m in self.sent]
+
+
+def _client(symbols: int = 5, **kwargs) -> tuple[BitgetWebsocketClient, FakeWs]:
+    manager = BitgetStreamManager({
+        "squirrel": {
+            "product_type": "USDT-FUTURES",
+            "intervals": ["5m"],
+            "universe": [f"SYM{i}USDT" for i in range(symbols)],
+        }
+    })
+    kwargs.setdefault("send_rate", 1000)
+    client = BitgetWebsocketClient(URL, manager, **kwargs)
+    ws = FakeWs()
+    client._ws = ws
+    return client, ws
+
+
+def _ack(event: str, ch: SubscribeReq, **extra) -> dict:
+    return {"event": event, "arg": ch.to_arg(), **extra}
+
+
+@pytest.mark.asyncio
+async def test_resubscribe_is_chunked_and_tracks_pending():
+    client, ws = _client(symbols=45, max_args_per_op=20)
+
+    await client._resubscribe_all()
+
+    assert [len(op["args"]) for op in ws.ops] == [20, 20, 5]
+    assert all(op["op"] == "subscribe" for op in ws.ops)
+    assert {"instType", "channel", "instId"} == set(ws.ops[0]["args"][0])
+    assert len(client.pending_channels) == 45
+    assert client.live_channels == set()
+
+
+@pytest.mark.asyncio
+async def test_ack_moves_channel_from_pending_to_live():
+    client, ws = _client(symbols=2)
+    await client._resubscribe_all()
+    ch = next(iter(client.channels))
+
+    client._handle_event(_ack("subscribe", ch))
+
+    assert client.live_channels == {ch}
+    assert ch not in client.pending_channels
+
+
+@pytest.mark.asyncio
+async def test_rejected_and_timed_out_subscriptions_are_retried():
+    client, ws = _client(symbols=3, ack_timeout=5)
+    await client._resubscribe_all()
+    acked, rejected, silent = sorted(client.channels, key=lambda c: c.inst_id)
+    client._handle_event(_ack("subscribe", acked))
+    client._handle_event(_ack("error", rejected, code=30001, msg="boom"))
+    # pretend the remaining subscribe went out long ago
+    client._pending[silent.key] -= 10
+    ws.sent.clear()
+
+    await client._retry_unacked()
+
+    retried = {arg["instId"] for op in ws.ops for arg in op["args"]}
+    assert retried == {rejected.inst_id, silent.inst_id}
+    assert client._attempts[rejected.key] == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_gives_up_after_max_attempts():
+    client, ws = _client(symbols=1, max_subscribe_retries=2)
+    await client._resubscribe_all()
+    ch = next(iter(client.channels))
+
+    for _ in range(3):
+        client._handle_event(_ack("error", ch, code=30001, msg="doesn't exist"))
+        await client._retry_unacked()
+
+    assert client.pending_channels == set()
+    assert sum(1 for op in ws.ops for arg in op["args"]) == 3  # initial + 2 retries
+
+
+@pytest.mark.asyncio
+async def test_unsubscribed_channel_is_not_retried():
+    client, ws = _client(symbols=2)
+    await client._resubscribe_all()
+    ch = next(iter(client.channels))
+    await client.unsubscribe([ch])
+    client._pending = {k: v - 60 for k, v in client._pending.items()}
+    ws.sent.clear()
+
+    await client._retry_unacked()
+
+    retried = [arg["instId"] for op in ws.ops for arg in op["args"]]
+    assert ch.inst_id not in retried
+
+
+@pytest.mark.asyncio
+async def test_outgoing_ops_are_paced_by_send_rate():
+    client, ws = _client(symbols=10, send_rate=50, max_args_per_op=2)
+    start = time.monotonic()
+
+    await client._resubscribe_all()
+
+    assert len(ws.sent) == 5
+    assert time.monotonic() - start >= 4 / 50 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_resync_request_resubscribes_only_owned_channel():
+    client, ws = _client(symbols=1)
+    owned = next(iter(client.channels))
+    foreign = SubscribeReq("USDT-FUTURES", "books", "OTHERUSDT")
+
+    client._stream_manager.resync_stream.on_next(foreign)
+    client._stream_manager.resync_stream.on_next(owned)
+    await asyncio.sleep(0.05)
+
+    assert [op["op"] for op in ws.ops] == ["unsubscribe", "subscribe"]
+    assert all(op["args"] == [owned.to_arg()] for op in ws.ops)
+    assert not client._background  # finished resync tasks are released
+
+
+def test_health_reports_silent_channels():
+    client, _ = _client(symbols=2)
+    fresh, silent = sorted(client.channels, key=lambda ch: ch.inst_id)
+    client.metrics.on_message(fresh.key, 100)
+
+    assert client.stale_channels(max_age=60) == {silent}
+    health = client.health()
+    assert health["name"] == "public"
+    assert health["channels"]["USDT-FUTURES/candle5m/SYM0USDT"]["messages"] == 1
+
+
+def _candle_frame(symbol: str, ts: int) -> str:
+    return json.dumps({
+        "action": "update",
+        "arg": {"instType": "USDT-FUTURES", "channel": "candle5m", "instId": symbol},
+        "data": [[str(ts), "1", "1", "1", "1", "1", "1", "1"]],
+        "ts": ts,
+    })
+
+
+@pytest.mark.asyncio
+async def test_replay_feeds_frames_through_receive_path():
+    client, _ = _client(symbols=1)
+    received = []
+    client._stream_manager.candle_stream["SYM0USDT"]["5m"].subscribe(received.append)
+    frames = [(0.0, "pong"), (0.0, _candle_frame("SYM0USDT", 300_000)), (0.0, _candle_frame("SYM0USDT", 600_000))]
+
+    assert await client.replay(frames) == 3
+    assert [c.ts for c in received] == [300_000, 600_000]
+    assert client.metrics.snapshot()["channels"]["USDT-FUTURES/candle5m/SYM0USDT"]["messages"] == 2
+    # the recorded exchange timestamps are decades old; they must not show up as push lag
+    assert client.metrics.snapshot()["lag"] == {}
+
+
+@pytest.mark.asyncio
+async def test_replay_keeps_recorded_pace_scaled_by_speed():
+    client, _ = _client(symbols=1)
+    frames = [(10.0, _candle_frame("SYM0USDT", 300_000)), (10.2, _candle_frame("SYM0USDT", 600_000))]
+
+    start = time.monotonic()
+    await client.replay(frames, speed=2)
+    assert 0.09 <= time.monotonic() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_failed_backfill_is_recorded_and_retried():
+    class FlakyBackfill:
+        def __init__(self):
+            self.calls = 0
+
+        async def fill(self, channels):
+            self.calls += 1
+            if self.calls < 3:
+                raise BackfillError(list(channels), RuntimeError("boom"))
+            return 0
+
+    backfill = FlakyBackfill()
+    client, _ = _client(symbols=1, backfill=backfill, backfill_retry_delay=0.01)
+
+    assert await client._run_backfill() is False
+    await asyncio.wait_for(client._retry_backfill(), 1)
+
+    assert backfill.calls == 3
+    health = client.health()
+    assert health["backfill_failures"] == 2
+    assert "boom" in health["last_backfill_error"]
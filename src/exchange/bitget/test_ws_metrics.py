@@ -0,0 +1,53 @@
+import time
+
+from exchange.bitget.ws_metrics import ConnectionMetrics, percentiles
+
+KEY = ("USDT-FUTURES", "candle5m", "BTCUSDT")
+OTHER = ("USDT-FUTURES", "candle5m", "ETHUSDT")
+
+
+def test_percentiles_nearest_rank():
+    assert percentiles([]) == {}
+    result = percentiles(range(101))
+    assert result == {"p50": 50, "p90": 90, "p99": 99}
+
+
+def test_ping_rtt_is_measured_from_ping_to_pong():
+    metrics = ConnectionMetrics()
+    metrics.on_pong()  # unsolicited pong has nothing to time
+    assert metrics.last_rtt is None
+
+    metrics.on_ping()
+    metrics.on_pong()
+    assert 0 <= metrics.last_rtt < 1
+    assert "p50" in metrics.snapshot()["ping_rtt"]
+
+
+def test_channel_counters_rates_and_lag():
+    metrics = ConnectionMetrics(rate_window=10)
+    now_ms = int(time.time() * 1000)
+    for _ in range(5):
+        metrics.on_message(KEY, 100, now_ms - 250)
+    metrics.on_message(None, 40)  # events count towards liveness only
+
+    snapshot = metrics.snapshot()
+    channel = snapshot["channels"]["USDT-FUTURES/candle5m/BTCUSDT"]
+    assert channel["messages"] == 5
+    assert channel["bytes"] == 500
+    assert channel["messages_per_sec"] == 0.5
+    assert channel["bytes_per_sec"] == 50
+    assert 0.2 <= snapshot["lag"]["p50"] < 1
+
+
+def test_reconnects_and_stale_channels():
+    metrics = ConnectionMetrics()
+    metrics.on_connected()
+    metrics.on_disconnected()
+    metrics.on_connected()
+    assert metrics.reconnects == 1
+
+    metrics.on_message(KEY, 10)
+    assert metrics.stale_channels([KEY, OTHER], max_age=60) == [OTHER]
+    metrics._channels[KEY].last_at -= 120
+    assert metrics.stale_channels([KEY], max_age=60) == [KEY]
+    assert metrics.since_last_message(KEY) >= 120
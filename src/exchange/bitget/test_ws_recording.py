@@ -0,0 +1,35 @@
+import gzip
+
+from exchange.bitget.ws_recording import FrameRecorder, read_frames
+
+
+def test_recording_round_trips_and_appends(tmp_path):
+    path = str(tmp_path / "session.gz")
+    with FrameRecorder(path) as recorder:
+        recorder.record('{"event":"subscribe"}', received_at=1.5)
+        recorder.record("pong", received_at=2.25)
+    with FrameRecorder(path) as recorder:
+        recorder.record('{"data":[]}', received_at=3.0)
+
+    assert list(read_frames(path)) == [(1.5, '{"event":"subscribe"}'), (2.25, "pong"), (3.0, '{"data":[]}')]
+
+
+def test_truncated_recording_keeps_complete_frames(tmp_path):
+    path = tmp_path / "session.gz"
+    with FrameRecorder(str(path)) as recorder:
+        for i in range(100):
+            recorder.record(f'{{"i":{i}}}', received_at=float(i))
+    data = path.read_bytes()
+    path.write_bytes(data[: len(data) // 2])
+
+    frames = list(read_frames(str(path)))
+    assert len(frames) < 100
+    assert [ts for ts, _ in frames] == [float(i) for i in range(len(frames))]
+
+
+def test_file_is_gzip(tmp_path):
+    path = str(tmp_path / "session.gz")
+    with FrameRecorder(path) as recorder:
+        recorder.record("pong", received_at=1.0)
+    with gzip.open(path, "rt") as f:
+        assert f.read() == "1.000000\tpong\n"
@@ -0,0 +1,84 @@
+import dataclasses
+import logging
+import time
+from decimal import Decimal
+from typing import Callable, Dict, Optional
+
+from exchange.bitget.future.future_market_client import BitgetFutureMarketClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Quote:
+    """
+    Latest top-of-book for a symbol, from the `ticker` channel or the REST ticker (`source`).
+    `ts` is the exchange timestamp (ms), `received_at` the local monotonic time it arrived.
+    """
+    symbol: str
+    bid: Decimal
+    ask: Decimal
+    last: Decimal
+    mark: Optional[Decimal]
+    ts: int
+    received_at: float
+    source: str = "ws"
+
+    @classmethod
+    def from_ticker(cls, item: dict, received_at: Optional[float] = None) -> "Quote":
+        """Both the WS push (`instId`) and the REST ticker (`symbol`) share these fields."""
+        mark = item.get("markPrice")
+        inst_id = item.get("instId")
+        return cls(
+            inst_id or item["symbol"],
+            Decimal(item["bidPr"]),
+            Decimal(item["askPr"]),
+            Decimal(item["lastPr"]),
+            Decimal(mark) if mark else None,
+            int(item["ts"]),
+            time.monotonic() if received_at is None else received_at,
+            "ws" if inst_id else "rest",
+        )
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.received_at
+
+
+class TickerCache:
+    """
+    Live quote cache fed by the public `ticker` channel.
+    `get_quote()` only goes to REST when the cached quote is missing or older than `max_age`.
+    """
+
+    def __init__(self, market_client_factory: Optional[Callable[[], BitgetFutureMarketClient]] = None):
+        # resolved lazily so the cache can be built before an event loop exists
+        self._market_client_factory = market_client_factory
+        self._quotes: Dict[str, Quote] = {}
+
+    def update(self, quote: Quote) -> None:
+        current = self._quotes.get(quote.symbol)
+        # exchange ts only orders quotes of the same source; across WS and REST the later arrival
+        # wins, so a REST fallback stamped ahead of the push stream cannot pin the cache
+        if (
+            current is None
+            or quote.ts >= current.ts
+            or (quote.source != current.source and quote.received_at > current.received_at)
+        ):
+            self._quotes[quote.symbol] = quote
+
+    def get(self, symbol: str) -> Optional[Quote]:
+        return self._quotes.get(symbol)
+
+    async def get_quote(self, symbol: str, max_age: float = 1.0) -> Quote:
+        quote = self._quotes.get(symbol)
+        if quote is not None and time.monotonic() - quote.received_at <= max_age:
+            return quote
+        if self._market_client_factory is None:
+            raise LookupError(f"No quote for {symbol} within {max_age}s and no REST fallback configured")
+
+        logger.debug(f"Quote for {symbol} missing or stale, falling back to REST ticker")
+        res = await self._market_client_factory().ticker(symbol)
+        quote = Quote.from_ticker(res["data"][0])
+        self.update(quote)
+        return quote
@@ -0,0 +1,40 @@
+import re
+from datetime import datetime
+
+_UNIT_MS = {
+    "s": 1_000,
+    "m": 60_000,
+    "min": 60_000,
+    "h": 3_600_000,
+    "hour": 3_600_000,
+    "d": 86_400_000,
+    "day": 86_400_000,
+    "w": 604_800_000,
+    "week": 604_800_000,
+}
+
+_INTERVAL_RE = re.compile(r"^(\d+)([a-zA-Z]+)$")
+
+
+def interval_to_ms(interval: str) -> int:
+    """
+    Convert an interval such as "90s", "5m", "1H", "4h", "1D", "1W" or the spot
+    granularities "1min", "1hour", "1day", "1week" to milliseconds.
+    Raises ValueError for unknown units (months are not a fixed length).
+    """
+    match = _INTERVAL_RE.match(interval.strip())
+    if not match:
+        raise ValueError(f"Invalid interval: {interval!r}")
+    count, unit = int(match.group(1)), match.group(2)
+    # "1M" is a month in Bitget's notation, "1m" a minute
+    if unit == "M":
+        raise ValueError(f"Month intervals are not supported: {interval!r}")
+    unit_ms = _UNIT_MS.get(unit.lower())
+    if unit_ms is None or count <= 0:
+        raise ValueError(f"Invalid interval: {interval!r}")
+    return count * unit_ms
+
+
+def to_ms(value: datetime | int) -> int:
+    """Epoch milliseconds from a datetime or an int that already is epoch milliseconds."""
+    return int(value.timestamp() * 1000) if isinstance(value, datetime) else int(value)
@@ -0,0 +1,28 @@
+import pytest
+
+from exchange.bitget.utils.interval import interval_to_ms
+
+
+@pytest.mark.parametrize(
+    "interval, expected",
+    [
+        ("90s", 90_000),
+        ("1m", 60_000),
+        ("5m", 300_000),
+        ("7min", 420_000),
+        ("1H", 3_600_000),
+        ("4h", 14_400_000),
+        ("1hour", 3_600_000),
+        ("1D", 86_400_000),
+        ("1day", 86_400_000),
+        ("1W", 604_800_000),
+    ],
+)
+def test_interval_to_ms(interval, expected):
+    assert interval_to_ms(interval) == expected
+
+
+@pytest.mark.parametrize("interval", ["", "m", "5x", "0m", "1M", "-1m"])
+def test_interval_to_ms_invalid(interval):
+    with pytest.raises(ValueError):
+        interval_to_ms(interval)
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+import math
+from typing import Dict, List, Set
+
+from exchange.bitget.dto.websocket import SubscribeReq
+from exchange.bitget.stream_manager import BitgetStreamManager
+from exchange.bitget.websocket_public_client import BitgetWebsocketClient
+
+logger = logging.getLogger(__name__)
+
+
+class BitgetWebsocketPool:
+    """
+    Spreads the stream manager's channels over several BitgetWebsocketClient shards,
+    each holding at most `max_channels_per_connection` subscriptions.
+
+    Every shard runs its own connect/reconnect loop and receiver, so a drop on one
+    shard only resubscribes that shard's channels.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        stream_manager: BitgetStreamManager,
+        max_channels_per_connection: int = 50,
+        **client_kwargs,
+    ):
+        if max_channels_per_connection <= 0:
+            raise ValueError("max_channels_per_connection must be positive")
+        self._url = url
+        self._stream_manager = stream_manager
+        self._max_channels = max_channels_per_connection
+        self._client_kwargs = client_kwargs
+
+        self._shards: List[BitgetWebsocketClient] = []
+        self._owner: Dict[SubscribeReq, BitgetWebsocketClient] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._running = False
+
+        channels = list(dict.fromkeys(stream_manager.channels))
+        shard_count = max(1, math.ceil(len(channels) / self._max_channels))
+        # round-robin keeps shards evenly loaded instead of filling the first ones up to the cap
+        buckets: List[List[SubscribeReq]] = [[] for _ in range(shard_count)]
+        for i, ch in enumerate(channels):
+            buckets[i % shard_count].append(ch)
+        for bucket in buckets:
+            self._add_shard(bucket)
+
+    @property
+    def shards(self) -> List[BitgetWebsocketClient]:
+        return self._shards
+
+    def _add_shard(self, channels: List[SubscribeReq]) -> BitgetWebsocketClient:
+        shard = BitgetWebsocketClient(
+            self._url,
+            self._stream_manager,
+            channels=channels,
+            name=f"public-{len(self._shards)}",
+            **self._client_kwargs,
+        )
+        self._shards.append(shard)
+        for ch in channels:
+            self._owner[ch] = shard
+        if self._running:
+            self._tasks.append(asyncio.create_task(shard.connect()))
+        return shard
+
+    async def connect(self):
+        self._running = True
+        self._tasks = [asyncio.create_task(shard.connect()) for shard in self._shards]
+        # shards added by subscribe() while running append to self._tasks
+        while self._tasks:
+            tasks = list(self._tasks)
+            await asyncio.gather(*tasks)
+            self._tasks = [t for t in self._tasks if t not in tasks]
+
+    async def wait_connected(self):
+        await asyncio.gather(*(shard.wait_connected() for shard in self._shards))
+
+    def health(self) -> List[dict]:
+        """Per-shard metrics snapshots (see BitgetWebsocketClient.health)."""
+        return [shard.health() for shard in self._shards]
+
+    def stale_channels(self, max_age: float) -> Set[SubscribeReq]:
+        return set().union(*(shard.stale_channels(max_age) for shard in self._shards))
+
+    @property
+    def reconnects(self) -> int:
+        return sum(shard.metrics.reconnects for shard in self._shards)
+
+    async def subscribe(self, channels: List[SubscribeReq]):
+        new = [ch for ch in dict.fromkeys(channels) if ch not in self._owner]
+        if not new:
+            logger.info("No new subscriptions")
+            return
+
+        assigned: Dict[BitgetWebsocketClient, List[SubscribeReq]] = {}
+        for ch in new:
+            shard = min(self._shards, key=lambda s: len(s.channels) + len(assigned.get(s, ())))
+            if len(shard.channels) + len(assigned.get(shard, ())) >= self._max_channels:
+                shard = self._add_shard([])
+            assigned.setdefault(shard, []).append(ch)
+            self._owner[ch] = shard
+
+        await asyncio.gather(*(shard.subscribe(chs) for shard, chs in assigned.items()))
+
+    async def unsubscribe(self, channels: List[SubscribeReq]):
+        by_shard: Dict[BitgetWebsocketClient, List[SubscribeReq]] = {}
+        for ch in dict.fromkeys(channels):
+            shard = self._owner.pop(ch, None)
+            if shard is not None:
+                by_shard.setdefault(shard, []).append(ch)
+        if not by_shard:
+            logger.info("No subscriptions to remove")
+            return
+        await asyncio.gather(*(shard.unsubscribe(chs) for shard, chs in by_shard.items()))
+
+    async def close(self):
+        self._running = False
+        await asyncio.gather(*(shard.close() for shard in self._shards))
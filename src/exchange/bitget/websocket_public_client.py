@@ -1,34 +1,51 @@
 import asyncio
 import json
 import logging
-from typing import List, Optional, Set
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 from websockets import ConnectionClosed
 from websockets.asyncio.client import connect
 
-from exchange.bitget.dto.websocket import BaseWsReq, SubscribeReq
+from exchange.bitget.candle_backfill import BackfillError, CandleBackfiller
+from exchange.bitget.dto.websocket import BaseWsReq, SubscribeReq, arg_key
 from exchange.bitget.stream_manager import BitgetStreamManager
+from exchange.bitget.ws_metrics import ConnectionMetrics
+from exchange.bitget.ws_recording import FrameRecorder
+from shared.utils.iterable import chunks
+from shared.utils.token_bucket import TokenBucket
 
-logger = logging.getLogger("websockets")
-logger.setLevel(logging.DEBUG)
-logger.addHandler(logging.StreamHandler())
+logger = logging.getLogger(__name__)
+# websockets logs every frame at DEBUG; keep it out of the hot receive path
+logging.getLogger("websockets").setLevel(logging.INFO)
 
 WS_PING = 'ping'
 WS_OP_LOGIN = 'login'
 WS_OP_SUBSCRIBE = "subscribe"
 WS_OP_UNSUBSCRIBE = "unsubscribe"
-
-
-async def _heartbeat(ws):
-    while True:
-        await ws.send("ping")
-        await asyncio.sleep(30)
+# frames fed between event loop yields when replaying at full speed
+REPLAY_YIELD_EVERY = 1000
 
 
 class BitgetWebsocketClient:
     """
     Async WebSocket client for Bitget with automatic reconnect,
     heartbeat, and subscription management.
+
+    Outgoing ops (including pings) are paced by a token bucket at `send_rate` ops/s and
+    subscription args are sent `max_args_per_op` at a time, so a full resubscribe of n
+    channels is on the wire within ceil(n / max_args_per_op) / send_rate seconds.
+    Every subscribe arg waits for its `{"event":"subscribe"}` ack; args that are rejected
+    or not acked within `ack_timeout` are resent up to `max_subscribe_retries` times.
+
+    With a `backfill`, every reconnect first fetches the candles missed while disconnected
+    and only then resubscribes, so candle streams resume without holes. If that fetch fails the
+    failure is counted in `metrics`, live data resumes anyway and the gap is retried in the
+    background every `backfill_retry_delay` seconds (doubling) until it is filled.
+
+    `metrics` tracks ping RTT, push lag, per-channel rates and silence; see `health()`.
+    A `recorder` captures every received frame; `replay()` feeds such a recording back
+    through the same frame handling without a connection.
     """
 
     def __init__(
@@ -38,59 +55,255 @@ class BitgetWebsocketClient:
         reconnect_delay: int = 1,
         max_reconnect_delay: int = 60,
         heartbeat_interval: int = 30,
+        channels: Optional[Iterable[SubscribeReq]] = None,
+        name: str = "public",
+        send_rate: float = 8,  # Bitget allows 10 messages/s per connection, keep headroom
+        max_args_per_op: int = 20,
+        ack_timeout: float = 5,
+        max_subscribe_retries: int = 5,
+        backfill: Optional[CandleBackfiller] = None,
+        recorder: Optional[FrameRecorder] = None,
+        backfill_retry_delay: float = 5,
     ):
         self._stream_manager = stream_manager
+        self.name = name
 
         self._url = url
         self._reconnect_delay = reconnect_delay
         self._max_reconnect_delay = max_reconnect_delay
         self._heartbeat_interval = heartbeat_interval
+        self._backfill = backfill
+        self._backfill_retry_delay = backfill_retry_delay
+        self._recorder = recorder
 
         self._ws: Optional[asyncio.StreamReader] = None
-        self._channels: Set[SubscribeReq] = set(stream_manager.channels)
+        self._channels: Set[SubscribeReq] = set(stream_manager.channels if channels is None else channels)
         self._stop_event = asyncio.Event()
         self._connected_event = asyncio.Event()
 
+        self._send_limiter = TokenBucket(rate=send_rate, capacity=1)
+        self._max_args_per_op = max_args_per_op
+        self._ack_timeout = ack_timeout
+        self._max_subscribe_retries = max_subscribe_retries
+        # (instType, channel, instId) -> monotonic time the subscribe op went out
+        self._pending: Dict[Tuple[str, str, str], float] = {}
+        self._attempts: Dict[Tuple[str, str, str], int] = {}
+        self._rejected: Set[Tuple[str, str, str]] = set()
+        self._acked: Set[Tuple[str, str, str]] = set()
+        self.metrics = ConnectionMetrics()
+        # strong references to fire-and-forget tasks so they are not collected mid-flight
+        self._background: Set[asyncio.Task] = set()
+        stream_manager.resync_stream.subscribe(self._on_resync)
+
     async def connect(self):
         delay = self._reconnect_delay
         while not self._stop_event.is_set():
+            tasks: List[asyncio.Task] = []
             try:
-                logger.info(f"Connecting to {self._url}")
+                logger.info(f"[{self.name}] Connecting to {self._url}")
                 async with connect(self._url, ping_interval=None, ping_timeout=None) as ws:
                     self._ws = ws
+                    await self._on_connected()
+                    backfilled = self._backfill is None or await self._run_backfill()
+                    self.metrics.on_connected()
                     self._connected_event.set()
                     delay = self._reconnect_delay
-                    hb_task = asyncio.create_task(self._heartbeat())
-                    await self._resubscribe_all()
+                    if not backfilled:
+                        tasks.append(asyncio.create_task(self._retry_backfill()))
+                    tasks.append(asyncio.create_task(self._heartbeat()))
+                    tasks.append(asyncio.create_task(self._ack_watchdog()))
+                    # paced resubscribe runs alongside the receiver so acks are read as they arrive
+                    tasks.append(asyncio.create_task(self._resubscribe_all()))
                     await self._receiver_loop()
             except ConnectionClosed as e:
-                logger.warning(f"Connection closed: {e}. Reconnect in {delay}s...")
+                logger.warning(f"[{self.name}] Connection closed: {e}. Reconnect in {delay}s...")
             except Exception as e:
-                logger.exception(f"Error: {e}. Reconnect in {delay}s...")
+                logger.exception(f"[{self.name}] Error: {e}. Reconnect in {delay}s...")
             finally:
                 self._connected_event.clear()
+                self.metrics.on_disconnected()
+                self._ws = None
+                for task in tasks:
+                    task.cancel()
+            if self._stop_event.is_set():
+                break
             await asyncio.sleep(delay)
             delay = min(delay * 2, self._max_reconnect_delay)
 
+    async def _on_connected(self):
+        """Hook run on every new connection before subscriptions are replayed."""
+
     async def wait_connected(self):
         await self._connected_event.wait()
 
+    async def _run_backfill(self) -> bool:
+        """Fill the candles missed while disconnected; False if the gap is still missing."""
+        try:
+            await self._backfill.fill(self._channels)
+        except BackfillError as e:
+            self.metrics.on_backfill_failed(e)
+            logger.error(f"[{self.name}] {e}")
+            return False
+        return True
+
+    async def _retry_backfill(self):
+        """Retry a failed backfill until it succeeds; cancelled with the connection."""
+        delay = self._backfill_retry_delay
+        while True:
+            await asyncio.sleep(delay)
+            if await self._run_backfill():
+                logger.info(f"[{self.name}] Candle gap backfilled on retry")
+                return
+            delay = min(delay * 2, self._max_reconnect_delay)
+
+    def health(self) -> dict:
+        """Metrics snapshot plus the channels that went silent, for alerting on a stale feed."""
+        return {
+            "name": self.name,
+            "connected": self._connected_event.is_set(),
+            **self.metrics.snapshot(),
+            "live_channels": len(self.live_channels),
+            "pending_channels": len(self.pending_channels),
+        }
+
+    def stale_channels(self, max_age: float) -> Set[SubscribeReq]:
+        """Subscribed channels with no push within `max_age` seconds (or none at all yet)."""
+        by_key = {ch.key: ch for ch in self._channels}
+        return {by_key[key] for key in self.metrics.stale_channels(by_key, max_age)}
+
+    @property
+    def channels(self) -> Set[SubscribeReq]:
+        return self._channels
+
+    @property
+    def live_channels(self) -> Set[SubscribeReq]:
+        """Channels the exchange has acknowledged on the current connection."""
+        return {ch for ch in self._channels if ch.key in self._acked}
+
+    @property
+    def pending_channels(self) -> Set[SubscribeReq]:
+        """Channels sent but not yet acknowledged (or waiting for a retry)."""
+        waiting = self._pending.keys() | self._rejected
+        return {ch for ch in self._channels if ch.key in waiting}
+
     async def _receiver_loop(self):
         assert self._ws is not None
+        on_frame = self._on_frame
+        recorder = self._recorder
         async for raw in self._ws:
-            try:
-                if "pong" == raw:
-                    continue
-                msg = json.loads(raw)
-                logger.debug(f"Received: {msg}")
-            except json.JSONDecodeError:
-                logger.error(f"Invalid JSON: {raw}")
+            if recorder is not None:
+                recorder.record(raw)
+            if on_frame(raw):
+                # stop reading (and let TCP push back) until BLOCK subscribers drain
+                await self._stream_manager.wait_writable()
+
+    def _on_frame(self, raw: str, live: bool = True) -> bool:
+        """
+        Decode and route one received frame. Returns True when a BLOCK subscriber is full
+        and the caller should await `wait_writable()` before feeding the next frame.
+        Replayed frames (`live=False`) carry recorded exchange timestamps, so they are kept
+        out of the push lag samples.
+        """
+        if "pong" == raw:
+            self.metrics.on_pong()
+            return False
+        try:
+            msg = json.loads(raw)
+        except json.JSONDecodeError:
+            logger.error(f"Invalid JSON: {raw}")
+            return False
+        arg = msg.get("arg")
+        self.metrics.on_message(arg_key(arg) if arg and "data" in msg else None, len(raw), msg.get("ts") if live else None)
+        if not self._stream_manager.dispatch(msg):
+            self._handle_event(msg)
+            return False
+        return self._stream_manager.backpressured
+
+    async def replay(self, frames: Iterable[Tuple[float, str]], speed: Optional[float] = None) -> int:
+        """
+        Feed recorded (receive time, raw frame) pairs through the live receive path, except
+        that push lag is not sampled from their recorded exchange timestamps.
+        `speed=None` replays as fast as possible, otherwise at `speed` x the recorded pace.
+        Returns the number of frames replayed.
+        """
+        on_frame = self._on_frame
+        first_ts = started = None
+        count = 0
+        for ts, raw in frames:
+            if speed is not None:
+                if first_ts is None:
+                    first_ts, started = ts, time.monotonic()
+                delay = (ts - first_ts) / speed - (time.monotonic() - started)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            if on_frame(raw, False):
+                await self._stream_manager.wait_writable()
+            count += 1
+            if speed is None and count % REPLAY_YIELD_EVERY == 0:
+                # let subscriber tasks drain between bursts
+                await asyncio.sleep(0)
+        return count
+
+    def _handle_event(self, msg: dict):
+        event = msg.get("event")
+        arg = msg.get("arg")
+        key = arg_key(arg) if arg else None
+        if event == "subscribe":
+            if key is not None:
+                self._pending.pop(key, None)
+                self._attempts.pop(key, None)
+                self._acked.add(key)
+        elif event == "unsubscribe":
+            if key is not None:
+                self._pending.pop(key, None)
+                self._acked.discard(key)
+        elif event == "error":
+            logger.error(f"[{self.name}] Error event: {msg}")
+            if key is not None and key in self._pending:
+                self._pending.pop(key)
+                self._rejected.add(key)
+        elif event is not None:
+            logger.info(f"[{self.name}] Event: {msg}")
+
+    async def _ack_watchdog(self):
+        while True:
+            await asyncio.sleep(self._ack_timeout / 2)
+            await self._retry_unacked()
+
+    async def _retry_unacked(self):
+        now = time.monotonic()
+        keys = {key for key, sent_at in self._pending.items() if now - sent_at >= self._ack_timeout}
+        keys |= self._rejected
+        self._rejected.clear()
+        if not keys:
+            return
+
+        by_key = {ch.key: ch for ch in self._channels}
+        retry = []
+        for key in keys:
+            ch = by_key.get(key)
+            if ch is None:
+                # unsubscribed while waiting for the ack
+                self._pending.pop(key, None)
+                continue
+            attempts = self._attempts.get(key, 0) + 1
+            if attempts > self._max_subscribe_retries:
+                self._pending.pop(key, None)
+                logger.error(f"[{self.name}] Giving up on {ch.to_arg()} after {attempts - 1} retries")
+                continue
+            self._attempts[key] = attempts
+            retry.append(ch)
+        if retry:
+            logger.warning(f"[{self.name}] Retrying {len(retry)} unacknowledged subscriptions")
+            await self._send(WS_OP_SUBSCRIBE, [ch.to_arg() for ch in retry])
 
     async def _heartbeat(self):
         assert self._ws is not None
         while True:
             try:
+                await self._send_limiter.acquire()
                 await self._ws.send(WS_PING)
+                self.metrics.on_ping()
                 logger.debug("Ping sent")
             except Exception as e:
                 logger.warning(f"Heartbeat error: {e}")
@@ -98,21 +311,29 @@ class BitgetWebsocketClient:
             await asyncio.sleep(self._heartbeat_interval)
 
     async def _send(self, op: str, args: List[dict]):
-        if not self._ws:
-            logger.error("Not connected, cannot send")
-            return
-        payload = BaseWsReq(op, args)
-        msg = json.dumps(payload, default=lambda o: o.__dict__)
-        logger.debug(f"Sending: {msg}")
-        await self._ws.send(msg)
+        for chunk in chunks(args, self._max_args_per_op):
+            await self._send_limiter.acquire()
+            if not self._ws:
+                logger.error(f"[{self.name}] Not connected, cannot send")
+                return
+            payload = BaseWsReq(op, chunk)
+            msg = json.dumps(payload, default=lambda o: o.__dict__)
+            logger.debug(f"Sending: {msg}")
+            await self._ws.send(msg)
+            if op == WS_OP_SUBSCRIBE:
+                sent_at = time.monotonic()
+                for arg in chunk:
+                    self._pending[arg_key(arg)] = sent_at
 
     async def subscribe(self, channels: List[SubscribeReq]):
         new = [ch for ch in channels if ch not in self._channels]
         if not new:
             logger.info("No new subscriptions")
             return
+        for ch in new:
+            self._stream_manager.register(ch)
         self._channels.update(new)
-        await self._send(WS_OP_SUBSCRIBE, [vars(ch) for ch in new])
+        await self._send(WS_OP_SUBSCRIBE, [ch.to_arg() for ch in new])
 
     async def unsubscribe(self, channels: List[SubscribeReq]):
         rem = [ch for ch in channels if ch in self._channels]
@@ -121,12 +342,37 @@ class BitgetWebsocketClient:
             return
         for ch in rem:
             self._channels.remove(ch)
-        await self._send(WS_OP_UNSUBSCRIBE, [vars(ch) for ch in rem])
+            self._pending.pop(ch.key, None)
+            self._attempts.pop(ch.key, None)
+        await self._send(WS_OP_UNSUBSCRIBE, [ch.to_arg() for ch in rem])
+
+    def _on_resync(self, req: SubscribeReq):
+        # only the connection carrying the channel rebuilds it
+        if req in self._channels and self._ws:
+            task = asyncio.get_running_loop().create_task(self._resync(req))
+            self._background.add(task)
+            task.add_done_callback(self._on_background_done)
+
+    def _on_background_done(self, task: asyncio.Task) -> None:
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"[{self.name}] Background task failed: {task.exception()!r}")
+
+    async def _resync(self, req: SubscribeReq):
+        """Unsubscribe and subscribe again so the exchange pushes a fresh snapshot."""
+        logger.info(f"[{self.name}] Resyncing {req.to_arg()}")
+        self._acked.discard(req.key)
+        await self._send(WS_OP_UNSUBSCRIBE, [req.to_arg()])
+        await self._send(WS_OP_SUBSCRIBE, [req.to_arg()])
 
     async def _resubscribe_all(self):
+        self._pending.clear()
+        self._attempts.clear()
+        self._rejected.clear()
+        self._acked.clear()
         if self._channels:
-            logger.info(f"Resubscribing: {self._channels}")
-            await self._send(WS_OP_SUBSCRIBE, [vars(ch) for ch in self._channels])
+            logger.info(f"[{self.name}] Resubscribing {len(self._channels)} channels")
+            await self._send(WS_OP_SUBSCRIBE, [ch.to_arg() for ch in self._channels])
 
     async def close(self):
         self._stop_event.set()
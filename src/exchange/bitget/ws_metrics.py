@@ -0,0 +1,152 @@
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# (instType, channel, instId)
+ChannelKey = Tuple[str, str, str]
+
+
+def percentiles(samples: Iterable[float], qs: Iterable[float] = (50, 90, 99)) -> Dict[str, float]:
+    """Nearest-rank percentiles, e.g. {"p50": ..., "p99": ...}; empty when there are no samples."""
+    ordered = sorted(samples)
+    if not ordered:
+        return {}
+    last = len(ordered) - 1
+    return {f"p{q:g}": ordered[min(last, int(round(q / 100 * last)))] for q in qs}
+
+
+class _ChannelStats:
+    __slots__ = ("messages", "bytes", "last_at", "_buckets")
+
+    def __init__(self, window: int):
+        self.messages = 0
+        self.bytes = 0
+        self.last_at: Optional[float] = None
+        # [second, messages, bytes] for each second of the rate window
+        self._buckets: deque = deque(maxlen=window)
+
+    def add(self, nbytes: int, now: float) -> None:
+        self.messages += 1
+        self.bytes += nbytes
+        self.last_at = now
+        second = int(now)
+        buckets = self._buckets
+        if buckets and buckets[-1][0] == second:
+            bucket = buckets[-1]
+            bucket[1] += 1
+            bucket[2] += nbytes
+        else:
+            buckets.append([second, 1, nbytes])
+
+    def rates(self, window: int, now: float) -> Tuple[float, float]:
+        since = int(now) - window
+        messages = nbytes = 0
+        for second, m, b in self._buckets:
+            if second > since:
+                messages += m
+                nbytes += b
+        return messages / window, nbytes / window
+
+
+class ConnectionMetrics:
+    """
+    Health counters of one WebSocket connection, updated inline by the receive loop.
+
+    Lag is local receive time minus the exchange `ts` of a push; it includes clock skew,
+    so watch its trend rather than its absolute value. Rates are averaged over the last
+    `rate_window` seconds; RTT and lag percentiles over the last `sample_size` samples.
+    """
+
+    def __init__(self, rate_window: int = 10, sample_size: int = 1024):
+        self.rate_window = rate_window
+        self.connects = 0
+        self.connected_at: Optional[float] = None
+        self.last_message_at: Optional[float] = None
+        self._ping_sent_at: Optional[float] = None
+        self._rtts: deque = deque(maxlen=sample_size)
+        self._lags: deque = deque(maxlen=sample_size)
+        self._channels: Dict[ChannelKey, _ChannelStats] = {}
+        self.backfill_failures = 0
+        self.last_backfill_error: Optional[str] = None
+
+    @property
+    def reconnects(self) -> int:
+        return max(0, self.connects - 1)
+
+    @property
+    def last_rtt(self) -> Optional[float]:
+        return self._rtts[-1] if self._rtts else None
+
+    def on_connected(self) -> None:
+        self.connects += 1
+        self.connected_at = time.monotonic()
+        self._ping_sent_at = None
+
+    def on_disconnected(self) -> None:
+        self.connected_at = None
+
+    def on_backfill_failed(self, error: BaseException) -> None:
+        self.backfill_failures += 1
+        self.last_backfill_error = str(error)
+
+    def on_ping(self) -> None:
+        self._ping_sent_at = time.monotonic()
+
+    def on_pong(self) -> None:
+        now = time.monotonic()
+        self.last_message_at = now
+        if self._ping_sent_at is not None:
+            self._rtts.append(now - self._ping_sent_at)
+            self._ping_sent_at = None
+
+    def on_message(self, key: Optional[ChannelKey], nbytes: int, exchange_ts: Optional[int] = None) -> None:
+        now = time.monotonic()
+        self.last_message_at = now
+        if exchange_ts is not None:
+            self._lags.append(time.time() - int(exchange_ts) / 1000)
+        if key is None:
+            return
+        stats = self._channels.get(key)
+        if stats is None:
+            stats = self._channels[key] = _ChannelStats(self.rate_window)
+        stats.add(nbytes, now)
+
+    def since_last_message(self, key: ChannelKey) -> Optional[float]:
+        """Seconds since the channel's last push, None if it never pushed."""
+        stats = self._channels.get(key)
+        if stats is None or stats.last_at is None:
+            return None
+        return time.monotonic() - stats.last_at
+
+    def stale_channels(self, keys: Iterable[ChannelKey], max_age: float) -> List[ChannelKey]:
+        """Channels among `keys` that never pushed or have been silent for more than `max_age` seconds."""
+        stale = []
+        for key in keys:
+            age = self.since_last_message(key)
+            if age is None or age > max_age:
+                stale.append(key)
+        return stale
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        channels = {}
+        for key, stats in self._channels.items():
+            msg_rate, byte_rate = stats.rates(self.rate_window, now)
+            channels["/".join(key)] = {
+                "messages": stats.messages,
+                "bytes": stats.bytes,
+                "messages_per_sec": msg_rate,
+                "bytes_per_sec": byte_rate,
+                "since_last_message": now - stats.last_at,
+            }
+        return {
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "uptime": None if self.connected_at is None else now - self.connected_at,
+            "since_last_message": None if self.last_message_at is None else now - self.last_message_at,
+            "ping_rtt": {"last": self.last_rtt, **percentiles(self._rtts)},
+            "lag": percentiles(self._lags),
+            "backfill_failures": self.backfill_failures,
+            "last_backfill_error": self.last_backfill_error,
+            "channels": channels,
+        }
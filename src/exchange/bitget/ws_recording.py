@@ -0,0 +1,51 @@
+import gzip
+import time
+from typing import Iterator, Optional, Tuple
+
+# one frame per line: "<receive unix time>\t<raw frame>\n"
+SEPARATOR = "\t"
+
+
+class FrameRecorder:
+    """
+    Appends raw WebSocket frames with their local receive time to a gzip file.
+
+    Every open starts a new gzip member, so a recording can be resumed across restarts and
+    still reads back as one stream. Frames are JSON without newlines, so lines never split.
+    """
+
+    def __init__(self, path: str, compresslevel: int = 6):
+        self.path = path
+        self.frames = 0
+        self._file = gzip.open(path, "at", encoding="utf-8", compresslevel=compresslevel)
+
+    def record(self, raw: str, received_at: Optional[float] = None) -> None:
+        ts = time.time() if received_at is None else received_at
+        self._file.write(f"{ts:.6f}{SEPARATOR}{raw}\n")
+        self.frames += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "FrameRecorder":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+def read_frames(path: str) -> Iterator[Tuple[float, str]]:
+    """(receive time, raw frame) pairs of a recording, in the order they were received."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        try:
+            for line in f:
+                if not line.endswith("\n"):
+                    break
+                ts, _, raw = line[:-1].partition(SEPARATOR)
+                yield float(ts), raw
+        except EOFError:
+            # the recorder was killed mid-write; everything before the cut is still usable
+            return
@@ -0,0 +1,159 @@
+import asyncio
+import dataclasses
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import pytz
+from reactivex import Subject
+
+from exchange.kiwoom.ws_client import KiwoomWS
+from shared.utils.batch_writer import BatchWriter
+
+logger = logging.getLogger(__name__)
+
+KST = pytz.timezone("Asia/Seoul")
+
+ENTER = "I"  # 편입
+EXIT = "D"  # 이탈
+
+# REAL 메시지 type / values 필드
+REAL_TYPE_CONDITION = "02"
+FIELD_SEQ = "841"
+FIELD_SYMBOL = "9001"
+FIELD_EVENT_TYPE = "843"
+FIELD_TIME = "20"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ConditionEvent:
+    """
+    조건식 편입(I)/이탈(D) 이벤트.
+    source 는 실시간 REAL 푸시면 "realtime", 등록 응답의 종목 목록과 비교해 만든 이벤트면 "snapshot".
+    event_at 은 거래소 체결시간(KST, 없으면 수신시각), received_at 은 로컬 수신시각 (둘 다 KST naive).
+    """
+    condition_id: str
+    symbol: str
+    event_type: str
+    source: str
+    event_at: datetime
+    received_at: datetime
+    response: Dict[str, Any]
+
+    def to_record(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+def _now_kst() -> datetime:
+    return datetime.now(KST).replace(tzinfo=None)
+
+
+def _event_time(hhmmss: Optional[str], received_at: datetime) -> datetime:
+    if not hhmmss or len(hhmmss) != 6 or not hhmmss.isdigit():
+        return received_at
+    return received_at.replace(hour=int(hhmmss[:2]), minute=int(hhmmss[2:4]), second=int(hhmmss[4:]), microsecond=0)
+
+
+def _normalize_symbol(code: str) -> str:
+    # 조건검색 응답은 "A005930", REAL 푸시는 "005930" 형태로 내려옴
+    code = code.strip()
+    return code[1:] if code[:1] == "A" and code[1:].isdigit() else code
+
+
+class RealtimeConditionSearch:
+    """
+    키움 실시간 조건검색(search_type=1).
+
+    - start(): 조건식별 CNSRREQ(search_type=1) 등록, stop(): CNSRCLR 해제
+    - 등록 응답의 종목 목록은 현재 편입 종목과 비교해 차이만 이벤트로 만든다
+      (최초 등록은 전 종목 편입, 재연결 후 KiwoomWS 의 재등록 응답은 끊긴 동안의 변화만)
+    - 편입/이탈 이벤트는 `events` Subject 로 발행하고, writer 가 있으면 도착 즉시 저장 큐로 넘긴다
+    """
+
+    def __init__(self, ws: KiwoomWS, writer: Optional[BatchWriter] = None, request_interval: float = 0.3):
+        self.ws = ws
+        self.writer = writer
+        self.request_interval = request_interval
+        self.events = Subject()
+        # 조건식 seq -> 현재 편입 종목
+        self.members: Dict[str, Set[str]] = {}
+        self._active: Set[str] = set()
+
+    async def start(self, seqs: Iterable[str]) -> None:
+        for seq in seqs:
+            seq = seq.strip()
+            self._active.add(seq)
+            await self.ws.send({"trnm": "CNSRREQ", "seq": seq, "search_type": "1", "stex_tp": "K"})
+            await asyncio.sleep(self.request_interval)
+        logger.info(f"실시간 조건검색 등록: {sorted(self._active)}")
+
+    async def stop(self, seqs: Optional[Iterable[str]] = None) -> None:
+        for seq in list(self._active if seqs is None else seqs):
+            seq = seq.strip()
+            self._active.discard(seq)
+            self.members.pop(seq, None)
+            await self.ws.send({"trnm": "CNSRCLR", "seq": seq})
+
+    async def on_msg(self, msg: Dict[str, Any]) -> bool:
+        """실시간 조건검색 메시지면 처리 후 True, 아니면 False (다른 핸들러로 넘기도록)"""
+        match msg:
+            case {"trnm": "REAL", "data": data}:
+                events = [
+                    self._real_event(item)
+                    for item in data
+                    if item.get("type") == REAL_TYPE_CONDITION
+                ]
+                if not events and data:
+                    return False
+                await self._publish([e for e in events if e is not None])
+                return True
+            case {"trnm": "CNSRREQ", "seq": seq} if seq.strip() in self._active:
+                if msg.get("return_code") != 0:
+                    logger.error(f"실시간 조건검색 등록 실패 seq={seq.strip()}: {msg.get('return_msg')}")
+                    return True
+                await self._publish(self._snapshot_events(seq.strip(), msg.get("data") or []))
+                return True
+            case {"trnm": "CNSRCLR"}:
+                return True
+        return False
+
+    def _real_event(self, item: Dict[str, Any]) -> Optional[ConditionEvent]:
+        values = item.get("values", {})
+        seq = str(values.get(FIELD_SEQ, "")).strip()
+        symbol = _normalize_symbol(values.get(FIELD_SYMBOL) or item.get("item", ""))
+        event_type = values.get(FIELD_EVENT_TYPE)
+        if seq not in self._active or not symbol or event_type not in (ENTER, EXIT):
+            return None
+        members = self.members.setdefault(seq, set())
+        if event_type == ENTER:
+            members.add(symbol)
+        else:
+            members.discard(symbol)
+        received_at = _now_kst()
+        return ConditionEvent(
+            seq, symbol, event_type, "realtime", _event_time(values.get(FIELD_TIME), received_at), received_at, item
+        )
+
+    def _snapshot_events(self, seq: str, data: List[Dict[str, Any]]) -> List[ConditionEvent]:
+        current = {
+            _normalize_symbol(item.get("jmcode") or item.get(FIELD_SYMBOL) or ""): item for item in data
+        }
+        current.pop("", None)
+        previous = self.members.get(seq, set())
+        self.members[seq] = set(current)
+        received_at = _now_kst()
+        events = [
+            ConditionEvent(seq, symbol, ENTER, "snapshot", received_at, received_at, current[symbol])
+            for symbol in sorted(current.keys() - previous)
+        ]
+        events += [
+            ConditionEvent(seq, symbol, EXIT, "snapshot", received_at, received_at, {})
+            for symbol in sorted(previous - current.keys())
+        ]
+        return events
+
+    async def _publish(self, events: List[ConditionEvent]) -> None:
+        for event in events:
+            self.events.on_next(event)
+            if self.writer is not None:
+                await self.writer.put(event.to_record())
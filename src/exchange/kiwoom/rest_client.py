@@ -2,6 +2,8 @@ import logging
 from functools import cache
 from typing import Optional, Dict, Any
 
+from aiohttp import TCPConnector
+
 from exchange.bitget.client.bitget_client import BitgetClient
 
 logger = logging.getLogger(__name__)
@@ -13,8 +15,9 @@ class KiwoomRestClient(BitgetClient):
             base_url: str,
             app_key: str,
             app_secret: str,
+            connector: TCPConnector | None = None,
     ):
-        super().__init__(base_url=base_url)
+        super().__init__(base_url=base_url, connector=connector)
         self.app_key = app_key
         self.app_secret = app_secret
 
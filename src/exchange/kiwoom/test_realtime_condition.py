@@ -0,0 +1,87 @@
+import pytest
+
+from exchange.kiwoom.realtime_condition import RealtimeConditionSearch
+
+
+class FakeWS:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, msg):
+        self.sent.append(msg)
+
+
+class FakeWriter:
+    def __init__(self):
+        self.records = []
+
+    async def put(self, record):
+        self.records.append(record)
+
+
+def _real(seq: str, symbol: str, event_type: str, time: str = "091502") -> dict:
+    return {
+        "trnm": "REAL",
+        "data": [{
+            "type": "02",
+            "name": "조건검색",
+            "item": symbol,
+            "values": {"841": seq, "9001": symbol, "843": event_type, "20": time, "907": "2"},
+        }],
+    }
+
+
+async def _started(seqs=("4",)) -> tuple[RealtimeConditionSearch, list]:
+    search = RealtimeConditionSearch(FakeWS(), FakeWriter(), request_interval=0)
+    received = []
+    search.events.subscribe(received.append)
+    await search.start(list(seqs))
+    return search, received
+
+
+@pytest.mark.asyncio
+async def test_start_registers_realtime_search():
+    search, _ = await _started(["4", "5 "])
+    assert search.ws.sent == [
+        {"trnm": "CNSRREQ", "seq": "4", "search_type": "1", "stex_tp": "K"},
+        {"trnm": "CNSRREQ", "seq": "5", "search_type": "1", "stex_tp": "K"},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_real_push_publishes_and_persists_events():
+    search, received = await _started()
+    await search.on_msg({"trnm": "CNSRREQ", "seq": "4 ", "return_code": 0, "data": [{"jmcode": "A000660"}]})
+
+    assert await search.on_msg(_real("4", "005930", "I")) is True
+    assert await search.on_msg(_real("4", "000660", "D")) is True
+
+    assert [(e.symbol, e.event_type, e.source) for e in received] == [
+        ("000660", "I", "snapshot"),
+        ("005930", "I", "realtime"),
+        ("000660", "D", "realtime"),
+    ]
+    assert received[1].event_at.strftime("%H%M%S") == "091502"
+    assert search.members["4"] == {"005930"}
+    assert [r["symbol"] for r in search.writer.records] == ["000660", "005930", "000660"]
+
+
+@pytest.mark.asyncio
+async def test_resubscribe_snapshot_only_emits_changes():
+    search, received = await _started()
+    await search.on_msg({"trnm": "CNSRREQ", "seq": "4", "return_code": 0, "data": [{"jmcode": "A000660"}, {"jmcode": "A005930"}]})
+    received.clear()
+
+    # after a reconnect KiwoomWS re-registers and the server answers with the current members
+    await search.on_msg({"trnm": "CNSRREQ", "seq": "4", "return_code": 0, "data": [{"jmcode": "A005930"}, {"jmcode": "A035420"}]})
+
+    assert sorted((e.symbol, e.event_type) for e in received) == [("000660", "D"), ("035420", "I")]
+
+
+@pytest.mark.asyncio
+async def test_other_messages_are_left_to_the_caller():
+    search, received = await _started()
+    assert await search.on_msg({"trnm": "CNSRLST", "return_code": 0, "data": []}) is False
+    assert await search.on_msg({"trnm": "REAL", "data": [{"type": "0B", "values": {}}]}) is False
+    assert await search.on_msg(_real("9", "005930", "I")) is True  # not registered here: ignored
+    assert received == []
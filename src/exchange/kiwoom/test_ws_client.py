@@ -0,0 +1,168 @@
+import asyncio
+import json
+
+import pytest
+from websockets.asyncio.server import serve
+from websockets.protocol import State
+
+from exchange.kiwoom.ws_client import KiwoomWS
+
+REG = {"trnm": "REG", "grp_no": "1", "refresh": "1", "data": [{"item": ["005930"], "type": ["0B"]}]}
+CNSRREQ = {"trnm": "CNSRREQ", "seq": "3", "search_type": "1", "stex_tp": "K"}
+
+
+class FakeKiwoomServer:
+    """Logs every received packet per connection and drops the first connection after a REG."""
+
+    def __init__(self):
+        self.sessions: list[list[dict]] = []
+        self.drop_first = True
+
+    async def handler(self, ws):
+        received: list[dict] = []
+        self.sessions.append(received)
+        async for raw in ws:
+            msg = json.loads(raw)
+            received.append(msg)
+            if msg["trnm"] == "LOGIN":
+                await ws.send(json.dumps({"trnm": "LOGIN", "return_code": 0}))
+                await ws.send(json.dumps({"trnm": "PING"}))
+            elif msg["trnm"] == "REG" and self.drop_first and len(self.sessions) == 1:
+                await ws.close()
+                return
+
+
+async def _wait_for(predicate, timeout: float = 5):
+    async with asyncio.timeout(timeout):
+        while not predicate():
+            await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_reconnects_relogs_in_and_replays_registrations():
+    server = FakeKiwoomServer()
+    forwarded = []
+
+    async def on_message(msg):
+        forwarded.append(msg)
+
+    async with serve(server.handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        client = KiwoomWS(f"ws://127.0.0.1:{port}", "token", on_message=on_message, reconnect_delay=0.01)
+        task = asyncio.create_task(client.run())
+
+        await client.send(CNSRREQ)  # before login: recorded and sent on login
+        await client.wait_logged_in()
+        await client.send(REG)
+
+        await _wait_for(lambda: len(server.sessions) == 2 and any(m["trnm"] == "REG" for m in server.sessions[1]))
+        await client.disconnect()
+        await task
+
+    first, second = server.sessions
+    assert [m["trnm"] for m in first] == ["LOGIN", "CNSRREQ", "PING", "REG"]
+    assert second[0] == {"trnm": "LOGIN", "token": "token"}
+    assert REG in second and CNSRREQ in second
+    assert client.reconnects == 1
+    # PINGs are answered internally
+    assert all(m["trnm"] != "PING" for m in forwarded)
+
+
+def test_remove_and_clear_drop_replay_entries():
+    client = KiwoomWS("ws://unused", "token")
+    client._track(REG)
+    client._track({**REG, "data": [{"item": ["000660"], "type": ["0B"]}]})
+    client._track({"trnm": "REMOVE", "grp_no": "1", "data": [{"item": ["005930"], "type": ["0B"]}]})
+    client._track(CNSRREQ)
+    client._track({"trnm": "CNSRCLR", "seq": "3"})
+
+    assert client._replay_messages() == [
+        {"trnm": "REG", "grp_no": "1", "refresh": "1", "data": [{"item": ["000660"], "type": ["0B"]}]}
+    ]
+
+
+def test_completed_one_shot_condition_search_is_not_replayed():
+    client = KiwoomWS("ws://unused", "token")
+    client._track({"trnm": "CNSRREQ", "seq": "2", "search_type": "0", "cont_yn": "N", "next_key": ""})
+    client._on_condition_response({"trnm": "CNSRREQ", "seq": "2  ", "return_code": 0, "cont_yn": "Y", "next_key": "k"})
+    assert len(client._replay_messages()) == 1
+
+    client._on_condition_response({"trnm": "CNSRREQ", "seq": "2  ", "return_code": 0, "cont_yn": "N"})
+    assert client._replay_messages() == []
+
+
+def test_failed_one_shot_condition_search_is_not_replayed():
+    client = KiwoomWS("ws://unused", "token")
+    client._track({"trnm": "CNSRREQ", "seq": "2", "search_type": "0", "cont_yn": "N", "next_key": ""})
+    client._on_condition_response({"trnm": "CNSRREQ", "seq": "2", "return_code": 1, "return_msg": "error"})
+    assert client._replay_messages() == []
+
+
+@pytest.mark.asyncio
+async def test_handler_error_closes_socket_before_reconnecting():
+    sessions = []
+
+    async def handler(ws):
+        sessions.append(ws)
+        async for raw in ws:
+            if json.loads(raw)["trnm"] == "LOGIN":
+                await ws.send(json.dumps({"trnm": "LOGIN", "return_code": 0}))
+                await ws.send(json.dumps({"trnm": "REAL", "data": []}))
+
+    sockets = []
+
+    async def on_message(msg):
+        sockets.append(client.ws)
+        raise RuntimeError("handler failed")
+
+    async with serve(handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        client = KiwoomWS(f"ws://127.0.0.1:{port}", "token", on_message=on_message, reconnect_delay=0.01)
+        task = asyncio.create_task(client.run())
+        await _wait_for(lambda: len(sockets) == 2)
+        # checked while the server is still up, which would otherwise keep the old socket open
+        assert sockets[0] is not sockets[1]
+        assert sockets[0].state is State.CLOSED
+        await client.disconnect()
+        await task
+
+
+@pytest.mark.asyncio
+async def test_failed_relogin_is_retried_until_disconnect():
+    sessions = []
+
+    async def handler(ws):
+        sessions.append(ws)
+        async for raw in ws:
+            if json.loads(raw)["trnm"] == "LOGIN":
+                # first session logs in and drops, the next one rejects the login, then accepted again
+                ok = len(sessions) != 2
+                await ws.send(json.dumps({"trnm": "LOGIN", "return_code": 0 if ok else 1, "return_msg": "busy"}))
+                if len(sessions) == 1:
+                    await ws.close()
+                    return
+
+    async with serve(handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        client = KiwoomWS(f"ws://127.0.0.1:{port}", "token", reconnect_delay=0.01)
+        task = asyncio.create_task(client.run())
+        await _wait_for(lambda: len(sessions) == 3 and client._logged_in.is_set())
+        assert client.keep_running and not task.done()
+        await client.disconnect()
+        await task
+
+    assert client.reconnects == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_first_login_stops():
+    async def handler(ws):
+        async for raw in ws:
+            await ws.send(json.dumps({"trnm": "LOGIN", "return_code": 1, "return_msg": "bad token"}))
+
+    async with serve(handler, "127.0.0.1", 0) as ws_server:
+        port = ws_server.sockets[0].getsockname()[1]
+        client = KiwoomWS(f"ws://127.0.0.1:{port}", "token", reconnect_delay=0.01)
+        await asyncio.wait_for(client.run(), 5)
+
+    assert not client.keep_running and client.reconnects == 0
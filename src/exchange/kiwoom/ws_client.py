@@ -1,8 +1,9 @@
+import asyncio
 import json
 import logging
 import websockets
 
-from typing import Awaitable, Callable, Optional
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
 
 
 logger = logging.getLogger("kiwoom_ws")
@@ -13,29 +14,48 @@ logger.setLevel(logging.INFO)
 
 class KiwoomWS:
     """
-    - websockets.connect 로 연결
-    - 로그인 패킷 전송 (trnm=LOGIN, token)
-    - 서버 PING 수신 시 그대로 에코
-    - 임의 메시지 송신 API 제공 (send)
-    - 수신 콜백(on_message) 훅 제공
+    - websockets.connect 로 연결, 로그인 패킷 전송 (trnm=LOGIN, token)
+    - 연결이 끊기면 지수 백오프로 재연결 후 재로그인 (재로그인 실패도 같은 백오프로 재시도)
+    - 재로그인 성공 시 활성 실시간 등록(REG)과 조건검색 요청(CNSRREQ)을 다시 전송
+    - 서버 PING 은 내부에서 에코 (on_message 로 전달하지 않음)
+    - 임의 메시지 송신 API 제공 (send), 수신 콜백(on_message) 훅 제공
     """
 
-    def __init__(self, url: str, access_token: str, on_message: Optional[Callable[[dict], Awaitable[None]]] = None):
+    def __init__(
+        self,
+        url: str,
+        access_token: str,
+        on_message: Optional[Callable[[dict], Awaitable[None]]] = None,
+        reconnect_delay: float = 1,
+        max_reconnect_delay: float = 60,
+    ):
         self.url = url
         self.token = access_token
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
         self.connected: bool = False
         self.keep_running: bool = True
         self.on_message = on_message
+        self.reconnects: int = 0
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._logged_in = asyncio.Event()
+        # 실시간 등록: (grp_no, item, type)
+        self._registrations: Set[Tuple[str, str, str]] = set()
+        # 조건검색 요청: seq -> 마지막으로 보낸 CNSRREQ (실시간은 해제 전까지, 일반은 응답 완료 전까지 유지)
+        self._condition_requests: Dict[str, dict] = {}
+        self._session_logged_in = False
+        # 한 번이라도 로그인에 성공했는지, 첫 로그인 실패(토큰 오류 등)만 종료 사유로 봄
+        self._ever_logged_in = False
 
     # --------------------------- lifecycle ---------------------------
     async def connect(self) -> None:
         try:
             self.ws = await websockets.connect(self.url, ping_interval=None, ping_timeout=None)
             self.connected = True
+            self._session_logged_in = False
             logger.info("서버와 연결했습니다. (connect)")
             # 로그인 패킷 전송
-            await self.send({"trnm": "LOGIN", "token": self.token})
+            await self._send_raw({"trnm": "LOGIN", "token": self.token})
             logger.info("로그인 패킷 전송 완료")
         except Exception as e:
             self.connected = False
@@ -44,19 +64,105 @@ class KiwoomWS:
 
     async def disconnect(self) -> None:
         self.keep_running = False
+        self._logged_in.clear()
         if self.connected and self.ws:
             await self.ws.close()
         self.connected = False
         logger.info("WebSocket 연결을 종료했습니다.")
 
+    async def _close_ws(self) -> None:
+        ws, self.ws = self.ws, None
+        self.connected = False
+        if ws is not None:
+            try:
+                await ws.close()
+            except Exception as e:
+                logger.debug(f"이전 소켓 종료 중 오류: {e}")
+
+    async def wait_logged_in(self) -> None:
+        await self._logged_in.wait()
+
     async def send(self, message: dict | str) -> None:
-        if not self.connected or not self.ws:
-            await self.connect()
+        """
+        메시지 송신. REG/REMOVE/CNSRREQ/CNSRCLR 은 재연결 시 재전송할 수 있도록 기록하며,
+        로그인 전이면 기록만 하고 로그인 직후 재전송에 맡긴다. 그 외 메시지는 로그인될 때까지 대기.
+        """
+        if isinstance(message, str):
+            parsed = json.loads(message)
+        else:
+            parsed = message
+        if self._track(parsed) and not self._logged_in.is_set():
+            logger.debug(f"로그인 전이므로 재연결 후 전송: {parsed.get('trnm')}")
+            return
+        await self._logged_in.wait()
+        await self._send_raw(message)
+
+    async def _send_raw(self, message: dict | str) -> None:
         if not isinstance(message, str):
             message = json.dumps(message, ensure_ascii=False, separators=(",", ":"))
         await self.ws.send(message)
         logger.debug(f"SEND: {message}")
 
+    # --------------------------- registrations ---------------------------
+    def _track(self, msg: dict) -> bool:
+        """재전송 대상 메시지면 상태에 반영하고 True 반환"""
+        trnm = msg.get("trnm")
+        if trnm == "REG":
+            grp_no = str(msg.get("grp_no", ""))
+            if str(msg.get("refresh", "1")) == "0":
+                self._registrations = {r for r in self._registrations if r[0] != grp_no}
+            for entry in msg.get("data", []):
+                for item in entry.get("item", []):
+                    for type_ in entry.get("type", []):
+                        self._registrations.add((grp_no, item, type_))
+            return True
+        if trnm == "REMOVE":
+            grp_no = str(msg.get("grp_no", ""))
+            for entry in msg.get("data", []):
+                for item in entry.get("item", []):
+                    for type_ in entry.get("type", []):
+                        self._registrations.discard((grp_no, item, type_))
+            return True
+        if trnm == "CNSRREQ":
+            self._condition_requests[str(msg["seq"]).strip()] = msg
+            return True
+        if trnm == "CNSRCLR":
+            self._condition_requests.pop(str(msg["seq"]).strip(), None)
+            return True
+        return False
+
+    def _replay_messages(self) -> list[dict]:
+        by_group: Dict[str, Dict[str, list]] = {}
+        for grp_no, item, type_ in sorted(self._registrations):
+            by_group.setdefault(grp_no, {}).setdefault(type_, []).append(item)
+        messages = [
+            {
+                "trnm": "REG",
+                "grp_no": grp_no,
+                "refresh": "1",
+                "data": [{"item": items, "type": [type_]} for type_, items in types.items()],
+            }
+            for grp_no, types in by_group.items()
+        ]
+        messages += list(self._condition_requests.values())
+        return messages
+
+    async def _replay(self, messages: list[dict]) -> None:
+        for message in messages:
+            await self._send_raw(message)
+        if messages:
+            logger.info(f"실시간 등록/조건검색 {len(messages)}건 재전송")
+
+    def _on_condition_response(self, msg: dict) -> None:
+        """일반 조건검색(search_type=0)은 마지막 페이지 응답 또는 오류 응답을 받으면 재전송 대상에서 제외"""
+        seq = str(msg.get("seq", "")).strip()
+        request = self._condition_requests.get(seq)
+        if request is None or str(request.get("search_type")) == "1":
+            return
+        if msg.get("return_code") != 0 or msg.get("cont_yn") != "Y":
+            del self._condition_requests[seq]
+
+    # --------------------------- receive ---------------------------
     async def receive_loop(self) -> None:
         assert self.ws is not None
         try:
@@ -71,21 +177,54 @@ class KiwoomWS:
                 trnm = msg.get("trnm")
                 if trnm == "LOGIN":
                     if msg.get("return_code") != 0:
+                        if self._ever_logged_in:
+                            # 재연결 후 재로그인 실패는 run() 의 백오프로 재시도
+                            raise ConnectionError(f"재로그인 실패: {msg.get('return_msg')}")
                         logger.error(f"로그인 실패: {msg.get('return_msg')}")
                         await self.disconnect()
                         break
                     logger.info("로그인 성공")
+                    self._session_logged_in = True
+                    self._ever_logged_in = True
+                    # 재전송 목록을 확정한 뒤 바로 로그인 상태로 전환해야 그 사이 send() 가 누락되지 않음
+                    messages = self._replay_messages()
+                    self._logged_in.set()
+                    await self._replay(messages)
                     continue  # 로그인 메시지는 on_message로 전달하지 않음
+                if trnm == "PING":
+                    await self._send_raw(msg)
+                    continue
+                if trnm == "CNSRREQ":
+                    self._on_condition_response(msg)
 
-                # PING을 포함한 모든 메시지를 콜백으로 전달
                 if self.on_message:
                     await self.on_message(msg)
                 else:
                     logger.info(f"RECV: {msg}")
         except websockets.ConnectionClosed:
             logger.warning("Connection closed by server")
+        finally:
             self.connected = False
+            self._logged_in.clear()
 
     async def run(self) -> None:
-        await self.connect()
-        await self.receive_loop()
\ No newline at end of file
+        """연결이 끊기거나 재로그인에 실패하면 백오프 후 재연결, disconnect() 호출 또는 첫 로그인 실패 시 종료"""
+        delay = self._reconnect_delay
+        while self.keep_running:
+            try:
+                await self.connect()
+                await self.receive_loop()
+            except Exception as e:
+                logger.error(f"WebSocket 오류: {e}")
+            finally:
+                # on_message 예외 등으로 빠져나온 경우에도 이전 소켓을 닫고 재연결
+                await self._close_ws()
+            if not self.keep_running:
+                break
+            if self._session_logged_in:
+                # 로그인까지 성공했던 연결이 끊긴 경우 백오프 초기화
+                delay = self._reconnect_delay
+            self.reconnects += 1
+            logger.warning(f"{delay}초 후 재연결 시도 ({self.reconnects}회)")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self._max_reconnect_delay)
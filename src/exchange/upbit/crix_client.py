@@ -1,9 +1,16 @@
+from aiohttp import TCPConnector
+
 from shared.http.tracing_client_session import TracingClientSession
 
 class UpbitCrixClient:
 
-    def __init__(self, base_url: str = "https://crix-api-cdn.upbit.com"):
-        self._client = TracingClientSession(base_url=base_url, headers={"Content-Type": "application/json"})
+    def __init__(self, base_url: str = "https://crix-api-cdn.upbit.com", connector: TCPConnector | None = None):
+        self._client = TracingClientSession(
+            base_url=base_url,
+            headers={"Content-Type": "application/json"},
+            connector=connector,
+            connector_owner=connector is None,
+        )
 
     async def get_daily_candles(self, symbol: str, count: int = 30):
         params = {
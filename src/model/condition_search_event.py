@@ -0,0 +1,20 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, TIMESTAMP, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from shared.db import Base
+
+class ConditionSearchEvent(Base):
+    __tablename__ = "condition_search_event"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    condition_id: Mapped[str] = mapped_column(String(30), nullable=False, index=True) # 조건식 번호
+    symbol: Mapped[str] = mapped_column(String(30), nullable=False) # 종목코드
+    event_type: Mapped[str] = mapped_column(String(1), nullable=False) # I: 편입, D: 이탈
+    source: Mapped[str] = mapped_column(String(10), nullable=False) # realtime | snapshot
+    event_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=False), nullable=False, index=True) # 이벤트 시각 (KST)
+    received_at: Mapped[datetime] = mapped_column(TIMESTAMP(timezone=False), nullable=False) # 수신 시각 (KST)
+    response: Mapped[dict] = mapped_column(JSONB, nullable=False) # 원본 응답 데이터
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=False), nullable=False, server_default=text("CURRENT_TIMESTAMP")
+    )
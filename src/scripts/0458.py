@@ -6,12 +6,21 @@ from decimal import Decimal, ROUND_DOWN
 from typing import List, Tuple, Optional, Dict, Any
 from datetime import datetime
 
+from aiohttp import TCPConnector
 from dependency_injector.wiring import inject, Provide
 
 from exchange.bitget import BitgetFutureMarketClient, BitgetFutureTradeClient
+from exchange.bitget.client import request_cycle
+from exchange.bitget.contract_registry import ContractRegistry, ContractSpec
 from exchange.bitget.dto.bitget_error import BitgetError, BitgetErrorCode
+from exchange.bitget.dto.websocket import SubscribeReq
 from exchange.bitget.future.future_position_client import BitgetFuturePositionClient
 from exchange.bitget.future.future_account_client import BitgetFutureAccountClient
+from exchange.bitget.private_state import ACCOUNT_CHANNEL, POSITIONS_CHANNEL, BitgetPrivateState
+from exchange.bitget.stream_manager import TICKER_CHANNEL, BitgetStreamManager
+from exchange.bitget.ticker_cache import TickerCache
+from exchange.bitget.websocket_private_client import BitgetPrivateWebsocketClient
+from exchange.bitget.websocket_public_client import BitgetWebsocketClient
 from shared.containers import Container
 from shared.settings import get_settings
 
@@ -28,6 +37,20 @@ class TradingConstants:
     KLINE_LIMIT = 20
     GRANULARITY = "4H"
     PRODUCT_TYPE = "USDT-FUTURES"
+    QUOTE_MAX_AGE_SECONDS = 2.0                    # 이보다 오래된 호가는 REST로 재조회
+    PRIVATE_STREAM_READY_TIMEOUT = 5.0             # 프라이빗 스트림 스냅샷 대기 시간, 초과 시 REST 사용
+    TICKER_READY_TIMEOUT = 5.0                     # 티커 채널 첫 스냅샷 대기 시간, 초과 시 REST 사용
+
+
+# 계약 규격을 받지 못했을 때 사용하는 BTCUSDT 기준 값
+DEFAULT_CONTRACT_SPEC = {
+    "pricePlace": "1",
+    "priceEndStep": "1",
+    "sizeMultiplier": "0.0001",
+    "volumePlace": "4",
+    "minTradeNum": "0.0001",
+    "minTradeUSDT": "5",
+}
 
 
 @dataclass(frozen=True)
@@ -145,49 +168,44 @@ class BitgetTradingStrategy:
         position_client: BitgetFuturePositionClient,
         trade_client: BitgetFutureTradeClient,
         account_client: BitgetFutureAccountClient,
+        ticker_cache: Optional[TickerCache] = None,
+        private_state: Optional[BitgetPrivateState] = None,
+        contract_registry: Optional[ContractRegistry] = None,
     ):
         self.market_client = market_client
         self.position_client = position_client
         self.trade_client = trade_client
         self.account_client = account_client
+        self.ticker_cache = ticker_cache or TickerCache(lambda: market_client)
+        # 프라이빗 웹소켓 스냅샷, 수신 전이면 REST로 조회
+        self.private_state = private_state
+        self.contract_registry = contract_registry
         self.config = TradingConfig.from_settings()
         self.specs = self._get_trading_specs()
         
         logger.info(f"전략 초기화 완료 - {self.config}")
 
     def _get_trading_specs(self) -> TradingSpecs:
-        """거래 규격 정보 계산"""
-        # TODO: API에서 실제 스펙을 가져오도록 개선 필요
-        spec = {
-            "symbol": self.config.symbol,
-            "pricePlace": "1",
-            "priceEndStep": "1",
-            "sizeMultiplier": "0.0001",
-            "volumePlace": "4",
-            "minTradeNum": "0.0001",
-            "minTradeUSDT": "5"
-        }
-
-        price_place = int(spec.get("pricePlace", "1"))
-        price_end_step = Decimal(str(spec.get("priceEndStep", "1")))
-        tick = (Decimal(1) / (Decimal(10) ** price_place)) * price_end_step
-
-        if spec.get("sizeMultiplier"):
-            qty_step = Decimal(str(spec["sizeMultiplier"]))
+        """거래 규격 정보 (계약 규격 레지스트리, 없으면 기본값)"""
+        if self.contract_registry is not None and self.config.symbol in self.contract_registry:
+            contract = self.contract_registry.get(self.config.symbol)
         else:
-            vp = int(spec.get("volumePlace", "4"))
-            qty_step = Decimal(1) / (Decimal(10) ** vp)
-
-        min_trade_num = Decimal(str(spec.get("minTradeNum", "0")))
-        min_trade_usdt = Decimal(str(spec.get("minTradeUSDT", "0")))
-
-        specs = TradingSpecs(tick, qty_step, min_trade_num, min_trade_usdt)
+            logger.warning(f"{self.config.symbol} 계약 규격 없음, 기본값 사용")
+            contract = ContractSpec.from_contract(DEFAULT_CONTRACT_SPEC | {"symbol": self.config.symbol})
+        specs = TradingSpecs(contract.tick, contract.qty_step, contract.min_qty, contract.min_notional)
         logger.debug(f"거래 규격 정보: {specs}")
         return specs
 
     async def get_account_equity(self) -> Decimal:
         """전체 평가금액 조회"""
         try:
+            if self.private_state and self.private_state.fresh(ACCOUNT_CHANNEL):
+                account = self.private_state.get_account()
+                if account:
+                    equity = Decimal(str(account.get("accountEquity", "0")))
+                    logger.debug(f"계좌 평가금액(스트림): {equity} USDT")
+                    return equity
+
             account = await self.account_client.get_accounts(product_type=TradingConstants.PRODUCT_TYPE)
             
             if not account:
@@ -204,6 +222,12 @@ class BitgetTradingStrategy:
     async def get_leverage(self) -> Decimal:
         """현재 심볼의 레버리지 설정 조회"""
         try:
+            if self.private_state and self.private_state.fresh(POSITIONS_CHANNEL):
+                # 포지션이 있으면 포지션의 레버리지 사용, 없으면 REST 조회
+                for position in self.private_state.get_positions(self.config.symbol):
+                    if position.get("leverage"):
+                        return Decimal(str(position["leverage"]))
+
             leverage_info = await self.account_client.get_account(
                 symbol=self.config.symbol,
                 product_type=TradingConstants.PRODUCT_TYPE
@@ -242,9 +266,11 @@ class BitgetTradingStrategy:
     async def get_current_position_info(self) -> PositionInfo:
         """현재 포지션 정보 조회"""
         try:
-            async with self.position_client as client:
-                positions = await client.get_position(
-                    symbol=self.config.symbol, 
+            if self.private_state and self.private_state.fresh(POSITIONS_CHANNEL):
+                positions = self.private_state.get_positions(self.config.symbol)
+            else:
+                positions = await self.position_client.get_position(
+                    symbol=self.config.symbol,
                     product_type=TradingConstants.PRODUCT_TYPE
                 )
             
@@ -261,7 +287,11 @@ class BitgetTradingStrategy:
             position = positions[0]
             
             position_size = Decimal(position.get("total", "0"))
-            mark_price = Decimal(position.get("markPrice", "0"))
+            mark_price = Decimal(position.get("markPrice") or "0")
+            if mark_price == 0:
+                # 웹소켓 포지션 푸시에는 markPrice가 없을 수 있음
+                quote = await self.ticker_cache.get_quote(self.config.symbol, TradingConstants.QUOTE_MAX_AGE_SECONDS)
+                mark_price = quote.mark or quote.last
             position_value_usdt = position_size * mark_price / (await self.get_leverage())
             
             unrealized_pnl = Decimal(position.get("unrealizedPL", "0"))
@@ -372,13 +402,16 @@ class BitgetTradingStrategy:
             raise
 
     async def get_ticker_price(self) -> Tuple[Decimal, Decimal]:
-        """현재 호가 조회 (bid_price, ask_price)"""
+        """현재 호가 조회 (bid_price, ask_price) - 실시간 티커 캐시 우선, 오래된 경우에만 REST 조회"""
         try:
-            ticker = await self.market_client.ticker(self.config.symbol)
-            bid_price = Decimal(ticker["data"][0]["bidPr"])
-            ask_price = Decimal(ticker["data"][0]["askPr"])
-            
-            logger.debug(f"현재 호가: Bid({bid_price}), Ask({ask_price})")
+            quote = await self.ticker_cache.get_quote(
+                self.config.symbol,
+                max_age=TradingConstants.QUOTE_MAX_AGE_SECONDS,
+            )
+            bid_price = quote.bid
+            ask_price = quote.ask
+
+            logger.debug(f"현재 호가: Bid({bid_price}), Ask({ask_price}), Age({quote.age:.3f}s)")
             return bid_price, ask_price
             
         except Exception as e:
@@ -625,36 +658,38 @@ class BitgetTradingStrategy:
         logger.info(f"[{strategy_execution_id}] === 전략 실행 시작 ({start_time}) ===")
         
         try:
-            # 1. 모든 주문 취소
-            if not await self.cancel_all_orders():
-                logger.error(f"[{strategy_execution_id}] 주문 취소 실패로 전략 실행 중단")
-                return
+            # 한 주기 동안 같은 조회(레버리지, 포지션, 계좌)는 한 번만 호출
+            with request_cycle():
+                # 1. 모든 주문 취소
+                if not await self.cancel_all_orders():
+                    logger.error(f"[{strategy_execution_id}] 주문 취소 실패로 전략 실행 중단")
+                    return
 
-            # 2. 시장 데이터 조회
-            logger.info(f"[{strategy_execution_id}] 시장 데이터 조회 중...")
-            candles = await self.get_klines()
+                # 2. 시장 데이터 조회
+                logger.info(f"[{strategy_execution_id}] 시장 데이터 조회 중...")
+                candles = await self.get_klines()
             
-            if len(candles) < TradingConstants.MIN_CANDLES_REQUIRED:
-                logger.error(f"[{strategy_execution_id}] 캔들 데이터 부족: {len(candles)}/{TradingConstants.MIN_CANDLES_REQUIRED}")
-                return
+                if len(candles) < TradingConstants.MIN_CANDLES_REQUIRED:
+                    logger.error(f"[{strategy_execution_id}] 캔들 데이터 부족: {len(candles)}/{TradingConstants.MIN_CANDLES_REQUIRED}")
+                    return
 
-            bid_price, ask_price = await self.get_ticker_price()
+                bid_price, ask_price = await self.get_ticker_price()
             
-            logger.info(
-                f"[{strategy_execution_id}] 시장 상황: "
-                f"최신캔들({candles[-1]}), Bid({bid_price}), Ask({ask_price})"
-            )
+                logger.info(
+                    f"[{strategy_execution_id}] 시장 상황: "
+                    f"최신캔들({candles[-1]}), Bid({bid_price}), Ask({ask_price})"
+                )
 
-            # 3. 거래 결정 및 실행
-            decision = await self.make_trading_decision(candles)
+                # 3. 거래 결정 및 실행
+                decision = await self.make_trading_decision(candles)
             
-            if decision.action == "BUY":
-                await self.execute_buy_order(bid_price, decision)
-            elif candles[-1].is_bullish:
-                logger.info(f"[{strategy_execution_id}] 상승 캔들 감지, 매도 조건 검사")
-                await self.check_sell_conditions(candles, ask_price)
-            else:
-                logger.info(f"[{strategy_execution_id}] 대기: {decision.reason}")
+                if decision.action == "BUY":
+                    await self.execute_buy_order(bid_price, decision)
+                elif candles[-1].is_bullish:
+                    logger.info(f"[{strategy_execution_id}] 상승 캔들 감지, 매도 조건 검사")
+                    await self.check_sell_conditions(candles, ask_price)
+                else:
+                    logger.info(f"[{strategy_execution_id}] 대기: {decision.reason}")
 
         except Exception as e:
             logger.error(f"[{strategy_execution_id}] 전략 실행 중 예외 발생: {e}")
@@ -664,22 +699,77 @@ class BitgetTradingStrategy:
             logger.info(f"[{strategy_execution_id}] === 전략 실행 완료 ({end_time}, 소요시간: {duration:.2f}초) ===")
 
 
+async def wait_first_quote(stream_manager: BitgetStreamManager, symbol: str, timeout: float) -> bool:
+    """`ticker` 채널에서 symbol 의 첫 호가가 TickerCache 에 들어올 때까지 대기, timeout 초과 시 False"""
+    if stream_manager.ticker_cache.get(symbol) is not None:
+        return True
+    received = asyncio.Event()
+    disposable = stream_manager.quote_stream.subscribe(lambda quote: received.set() if quote.symbol == symbol else None)
+    try:
+        await asyncio.wait_for(received.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    finally:
+        disposable.dispose()
+
+
 @inject
 async def main(
     market_client: BitgetFutureMarketClient = Provide[Container.bitget_future_market_client],
     position_client: BitgetFuturePositionClient = Provide[Container.bitget_future_position_client],
     trade_client: BitgetFutureTradeClient = Provide[Container.bitget_future_trade_client],
     account_client: BitgetFutureAccountClient = Provide[Container.bitget_future_account_client],
+    ticker_cache: TickerCache = Provide[Container.bitget_ticker_cache],
+    stream_manager: BitgetStreamManager = Provide[Container.bitget_stream_manager],
+    public_url: str = Provide[Container.config.bitget.websocket_public_url],
+    private_client: BitgetPrivateWebsocketClient = Provide[Container.bitget_future_websocket_private_client],
+    contract_registry: ContractRegistry = Provide[Container.bitget_contract_registry],
+    http_connector: TCPConnector = Provide[Container.http_connector],
 ):
     """메인 실행 함수"""
+    symbol = get_settings().strategy_0458.symbol
+    # 0458 심볼의 ticker 채널만 구독하는 전용 공개 연결, 수신한 호가는 stream_manager 를 거쳐 ticker_cache 로 들어감
+    ticker_req = SubscribeReq(TradingConstants.PRODUCT_TYPE, TICKER_CHANNEL, symbol)
+    stream_manager.register(ticker_req)
+    public_client = BitgetWebsocketClient(public_url, stream_manager, channels=[ticker_req], name="0458-ticker")
+    public_task = asyncio.create_task(public_client.connect())
+    private_task = asyncio.create_task(private_client.connect())
     try:
         logger.info("=== 거래 봇 시작 ===")
-        strategy = BitgetTradingStrategy(market_client, position_client, trade_client, account_client)
+        # 캐시 파일이 있으면 네트워크 없이 로드, 없거나 만료됐으면 조회 (실패 시 캐시/기본 규격으로 진행)
+        await contract_registry.start([symbol], background=False)
+        quote_ready, private_ready = await asyncio.gather(
+            wait_first_quote(stream_manager, symbol, TradingConstants.TICKER_READY_TIMEOUT),
+            private_client.state.wait_ready(TradingConstants.PRIVATE_STREAM_READY_TIMEOUT),
+        )
+        if not quote_ready:
+            logger.warning("티커 스냅샷 미수신, 호가는 REST 조회로 진행")
+        if not private_ready:
+            logger.warning("프라이빗 스트림 스냅샷 미수신, REST 조회로 진행")
+        strategy = BitgetTradingStrategy(
+            market_client,
+            position_client,
+            trade_client,
+            account_client,
+            ticker_cache,
+            private_client.state,
+            contract_registry,
+        )
         await strategy.execute_strategy()
         logger.info("=== 거래 봇 완료 ===")
     except Exception as e:
         logger.error(f"메인 실행 중 오류 발생: {e}")
         raise
+    finally:
+        await contract_registry.close()
+        await public_client.close()
+        public_task.cancel()
+        await private_client.close()
+        private_task.cancel()
+        for client in (market_client, position_client, trade_client, account_client):
+            await client.close()
+        await http_connector.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+import argparse
+import asyncio
+import json
+import time
+
+from exchange.bitget.dto.websocket import SubscribeReq, arg_key
+from exchange.bitget.stream_manager import BitgetStreamManager
+from exchange.bitget.websocket_public_client import BitgetWebsocketClient
+from exchange.bitget.ws_recording import read_frames
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark Bitget WebSocket frame decode + dispatch throughput.")
+    parser.add_argument("--symbols", type=int, default=200, help="Number of subscribed symbols.")
+    parser.add_argument("--intervals", nargs="+", default=["1m", "5m", "15m"], help="Candle intervals per symbol.")
+    parser.add_argument("--frames", type=int, default=200_000, help="Number of frames to dispatch.")
+    parser.add_argument(
+        "--recording",
+        help="Replay a FrameRecorder file through the client receive path instead of synthetic frames.",
+    )
+    return parser.parse_args()
+
+
+def _build_frames(symbols: list[str], intervals: list[str], count: int) -> list[str]:
+    frames = []
+    for i in range(count):
+        symbol = symbols[i % len(symbols)]
+        interval = intervals[i % len(intervals)]
+        ts = 1695685500000 + (i // len(symbols)) * 60_000
+        frames.append(json.dumps({
+            "action": "update",
+            "arg": {"instType": "USDT-FUTURES", "channel": f"candle{interval}", "instId": symbol},
+            "data": [[str(ts), "27000", "27000.5", "26999.5", "27000", "0.057", "1539.0155", "1539.0155"]],
+            "ts": ts,
+        }))
+    return frames
+
+
+def _replay(path: str):
+    frames = list(read_frames(path))
+    # route every channel that shows up in the recording
+    manager = BitgetStreamManager({})
+    for _, raw in frames:
+        if raw != "pong":
+            arg = json.loads(raw).get("arg")
+            if arg:
+                manager.register(SubscribeReq(*arg_key(arg)))
+    client = BitgetWebsocketClient("wss://replay", manager)
+
+    start = time.perf_counter()
+    count = asyncio.run(client.replay(frames))
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"replayed {count} recorded frames in {elapsed:.3f}s "
+        f"-> {count / elapsed:,.0f} frames/s ({elapsed / count * 1e6:.2f} us/frame)"
+    )
+
+
+def main():
+    args = _parse_args()
+    if args.recording:
+        _replay(args.recording)
+        return
+
+    symbols = [f"SYM{i}USDT" for i in range(args.symbols)]
+    manager = BitgetStreamManager({
+        "bench": {"product_type": "USDT-FUTURES", "intervals": args.intervals, "universe": symbols}
+    })
+    received = [0]
+
+    def on_candle(_):
+        received[0] += 1
+
+    for streams in manager.candle_stream.values():
+        for subject in streams.values():
+            subject.subscribe(on_candle)
+
+    frames = _build_frames(symbols, args.intervals, args.frames)
+    dispatch = manager.dispatch
+    loads = json.loads
+
+    start = time.perf_counter()
+    for raw in frames:
+        dispatch(loads(raw))
+    elapsed = time.perf_counter() - start
+
+    assert received[0] == args.frames, f"dispatched {received[0]} / {args.frames}"
+    print(
+        f"{args.frames} frames over {len(manager.channels)} channels in {elapsed:.3f}s "
+        f"-> {args.frames / elapsed:,.0f} frames/s ({elapsed / args.frames * 1e6:.2f} us/frame)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,11 +2,13 @@ import asyncio
 import json
 import logging
 
+from dataclasses import dataclass
 from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
 from typing import List, Optional, Dict, Any
 
 import pytz
+from aiohttp import TCPConnector
 from dependency_injector.wiring import inject, Provide
 from sqlalchemy import func
 from sqlalchemy.dialects.postgresql import insert
@@ -17,6 +19,7 @@ from model.condition_search_meta import ConditionSearchMeta
 from model.condition_search_result import ConditionSearchResult
 from shared.containers import Container
 from shared.db import get_db
+from shared.utils.batch_writer import BatchWriter
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -32,27 +35,71 @@ def to_decimal(v: Optional[str]) -> Decimal:
         return Decimal(0)
 
 
-results = []
+@dataclass(frozen=True)
+class CoverageReport:
+    """조건검색 수집 결과 요약"""
+    requested: int
+    completed: List[str]
+    failed: List[str]
+    timed_out: List[str]
+    rows: int
+    pages: Dict[str, int]
+
+    @property
+    def complete(self) -> bool:
+        return not self.failed and not self.timed_out and len(self.completed) == self.requested
+
+    def __str__(self) -> str:
+        return (
+            f"coverage {len(self.completed)}/{self.requested} conditions, {self.rows} rows, "
+            f"{sum(self.pages.values())} pages, failed={self.failed}, timed_out={self.timed_out}"
+        )
 
-class ConditionSearchCollector:
-    """Handle HTS 조건검색 WebSocket messages and persist results."""
 
-    def __init__(self, ws: KiwoomWS, base_date: date):
+class ConditionSearchCollector:
+    """
+    Handle HTS 조건검색 WebSocket messages and persist results.
+
+    CNSRLST 로 받은 조건식마다 CNSRREQ 를 보내고 seq 별로 응답을 추적한다.
+    cont_yn=Y 이면 next_key 로 다음 페이지를 요청하고, 마지막 페이지를 받거나
+    조건식별 timeout(마지막 요청 이후 경과 시간)이 지나면 해당 조건식을 종료한다.
+    """
+
+    def __init__(
+        self,
+        ws: KiwoomWS,
+        base_date: date,
+        writer: BatchWriter,
+        timeout: float = 30,
+        request_interval: float = 0.3,
+    ):
         self.ws = ws
         self.base_date = base_date
+        self.writer = writer
+        self.timeout = timeout
+        self.request_interval = request_interval
+        self.rows = 0
+        self.conditions: Dict[str, str] = {}
+        # seq -> 응답 마감 시각 (loop time)
+        self._outstanding: Dict[str, float] = {}
+        self._pages: Dict[str, int] = {}
+        self._completed: List[str] = []
+        self._failed: List[str] = []
+        self._timed_out: List[str] = []
+        self._listed = asyncio.Event()
+        self._all_requested = False
+        self._request_task: Optional[asyncio.Task] = None
 
     async def on_msg(self, msg: Dict[str, Any]) -> None:
-        logger.info(f"Received message: {msg}")
+        logger.debug(f"Received message: {msg}")
         match msg:
-            case {"trnm": "PING"}:
-                await self.ws.send(msg)
-                logger.debug("Echoed PING message back to server.")
             case {"trnm": "CNSRLST", "return_code": 0, "data": data}:
                 await self._handle_cnsrlst(data)
-            case {"trnm": "CNSRREQ", "return_code": 0, "data": data, "seq": condition_id}:
-                await self._handle_cnsrreq(condition_id, data)
-            case {"trnm": "CNSRREQ"}:
-                logger.debug("Received CNSRREQ acknowledgment, ignoring.")
+            case {"trnm": "CNSRREQ", "return_code": 0, "seq": condition_id}:
+                await self._handle_cnsrreq(condition_id.strip(), msg.get("data") or [], msg)
+            case {"trnm": "CNSRREQ", "seq": condition_id}:
+                self._finish(condition_id.strip(), self._failed)
+                logger.error(f"조건검색 실패 seq={condition_id.strip()}: {msg.get('return_msg')}")
             case _:
                 logger.debug(f"Unhandled message or non-success return_code: {msg}")
 
@@ -74,62 +121,175 @@ class ConditionSearchCollector:
                 await session.commit()
             logger.info(f"Upserted {len(meta_records)} condition search meta items.")
 
-        for item in data:  # 데모용으로 상위 5개 조건식만 처리
-            seq, name = item[0], item[1]
-            await self.ws.send(
-                {
-                    "trnm": "CNSRREQ",
-                    "seq": seq,
-                    "search_type": "0",
-                    "stex_tp": "K",
-                    "cont_yn": "N",
-                    "next_key": "",
-                }
-            )
-            # sleep
-            await asyncio.sleep(0.3)
-        logger.info(f"Requested condition search for {len(data)} items")
+        self.conditions = {item[0].strip(): item[1] for item in data}
+        self._listed.set()
+        # 요청 간격 대기가 수신 루프를 막지 않도록 별도 태스크에서 발송
+        self._request_task = asyncio.create_task(self._request_all(list(self.conditions)))
+
+    async def _request_all(self, seqs: List[str]) -> None:
+        for seq in seqs:
+            await self._request(seq)
+            await asyncio.sleep(self.request_interval)
+        self._all_requested = True
+        logger.info(f"Requested condition search for {len(seqs)} items")
+
+    async def _request(self, seq: str, next_key: str = "") -> None:
+        self._outstanding[seq] = asyncio.get_running_loop().time() + self.timeout
+        await self.ws.send(
+            {
+                "trnm": "CNSRREQ",
+                "seq": seq,
+                "search_type": "0",
+                "stex_tp": "K",
+                "cont_yn": "Y" if next_key else "N",
+                "next_key": next_key,
+            }
+        )
 
-    async def _handle_cnsrreq(self, condition_id: str, data=None) -> None:
-        if data is None:
-            data = list()
+    def _finish(self, seq: str, bucket: List[str]) -> None:
+        if self._outstanding.pop(seq, None) is not None:
+            bucket.append(seq)
+
+    async def _handle_cnsrreq(self, condition_id: str, data: List[dict], msg: Dict[str, Any]) -> None:
+        if condition_id not in self._outstanding:
+            logger.warning(f"Unexpected or late CNSRREQ response for seq={condition_id}, ignoring")
+            return
 
         for item in data:
             symbol = item.get("9001")
             if not symbol:
                 continue
-            results.append(
-                ConditionSearchResult(
-                    base_date=self.base_date,
-                    condition_id=condition_id,
-                    symbol=symbol,
-                    name=item.get("302"),
-                    price=to_decimal(item.get("10")),
-                    change_sign=item.get("25"),
-                    change_price=to_decimal(item.get("11")),
-                    change_rate=to_decimal(item.get("12")),
-                    volume_acc=to_decimal(item.get("13")),
-                    open=to_decimal(item.get("16")),
-                    high=to_decimal(item.get("17")),
-                    low=to_decimal(item.get("18")),
-                    response=item,
-                )
+            # 결과는 도착하는 대로 writer 로 넘겨 배치 단위로 저장
+            await self.writer.put(
+                {
+                    "base_date": self.base_date,
+                    "condition_id": condition_id,
+                    "symbol": symbol.strip(),
+                    "name": (item.get("302") or "").strip(),
+                    "price": to_decimal(item.get("10")),
+                    "change_sign": item.get("25"),
+                    "change_price": to_decimal(item.get("11")),
+                    "change_rate": to_decimal(item.get("12")),
+                    "volume_acc": to_decimal(item.get("13")),
+                    "open": to_decimal(item.get("16")),
+                    "high": to_decimal(item.get("17")),
+                    "low": to_decimal(item.get("18")),
+                    "response": item,
+                }
             )
+            self.rows += 1
+        self._pages[condition_id] = self._pages.get(condition_id, 0) + 1
+
+        if msg.get("cont_yn") == "Y" and msg.get("next_key"):
+            await self._request(condition_id, msg["next_key"])
+        else:
+            self._finish(condition_id, self._completed)
+
+    def _expire(self) -> None:
+        now = asyncio.get_running_loop().time()
+        for seq, deadline in list(self._outstanding.items()):
+            if now >= deadline:
+                logger.warning(f"조건검색 응답 시간 초과 seq={seq} ({self.conditions.get(seq)})")
+                self._finish(seq, self._timed_out)
+
+    def _unrequested(self) -> List[str]:
+        finished = set(self._completed) | set(self._failed) | set(self._timed_out) | set(self._outstanding)
+        return [seq for seq in self.conditions if seq not in finished]
+
+    def _give_up(self, bucket: List[str], include_outstanding: bool = True) -> None:
+        """아직 요청하지 못한 조건식(및 응답 대기 중인 조건식)을 bucket 으로 종료"""
+        if self._request_task is not None and not self._request_task.done():
+            self._request_task.cancel()
+        bucket.extend(self._unrequested())
+        self._all_requested = True
+        if include_outstanding:
+            for seq in list(self._outstanding):
+                self._finish(seq, bucket)
+
+    @property
+    def done(self) -> bool:
+        return self._listed.is_set() and self._all_requested and not self._outstanding
+
+    async def wait_complete(
+        self,
+        list_timeout: float = 30,
+        poll_interval: float = 0.1,
+        ws_task: Optional[asyncio.Task] = None,
+    ) -> CoverageReport:
+        """
+        모든 조건식이 응답 완료/실패/시간 초과될 때까지 대기 후 커버리지 반환.
+        전체 대기는 조건식 수 * (timeout + request_interval) 로 제한하고, 요청 태스크가 실패하거나
+        ws_task(수신 루프)가 끝나면 남은 조건식을 실패로 처리하고 바로 반환한다.
+        """
+        try:
+            await asyncio.wait_for(self._listed.wait(), list_timeout)
+        except asyncio.TimeoutError:
+            logger.error("조건식 목록(CNSRLST) 응답 없음")
+            return self.coverage()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + len(self.conditions) * (self.timeout + self.request_interval)
+        while not self.done:
+            self._expire()
+            task = self._request_task
+            if task is not None and task.done() and not self._all_requested:
+                error = None if task.cancelled() else task.exception()
+                logger.error(f"조건검색 요청 발송 중단: {error!r}")
+                # 이미 보낸 조건식은 응답(또는 조건식별 시간 초과)을 계속 기다림
+                self._give_up(self._failed, include_outstanding=False)
+                continue
+            if ws_task is not None and ws_task.done():
+                logger.error("WebSocket 수신 루프가 종료되어 남은 조건식을 실패로 처리")
+                self._give_up(self._failed)
+                break
+            if loop.time() >= deadline:
+                logger.warning("조건검색 전체 대기 시간 초과")
+                self._give_up(self._timed_out)
+                break
+            await asyncio.sleep(poll_interval)
+        return self.coverage()
+
+    def coverage(self) -> CoverageReport:
+        return CoverageReport(
+            requested=len(self.conditions),
+            completed=list(self._completed),
+            failed=list(self._failed),
+            timed_out=list(self._timed_out),
+            rows=self.rows,
+            pages=dict(self._pages),
+        )
 
-        if not results:
-            logger.info("No valid results to upsert (no symbol present)")
-            return
 
-        logger.info(f"Condition Search Results: {results}")
+async def upsert_condition_search_results(records: List[Dict[str, Any]]) -> None:
+    """condition_search_result 배치 업서트 (같은 배치 안의 중복 키는 마지막 값 사용)"""
+    # ON CONFLICT DO UPDATE 는 한 문장에서 같은 행을 두 번 갱신할 수 없음
+    unique = {(r["condition_id"], r["base_date"], r["symbol"]): r for r in records}
+    records = list(unique.values())
+    async with get_db() as session:
+        stmt = insert(ConditionSearchResult).values(records)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["condition_id", "base_date", "symbol"],
+            set_={
+                col: stmt.excluded[col]
+                for col in records[0].keys()
+                if col not in ("condition_id", "base_date", "symbol")
+            },
+        )
+        await session.execute(stmt)
+        await session.commit()
+    logger.info(f"Upserted {len(records)} condition search results into database.")
 
 
 @inject
 async def main(
     kiwoom_rest_client: KiwoomRestClient = Provide[Container.kiwoom_rest_client],
+    http_connector: TCPConnector = Provide[Container.http_connector],
 ):
-    # 1) REST 토큰 발급
-    async with kiwoom_rest_client as client:
-        token = await client.get_access_token()
+    # 1) REST 토큰 발급 (이후 REST 호출이 없으므로 공용 커넥션 풀도 바로 닫음)
+    try:
+        async with kiwoom_rest_client as client:
+            token = await client.get_access_token()
+    finally:
+        await http_connector.close()
 
     # 2) WS 클라이언트 구성 + 콜백 바인딩
     ws_client = KiwoomWS(
@@ -137,62 +297,35 @@ async def main(
         access_token=token,
         on_message=None,  # 콜렉터 바인딩 후 설정
     )
-    collector = ConditionSearchCollector(ws=ws_client, base_date=date.today())
-    ws_client.on_message = collector.on_msg
-
-    # 3) 수신 루프 시작
-    ws_task = asyncio.create_task(ws_client.run())
-
-    # 4) 로그인 이후 약간 대기한 뒤 조건식 목록 요청 (CNSRLST)
-    await asyncio.sleep(1)
-    await ws_client.send({"trnm": "CNSRLST"})
-
-    await asyncio.sleep(180)
-
     kst = pytz.timezone("Asia/Seoul")
-    now_kst = datetime.now(kst)
-
-    # Build clean dicts explicitly to avoid ORM internals in __dict__
-    records = []
-    for r in results:
-        records.append(
-            {
-                "base_date": now_kst.date(),
-                "condition_id": r.condition_id.strip(),
-                "symbol": r.symbol.strip(),
-                "name": r.name.strip(),
-                "price": r.price,
-                "change_sign": r.change_sign,
-                "change_price": r.change_price,
-                "change_rate": r.change_rate,
-                "volume_acc": r.volume_acc,
-                "open": r.open,
-                "high": r.high,
-                "low": r.low,
-                "response": r.response,
-            }
-        )
-
-    await ws_client.disconnect()
-    await ws_task
+    writer = BatchWriter(upsert_condition_search_results, max_batch=500, max_delay=2.0, name="condition-search")
+    collector = ConditionSearchCollector(ws=ws_client, base_date=datetime.now(kst).date(), writer=writer)
+    ws_client.on_message = collector.on_msg
 
-    if not records:
-        logger.info("No records to upsert. Exiting.")
-        return
+    async with writer:
+        # 3) 수신 루프 시작
+        ws_task = asyncio.create_task(ws_client.run())
 
-    async with get_db() as session:
-        stmt = insert(ConditionSearchResult).values(records)
-        stmt = stmt.on_conflict_do_update(
-            index_elements=["condition_id", "base_date", "symbol"],
-            set_={
-                col: stmt.excluded[col]
-                for col in records[0].keys()
-                if col not in ("condition_id", "base_date", "symbol")
-            },
-        )
-        await session.execute(stmt)
-        await session.commit()
-    logger.info(f"Upserted {len(records)} condition search results into database.")
+        # 4) 로그인 이후 조건식 목록 요청 (CNSRLST), 로그인 실패로 수신 루프가 끝나면 중단
+        logged_in = asyncio.create_task(ws_client.wait_logged_in())
+        await asyncio.wait({logged_in, ws_task}, return_when=asyncio.FIRST_COMPLETED)
+        if not logged_in.done():
+            logged_in.cancel()
+            logger.error("WebSocket 로그인 실패로 조건검색을 중단합니다")
+            return
+        await ws_client.send({"trnm": "CNSRLST"})
+
+        # 5) 모든 조건식 응답(또는 조건식별 시간 초과)까지 대기
+        report = await collector.wait_complete(ws_task=ws_task)
+        if report.complete:
+            logger.info(f"Condition search finished: {report}")
+        else:
+            logger.warning(f"Condition search incomplete: {report}")
+
+        await ws_client.disconnect()
+        await ws_task
+    # writer 종료 시 남은 배치까지 저장됨
+    logger.info(f"Stored {writer.written} condition search rows ({writer.failed} failed)")
 
 
 if __name__ == "__main__":
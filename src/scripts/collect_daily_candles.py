@@ -1,22 +1,30 @@
 import asyncio
 import logging
 from decimal import Decimal
+from aiohttp import TCPConnector
+from dependency_injector.wiring import inject, Provide
 from reactivex.scheduler.eventloop import AsyncIOScheduler
 from sqlalchemy.dialects.postgresql import insert
 from datetime import datetime, date, timedelta
 from datetime import datetime as _dt
 from exchange.bitget import BitgetSpotMarketClient
+from exchange.bitget.client.rate_limiter import BitgetRateLimiter
 from exchange.upbit import UpbitCrixClient
 from model import DailyCandle
 from service import get_by_market
+from shared.containers import Container
 from shared.db import get_db
 from shared.utils import get_base_date
-from shared.utils.iterable import chunks
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-async def collect_crypto_currencies(base_date: date):
+@inject
+async def collect_crypto_currencies(
+    base_date: date,
+    rate_limiter: BitgetRateLimiter = Provide[Container.bitget_rate_limiter],
+    http_connector: TCPConnector = Provide[Container.http_connector],
+):
     """
     Collect and store daily candle data for all crypto currencies on the given base_date.
     """
@@ -30,9 +38,11 @@ async def collect_crypto_currencies(base_date: date):
     # 2. For each ticker, fetch daily candle and add to session
     candles = []
 
-    async with BitgetSpotMarketClient() as client:
-        for ticker_chunk in chunks(tickers, 10):
-            logger.info("Fetching candles for tickers: %s", [ticker.symbol for ticker in ticker_chunk])
+    # Both clients share the container's connection pool, closed once fetching is done
+    try:
+        # Requests are paced by the shared endpoint limits instead of fixed-size batches
+        async with BitgetSpotMarketClient(connector=http_connector, rate_limiter=rate_limiter) as client:
+            logger.info("Fetching candles for %d tickers", len(tickers))
             # Fetch one-day candle for base_date
             responses = await asyncio.gather(
                 *[
@@ -43,11 +53,18 @@ async def collect_crypto_currencies(base_date: date):
                         end_time=int(_dt.combine(base_date + timedelta(days=1), _dt.min.time()).timestamp() * 1000),
                         limit=1
                     )
-                    for ticker in ticker_chunk
-                ]
+                    for ticker in tickers
+                ],
+                # one ticker failing after its retries must not drop the rest of the collection
+                return_exceptions=True,
             )
 
-            for ticker, response in zip(ticker_chunk, responses):
+            failed = 0
+            for ticker, response in zip(tickers, responses):
+                if isinstance(response, Exception):
+                    failed += 1
+                    logger.error("Failed to fetch candle for %s on %s: %r", ticker.symbol, base_date, response)
+                    continue
                 if not response or "data" not in response or not response["data"]:
                     logger.warning("No data returned for %s on %s", ticker.symbol, base_date)
                     continue
@@ -65,26 +82,28 @@ async def collect_crypto_currencies(base_date: date):
                 )
                 candles.append(candle)
 
-    logger.info(f"[bitget] Collected {len(candles)} candles for base date {base_date}")
-
-    async with UpbitCrixClient() as client:
-        data = await client.get_daily_candles("USDT")
-        for candle_data in data:
-            kst_date = datetime.strptime(candle_data["candleDateTimeKst"], "%Y-%m-%dT%H:%M:%S%z").date()
-            if kst_date > base_date:
-                continue
-
-            candles.append(DailyCandle(
-                exchange="UPBIT",
-                # parse 2025-08-13T09:00:00+09:00
-                base_date=kst_date,
-                symbol=f"USDT/KRW",
-                open=Decimal(candle_data["openingPrice"]),
-                high=Decimal(candle_data["highPrice"]),
-                low=Decimal(candle_data["lowPrice"]),
-                close=Decimal(candle_data["tradePrice"]),
-                volume=Decimal(candle_data["candleAccTradeVolume"]),
-            ))
+        logger.info(f"[bitget] Collected {len(candles)} candles for base date {base_date} ({failed} failed)")
+
+        async with UpbitCrixClient(connector=http_connector) as client:
+            data = await client.get_daily_candles("USDT")
+            for candle_data in data:
+                kst_date = datetime.strptime(candle_data["candleDateTimeKst"], "%Y-%m-%dT%H:%M:%S%z").date()
+                if kst_date > base_date:
+                    continue
+
+                candles.append(DailyCandle(
+                    exchange="UPBIT",
+                    # parse 2025-08-13T09:00:00+09:00
+                    base_date=kst_date,
+                    symbol=f"USDT/KRW",
+                    open=Decimal(candle_data["openingPrice"]),
+                    high=Decimal(candle_data["highPrice"]),
+                    low=Decimal(candle_data["lowPrice"]),
+                    close=Decimal(candle_data["tradePrice"]),
+                    volume=Decimal(candle_data["candleAccTradeVolume"]),
+                ))
+    finally:
+        await http_connector.close()
 
     logger.info(f"[upbit] Collected {len(candles)} candles for base date {base_date}")
 
@@ -128,6 +147,10 @@ async def collect_crypto_currencies(base_date: date):
 
 
 if __name__ == "__main__":
+    container = Container()
+    container.init_resources()
+    container.wire(modules=[__name__])
+
     base_date = get_base_date()
     logging.info("Starting to collect crypto currencies for base date: %s", base_date)
     asyncio.run(collect_crypto_currencies(base_date))
@@ -5,6 +5,7 @@ from decimal import Decimal, InvalidOperation
 from typing import Optional, List
 
 import argparse
+from aiohttp import TCPConnector
 from dependency_injector.wiring import inject, Provide
 from sqlalchemy import select, distinct
 from sqlalchemy.dialects.postgresql import insert
@@ -107,6 +108,7 @@ async def main(
     start_date_str: str,
     end_date_str: str,
     kiwoom_rest_client: KiwoomRestClient = Provide[Container.kiwoom_rest_client],
+    http_connector: TCPConnector = Provide[Container.http_connector],
 ):
     """메인 함수: 지정된 기간의 일별 캔들 데이터를 수집"""
     start_date = date.fromisoformat(start_date_str)
@@ -114,29 +116,33 @@ async def main(
 
     logger.info(f"Collecting daily candles from {start_date} to {end_date}")
 
-    # 시작일부터 종료일까지 하루씩 처리
-    delta = end_date - start_date
-    for i in range(delta.days + 1):
-        current_date = start_date + timedelta(days=i)
-        logger.info(f"Processing date: {current_date}")
-
-        # 해당 날짜의 condition_search_result에서 종목 목록 조회
-        async with get_db() as session:
-            result = await session.execute(
-                select(distinct(ConditionSearchResult.symbol)).where(
-                    ConditionSearchResult.base_date == current_date
+    try:
+        # 시작일부터 종료일까지 하루씩 처리
+        delta = end_date - start_date
+        for i in range(delta.days + 1):
+            current_date = start_date + timedelta(days=i)
+            logger.info(f"Processing date: {current_date}")
+
+            # 해당 날짜의 condition_search_result에서 종목 목록 조회
+            async with get_db() as session:
+                result = await session.execute(
+                    select(distinct(ConditionSearchResult.symbol)).where(
+                        ConditionSearchResult.base_date == current_date
+                    )
                 )
-            )
-            symbols = [row[0] for row in result.all()]
+                symbols = [row[0] for row in result.all()]
 
-        if not symbols:
-            logger.warning(f"No symbols found for date {current_date}. Skipping.")
-            continue
+            if not symbols:
+                logger.warning(f"No symbols found for date {current_date}. Skipping.")
+                continue
 
-        logger.info(f"Found {len(symbols)} symbols for {current_date}")
+            logger.info(f"Found {len(symbols)} symbols for {current_date}")
         
-        # 해당 날짜의 종목들에 대해 일별 캔들 데이터 수집 및 저장
-        await fetch_and_save_daily_candles(kiwoom_rest_client, current_date, symbols)
+            # 해당 날짜의 종목들에 대해 일별 캔들 데이터 수집 및 저장
+            await fetch_and_save_daily_candles(kiwoom_rest_client, current_date, symbols)
+    finally:
+        await kiwoom_rest_client.close()
+        await http_connector.close()
 
     logger.info("Daily candles collection completed.")
 
@@ -2,8 +2,11 @@ import asyncio
 import json
 import logging
 from datetime import datetime
+from typing import Optional, Type
 
 from decimal import Decimal
+from aiohttp import TCPConnector
+from sqlalchemy import Numeric, cast, func, select
 from sqlalchemy.dialects.postgresql import insert
 
 from exchange.bitget import BitgetFutureTradeClient
@@ -17,15 +20,23 @@ from shared.containers import Container
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+
+async def last_order_id(model: Type[BitgetOrder] | Type[BitgetSpotOrder]) -> Optional[str]:
+    """이미 저장된 가장 최근 주문 id (숫자 문자열이므로 숫자로 비교), 없으면 None"""
+    async with get_db() as session:
+        result = await session.execute(select(func.max(cast(model.order_id, Numeric))))
+        value = result.scalar()
+    return None if value is None else str(int(value))
+
+
 async def collect_bitget_spot_orders(client: BitgetSpotTradeClient):
     logger.info("Starting collection of Bitget spot orders...")
+    until_id = await last_order_id(BitgetSpotOrder)
     async with client:
-        orders = await client.get_history_orders(
-            symbol="",
-        )
+        # 최신 주문부터 100건 단위로 따라가다 이미 저장한 주문에 닿으면 중단
+        order_dicts = [o async for o in client.iter_history_orders(symbol="", until_id=until_id)]
 
     # db 저장
-    order_dicts = orders.get("data", [])
     logger.info(f"Fetched {len(order_dicts)} orders.")
     if order_dicts:
         records = []
@@ -99,14 +110,15 @@ async def collect_bitget_spot_orders(client: BitgetSpotTradeClient):
 
 async def collect_bitget_future_orders(client: BitgetFutureTradeClient):
     logger.info("Starting collection of Bitget future orders...")
+    until_id = await last_order_id(BitgetOrder)
     async with client:
-        orders = await client.get_history_orders(
-            product_type="USDT-FUTURES",
-        )
-        logger.info(f"Fetched {len(orders)} orders.")
+        # 최신 주문부터 100건 단위로 따라가다 이미 저장한 주문에 닿으면 중단
+        order_dicts = [
+            o async for o in client.iter_history_orders(product_type="USDT-FUTURES", until_id=until_id)
+        ]
+        logger.info(f"Fetched {len(order_dicts)} orders.")
 
     # db 저장
-    order_dicts = orders.get("data", {}).get("entrustedList", [])
     if order_dicts:
         # prepare records for upsert
         records = []
@@ -160,9 +172,14 @@ async def collect_bitget_future_orders(client: BitgetFutureTradeClient):
 async def main(
     bitget_future_trade_client: BitgetFutureTradeClient = Provide[Container.bitget_future_trade_client],
     bitget_spot_trade_client: BitgetSpotTradeClient = Provide[Container.bitget_spot_trade_client],
+    http_connector: TCPConnector = Provide[Container.http_connector],
 ):
-    await collect_bitget_future_orders(bitget_future_trade_client)
-    await collect_bitget_spot_orders(bitget_spot_trade_client)
+    try:
+        await collect_bitget_future_orders(bitget_future_trade_client)
+        await collect_bitget_spot_orders(bitget_spot_trade_client)
+    finally:
+        # 클라이언트는 각 수집 함수에서 닫히고, 공용 커넥션 풀만 남음
+        await http_connector.close()
 
 
     logger.info("Order collection completed successfully.")
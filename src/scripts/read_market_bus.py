@@ -0,0 +1,49 @@
+import argparse
+import asyncio
+import logging
+
+from exchange.bitget.market_bus import KIND_CANDLE, PAYLOAD, MarketBusReader
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(
+        description="Minimal worker process: follow the market bus that app.py publishes (bitget.market_bus)."
+    )
+    parser.add_argument("--name", required=True, help="Shared memory name of the bus (bitget.market_bus.name).")
+    parser.add_argument("--poll-interval", type=float, default=0.01, help="Seconds to sleep when the bus is idle.")
+    parser.add_argument("--report-every", type=float, default=10, help="Seconds between progress logs.")
+    return parser.parse_args()
+
+
+async def main(args: argparse.Namespace):
+    reader = MarketBusReader(args.name, start=None)
+    loop = asyncio.get_running_loop()
+    candles = quotes = 0
+    next_report = loop.time() + args.report_every
+    try:
+        while True:
+            read = 0
+            # zero-copy read; a strategy would decode only the fields it needs here
+            for seq, payload in reader.views():
+                kind = PAYLOAD.unpack_from(payload)[0]
+                if not reader.consistent(seq):
+                    continue
+                read += 1
+                if kind == KIND_CANDLE:
+                    candles += 1
+                else:
+                    quotes += 1
+            if loop.time() >= next_report:
+                logger.info(f"Read {candles} candles, {quotes} quotes from {args.name} (lost {reader.lost})")
+                next_report = loop.time() + args.report_every
+            if not read:
+                await asyncio.sleep(args.poll_interval)
+    finally:
+        reader.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(_parse_args()))
@@ -0,0 +1,46 @@
+import argparse
+import asyncio
+import logging
+
+from dependency_injector.wiring import inject, Provide
+
+from exchange.bitget.stream_manager import BitgetStreamManager
+from exchange.bitget.websocket_pool import BitgetWebsocketPool
+from exchange.bitget.ws_recording import FrameRecorder
+from shared.containers import Container
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="Record the raw Bitget public stream of the configured strategies.")
+    parser.add_argument("--out", required=True, help="Recording file (gzip, appended to if it exists).")
+    parser.add_argument("--seconds", type=float, default=600, help="How long to record.")
+    return parser.parse_args()
+
+
+@inject
+async def main(
+    args: argparse.Namespace,
+    stream_manager: BitgetStreamManager = Provide[Container.bitget_stream_manager],
+    url: str = Provide[Container.config.bitget.websocket_public_url],
+    max_channels: int = Provide[Container.config.bitget.websocket_max_channels_per_connection],
+):
+    with FrameRecorder(args.out) as recorder:
+        pool = BitgetWebsocketPool(url, stream_manager, max_channels_per_connection=max_channels, recorder=recorder)
+        conn_task = asyncio.create_task(pool.connect())
+        try:
+            await asyncio.sleep(args.seconds)
+        finally:
+            await pool.close()
+            conn_task.cancel()
+        logger.info(f"Recorded {recorder.frames} frames to {args.out}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    container = Container()
+    container.init_resources()
+    container.wire(modules=[__name__])
+
+    asyncio.run(main(_parse_args()))
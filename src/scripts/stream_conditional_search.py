@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+import logging
+from typing import Any, Dict, List
+
+from aiohttp import TCPConnector
+from dependency_injector.wiring import inject, Provide
+from sqlalchemy import insert
+
+from exchange.kiwoom.realtime_condition import ConditionEvent, RealtimeConditionSearch
+from exchange.kiwoom.rest_client import KiwoomRestClient
+from exchange.kiwoom.ws_client import KiwoomWS
+from model.condition_search_event import ConditionSearchEvent
+from shared.containers import Container
+from shared.db import get_db
+from shared.utils.batch_writer import BatchWriter
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO)
+
+# 키움 실시간 조건검색은 동시에 최대 10개 조건식까지 등록 가능
+MAX_REALTIME_CONDITIONS = 10
+
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="키움 실시간 조건검색 편입/이탈 이벤트 수집")
+    parser.add_argument("--seq", nargs="*", help="등록할 조건식 번호 (기본: 조건식 목록 앞에서부터 최대 10개)")
+    return parser.parse_args()
+
+
+async def insert_condition_search_events(records: List[Dict[str, Any]]) -> None:
+    async with get_db() as session:
+        await session.execute(insert(ConditionSearchEvent).values(records))
+        await session.commit()
+    logger.debug(f"Inserted {len(records)} condition search events.")
+
+
+def _log_event(event: ConditionEvent) -> None:
+    action = "편입" if event.event_type == "I" else "이탈"
+    logger.info(f"[{event.condition_id}] {event.symbol} {action} ({event.source}, {event.event_at:%H:%M:%S})")
+
+
+@inject
+async def main(
+    args: argparse.Namespace,
+    kiwoom_rest_client: KiwoomRestClient = Provide[Container.kiwoom_rest_client],
+    http_connector: TCPConnector = Provide[Container.http_connector],
+):
+    # 세션만 닫히므로 공용 커넥션 풀은 직접 닫음
+    try:
+        async with kiwoom_rest_client as client:
+            token = await client.get_access_token()
+    finally:
+        await http_connector.close()
+
+    ws_client = KiwoomWS("wss://api.kiwoom.com:10000/api/dostk/websocket", access_token=token)
+    # 1초 안에 반영되도록 짧은 주기로 저장
+    writer = BatchWriter(insert_condition_search_events, max_batch=200, max_delay=0.5, name="condition-event")
+    realtime = RealtimeConditionSearch(ws_client, writer)
+    realtime.events.subscribe(_log_event)
+    conditions: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    async def on_msg(msg: Dict[str, Any]) -> None:
+        if await realtime.on_msg(msg):
+            return
+        if msg.get("trnm") == "CNSRLST" and msg.get("return_code") == 0 and not conditions.done():
+            conditions.set_result([item[0] for item in msg.get("data", [])])
+
+    ws_client.on_message = on_msg
+
+    async with writer:
+        ws_task = asyncio.create_task(ws_client.run())
+        try:
+            await ws_client.wait_logged_in()
+            # 조건식 목록 요청이 선행되어야 조건검색 요청 가능
+            await ws_client.send({"trnm": "CNSRLST"})
+            available = await asyncio.wait_for(conditions, 30)
+            seqs = args.seq or available[:MAX_REALTIME_CONDITIONS]
+            await realtime.start(seqs)
+            await ws_task
+        finally:
+            await realtime.stop()
+            await ws_client.disconnect()
+            ws_task.cancel()
+
+
+if __name__ == "__main__":
+    container = Container()
+    container.init_resources()
+    container.wire(modules=[__name__])
+
+    asyncio.run(main(_parse_args()))
@@ -0,0 +1,55 @@
+import asyncio
+import importlib
+from decimal import Decimal
+
+import pytest
+
+from exchange.bitget.dto.websocket import SubscribeReq
+from exchange.bitget.stream_manager import TICKER_CHANNEL, BitgetStreamManager
+from exchange.bitget.ticker_cache import TickerCache
+
+# 모듈 이름이 숫자로 시작해 import 문으로는 불러올 수 없음
+m = importlib.import_module("scripts.0458")
+
+
+class NoRestMarketClient:
+    """티커 캐시가 채워져 있으면 REST 티커는 호출되지 않아야 함"""
+
+    async def ticker(self, symbol):
+        raise AssertionError("REST ticker should not be called")
+
+
+def ticker_frame(symbol: str, bid: str, ask: str) -> dict:
+    return {
+        "action": "snapshot",
+        "arg": {"instType": "USDT-FUTURES", "channel": "ticker", "instId": symbol},
+        "data": [{"instId": symbol, "bidPr": bid, "askPr": ask, "lastPr": bid, "ts": "1700000000000"}],
+    }
+
+
+@pytest.mark.asyncio
+async def test_quote_path_is_fed_by_a_dispatched_ticker_frame():
+    market_client = NoRestMarketClient()
+    ticker_cache = TickerCache(lambda: market_client)
+    stream_manager = BitgetStreamManager({}, ticker_cache=ticker_cache)
+    symbol = m.TradingConfig.from_settings().symbol
+    stream_manager.register(SubscribeReq("USDT-FUTURES", TICKER_CHANNEL, symbol))
+
+    waiter = asyncio.create_task(m.wait_first_quote(stream_manager, symbol, timeout=1))
+    await asyncio.sleep(0)
+    assert stream_manager.dispatch(ticker_frame(symbol, "100.5", "100.6"))
+    assert await waiter is True
+
+    strategy = m.BitgetTradingStrategy(market_client, None, None, None, ticker_cache)
+    assert await strategy.get_ticker_price() == (Decimal("100.5"), Decimal("100.6"))
+
+
+@pytest.mark.asyncio
+async def test_wait_first_quote_times_out_without_a_ticker_frame():
+    stream_manager = BitgetStreamManager({})
+    stream_manager.register(SubscribeReq("USDT-FUTURES", TICKER_CHANNEL, "BTCUSDT"))
+    stream_manager.register(SubscribeReq("USDT-FUTURES", TICKER_CHANNEL, "ETHUSDT"))
+
+    # 다른 심볼의 호가로는 대기가 끝나지 않음
+    asyncio.get_running_loop().call_soon(stream_manager.dispatch, ticker_frame("ETHUSDT", "1", "2"))
+    assert await m.wait_first_quote(stream_manager, "BTCUSDT", timeout=0.05) is False
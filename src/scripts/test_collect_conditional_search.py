@@ -1,3 +1,5 @@
+import asyncio
+from datetime import date
 from decimal import Decimal
 import pytest
 
@@ -96,6 +98,9 @@ class ExcludedProxy:
     def __getitem__(self, key):
         return f"EXCLUDED.{key}"  # 값 자체는 안 쓰고 키만 검증에 활용
 
+    def __getattr__(self, key):
+        return f"EXCLUDED.{key}"
+
 class FakeInsertStmt:
     def __init__(self, model):
         self.model = model
@@ -214,4 +219,131 @@ async def test_on_msg_cnsrreq_does_nothing_when_no_conditions(monkeypatch):
 
     # DB 실행 흔적이 없어야 함
     assert sink.get("executed") is None
-    assert sink.get("committed") is None
\ No newline at end of file
+    assert sink.get("committed") is None
+
+# ---------- 수집 완료 추적 ----------
+class FakeWS:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, msg):
+        self.sent.append(msg)
+
+
+def _collector(monkeypatch, timeout=30):
+    sink = {}
+    monkeypatch.setattr(m, "get_db", make_fake_get_db(sink), raising=True)
+    monkeypatch.setattr(m, "insert", fake_insert, raising=True)
+    written = []
+
+    async def flush(batch):
+        written.extend(batch)
+
+    writer = m.BatchWriter(flush, max_batch=3, max_delay=0.01)
+    collector = m.ConditionSearchCollector(
+        FakeWS(), base_date=date(2025, 9, 1), writer=writer, timeout=timeout, request_interval=0
+    )
+    collector.written = written
+    return collector
+
+
+def _page(seq, cont_yn="N", next_key=""):
+    return {**CNSRREQ_MSG, "seq": f"{seq}  ", "cont_yn": cont_yn, "next_key": next_key}
+
+
+@pytest.mark.asyncio
+async def test_collector_follows_continuation_and_reports_coverage(monkeypatch):
+    collector = _collector(monkeypatch)
+    await collector.on_msg({**CNSRLST_MSG, "data": [["0", "조건1"], ["1", "조건2"]]})
+    await collector._request_task
+
+    await collector.on_msg(_page("0", cont_yn="Y", next_key="abc"))
+    assert collector.ws.sent[-1]["next_key"] == "abc"
+    assert collector.ws.sent[-1]["cont_yn"] == "Y"
+    await collector.on_msg(_page("0"))
+    await collector.on_msg({"trnm": "CNSRREQ", "seq": "1", "return_code": 1, "return_msg": "error"})
+
+    report = await collector.wait_complete()
+    assert report.completed == ["0"]
+    assert report.failed == ["1"]
+    assert report.pages == {"0": 2}
+    assert report.rows == 2 * len(CNSRREQ_MSG["data"])
+    assert not report.complete
+
+    await collector.writer.close()
+    assert len(collector.written) == report.rows
+    assert collector.written[0]["condition_id"] == "0"
+    assert collector.written[0]["base_date"] == date(2025, 9, 1)
+
+
+@pytest.mark.asyncio
+async def test_upsert_dedupes_conflict_keys_within_a_batch(monkeypatch):
+    sink = {}
+    monkeypatch.setattr(m, "get_db", make_fake_get_db(sink), raising=True)
+    monkeypatch.setattr(m, "insert", fake_insert, raising=True)
+    rows = [{"condition_id": "0", "base_date": date(2025, 9, 1), "symbol": "A005930", "price": Decimal(i)} for i in range(3)]
+
+    await m.upsert_condition_search_results(rows)
+
+    assert sink["records"] == [rows[-1]]
+    assert sink["index_elements"] == ["condition_id", "base_date", "symbol"]
+
+
+@pytest.mark.asyncio
+async def test_collector_times_out_silent_conditions(monkeypatch):
+    collector = _collector(monkeypatch, timeout=0.05)
+    await collector.on_msg({**CNSRLST_MSG, "data": [["0", "조건1"], ["1", "조건2"]]})
+    await collector._request_task
+    await collector.on_msg(_page("0"))
+
+    report = await collector.wait_complete(poll_interval=0.01)
+    assert report.completed == ["0"]
+    assert report.timed_out == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_collector_stops_waiting_when_requests_fail(monkeypatch):
+    collector = _collector(monkeypatch, timeout=0.05)
+
+    async def broken_send(msg):
+        raise ConnectionError("socket down")
+
+    collector.ws.send = broken_send
+    await collector.on_msg({**CNSRLST_MSG, "data": [["0", "조건1"], ["1", "조건2"]]})
+
+    report = await asyncio.wait_for(collector.wait_complete(poll_interval=0.01), 1)
+    assert sorted(report.failed + report.timed_out) == ["0", "1"]
+    assert report.completed == []
+
+
+@pytest.mark.asyncio
+async def test_collector_stops_waiting_when_receive_loop_exits(monkeypatch):
+    collector = _collector(monkeypatch, timeout=30)
+    await collector.on_msg({**CNSRLST_MSG, "data": [["0", "조건1"], ["1", "조건2"]]})
+    await collector._request_task
+    await collector.on_msg(_page("0"))
+    ws_task = asyncio.create_task(asyncio.sleep(0))
+
+    report = await asyncio.wait_for(collector.wait_complete(poll_interval=0.01, ws_task=ws_task), 1)
+    assert report.completed == ["0"]
+    assert report.failed == ["1"]
+
+
+@pytest.mark.asyncio
+async def test_collector_total_wait_is_bounded(monkeypatch):
+    collector = _collector(monkeypatch, timeout=0.05)
+    # the receive path keeps refreshing the per-condition deadline without ever finishing
+    await collector.on_msg({**CNSRLST_MSG, "data": [["0", "조건1"]]})
+    await collector._request_task
+    stalled = asyncio.create_task(_keep_alive(collector, "0"))
+    try:
+        report = await asyncio.wait_for(collector.wait_complete(poll_interval=0.01), 1)
+    finally:
+        stalled.cancel()
+    assert report.timed_out == ["0"]
+
+
+async def _keep_alive(collector, seq):
+    while True:
+        await collector.on_msg(_page(seq, cont_yn="Y", next_key="k"))
+        await asyncio.sleep(0.01)
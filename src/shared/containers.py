@@ -1,15 +1,23 @@
 import logging.config
 
+from exchange.bitget.candle_backfill import CandleBackfiller
+from exchange.bitget.client.rate_limiter import BitgetRateLimiter
+from exchange.bitget.contract_registry import ContractRegistry
 from exchange.bitget.future.future_account_client import BitgetFutureAccountClient
 from exchange.bitget.future.future_market_client import BitgetFutureMarketClient
 from dependency_injector import containers, providers
 
 from exchange.bitget.future.future_position_client import BitgetFuturePositionClient
 from exchange.bitget.future.future_trade_client import BitgetFutureTradeClient
+from exchange.bitget.private_state import BitgetPrivateState
 from exchange.bitget.spot.spot_trade_client import BitgetSpotTradeClient
 from exchange.bitget.stream_manager import BitgetStreamManager
+from exchange.bitget.ticker_cache import TickerCache
+from exchange.bitget.websocket_pool import BitgetWebsocketPool
+from exchange.bitget.websocket_private_client import BitgetPrivateWebsocketClient
 from exchange.bitget.websocket_public_client import BitgetWebsocketClient
 from exchange.kiwoom.rest_client import KiwoomRestClient
+from shared.http import create_connector
 
 
 class Container(containers.DeclarativeContainer):
@@ -21,16 +29,44 @@ class Container(containers.DeclarativeContainer):
         disable_existing_loggers=False,
     )
 
-    bitget_stream_manager = providers.Resource(
-        BitgetStreamManager,
-        strategies=config.strategy,
-    )
+    # REST 클라이언트 공용 커넥션 풀 (이벤트 루프 안에서 처음 조회될 때 생성, 종료 시 close 필요)
+    http_connector = providers.Singleton(create_connector)
 
+    # Bitget REST 엔드포인트별 한도, 모든 Bitget 클라이언트가 공유 (config 에 없으면 기본 규칙)
+    bitget_rate_limiter = providers.Singleton(
+        BitgetRateLimiter,
+        rules=config.bitget.rate_limits,
+    )
 
     bitget_future_market_client = providers.Singleton(
         BitgetFutureMarketClient,
         base_url=config.bitget.base_url,
         product_type=config.bitget.product_type,
+        connector=http_connector,
+        rate_limiter=bitget_rate_limiter,
+    )
+
+    bitget_ticker_cache = providers.Singleton(
+        TickerCache,
+        market_client_factory=bitget_future_market_client.provider,
+    )
+
+    bitget_contract_registry = providers.Singleton(
+        ContractRegistry,
+        market_client_factory=bitget_future_market_client.provider,
+        cache_path=config.bitget.contract_cache_path,
+    )
+
+    bitget_stream_manager = providers.Resource(
+        BitgetStreamManager,
+        strategies=config.strategy,
+        ticker_cache=bitget_ticker_cache,
+    )
+
+    bitget_candle_backfill = providers.Singleton(
+        CandleBackfiller,
+        stream_manager=bitget_stream_manager,
+        market_client_factory=bitget_future_market_client.provider,
     )
 
     bitget_future_trade_client = providers.Singleton(
@@ -39,6 +75,9 @@ class Container(containers.DeclarativeContainer):
         access_key=config.wallet.bitget.api_key,
         secret_key=config.wallet.bitget.api_secret,
         passphrase=config.wallet.bitget.passphrase,
+        connector=http_connector,
+        rate_limiter=bitget_rate_limiter,
+        coalesce=config.bitget.coalesce_requests.as_(bool),
     )
 
     bitget_future_account_client = providers.Singleton(
@@ -47,6 +86,9 @@ class Container(containers.DeclarativeContainer):
         access_key=config.wallet.bitget.api_key,
         secret_key=config.wallet.bitget.api_secret,
         passphrase=config.wallet.bitget.passphrase,
+        connector=http_connector,
+        rate_limiter=bitget_rate_limiter,
+        coalesce=config.bitget.coalesce_requests.as_(bool),
     )
 
     bitget_future_position_client = providers.Singleton(
@@ -55,12 +97,35 @@ class Container(containers.DeclarativeContainer):
         access_key=config.wallet.bitget.api_key,
         secret_key=config.wallet.bitget.api_secret,
         passphrase=config.wallet.bitget.passphrase,
+        connector=http_connector,
+        rate_limiter=bitget_rate_limiter,
+        coalesce=config.bitget.coalesce_requests.as_(bool),
     )
 
     bitget_future_websocket_public_client = providers.Singleton(
         BitgetWebsocketClient,
         url=config.bitget.websocket_public_url,
         stream_manager=bitget_stream_manager,
+        backfill=bitget_candle_backfill,
+    )
+
+    bitget_future_websocket_public_pool = providers.Singleton(
+        BitgetWebsocketPool,
+        url=config.bitget.websocket_public_url,
+        stream_manager=bitget_stream_manager,
+        max_channels_per_connection=config.bitget.websocket_max_channels_per_connection,
+        backfill=bitget_candle_backfill,
+    )
+
+    bitget_private_state = providers.Singleton(BitgetPrivateState)
+
+    bitget_future_websocket_private_client = providers.Singleton(
+        BitgetPrivateWebsocketClient,
+        url=config.bitget.websocket_private_url,
+        access_key=config.wallet.bitget.api_key,
+        secret_key=config.wallet.bitget.api_secret,
+        passphrase=config.wallet.bitget.passphrase,
+        state=bitget_private_state,
     )
 
     bitget_spot_trade_client = providers.Singleton(
@@ -69,6 +134,9 @@ class Container(containers.DeclarativeContainer):
         access_key=config.wallet.bitget.api_key,
         secret_key=config.wallet.bitget.api_secret,
         passphrase=config.wallet.bitget.passphrase,
+        connector=http_connector,
+        rate_limiter=bitget_rate_limiter,
+        coalesce=config.bitget.coalesce_requests.as_(bool),
     )
 
     kiwoom_rest_client = providers.Singleton(
@@ -76,4 +144,5 @@ class Container(containers.DeclarativeContainer):
         base_url=config.kiwoom.base_url,
         app_key=config.kiwoom.app_key,
         app_secret=config.kiwoom.secret_key,
+        connector=http_connector,
     )
\ No newline at end of file
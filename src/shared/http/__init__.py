@@ -1 +1,2 @@
-from .tracing_client_session import TracingClientSession
\ No newline at end of file
+from .connector import create_connector
+from .tracing_client_session import TracingClientSession
@@ -0,0 +1,28 @@
+from aiohttp import TCPConnector
+
+# 거래소 REST 호출용 커넥션 풀 기본값
+POOL_LIMIT = 100  # 전체 동시 연결 수
+POOL_LIMIT_PER_HOST = 30  # 호스트(api.bitget.com 등)별 동시 연결 수
+KEEPALIVE_TIMEOUT = 60  # 유휴 연결 유지 시간(초), 다음 호출이 TLS 핸드셰이크 없이 재사용
+DNS_CACHE_TTL = 300  # DNS 조회 결과 캐시 시간(초)
+
+
+def create_connector(
+    limit: int = POOL_LIMIT,
+    limit_per_host: int = POOL_LIMIT_PER_HOST,
+    keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+    ttl_dns_cache: int = DNS_CACHE_TTL,
+) -> TCPConnector:
+    """
+    여러 클라이언트 세션이 함께 쓰는 커넥션 풀.
+    세션에는 connector_owner=False 로 넘기므로 세션을 닫아도 풀은 유지되며,
+    프로세스 종료 시 한 번 close() 해야 한다. 실행 중인 이벤트 루프 안에서 생성할 것.
+    """
+    return TCPConnector(
+        ssl=False,
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        use_dns_cache=True,
+        ttl_dns_cache=ttl_dns_cache,
+    )
@@ -0,0 +1,50 @@
+import pytest
+from aioresponses import aioresponses
+
+from exchange.bitget.client.bitget_client import BitgetClient
+from exchange.bitget.future.future_market_client import BitgetFutureMarketClient
+from shared.http import create_connector
+
+BASE_URL = "https://api.example.com"
+
+
+@pytest.mark.asyncio
+async def test_create_connector_settings():
+    connector = create_connector(limit=10, limit_per_host=4, keepalive_timeout=15, ttl_dns_cache=60)
+    try:
+        assert connector.limit == 10
+        assert connector.limit_per_host == 4
+        assert connector.use_dns_cache
+        assert connector._keepalive_timeout == 15
+    finally:
+        await connector.close()
+
+
+@pytest.mark.asyncio
+async def test_clients_share_connector_and_do_not_close_it():
+    connector = create_connector()
+    try:
+        first = BitgetClient(base_url=BASE_URL, connector=connector)
+        second = BitgetFutureMarketClient(BASE_URL, "USDT-FUTURES", connector=connector)
+        assert first._client.connector is connector
+        assert second._client.connector is connector
+
+        with aioresponses() as mocked:
+            mocked.get(f"{BASE_URL}/v1/ping", payload={"ok": True}, headers={"Content-Type": "application/json"})
+            async with first as client:
+                assert await client.get("/v1/ping") == {"ok": True}
+
+        assert first._client.closed
+        assert not connector.closed
+        await second.close()
+        assert not connector.closed
+    finally:
+        await connector.close()
+
+
+@pytest.mark.asyncio
+async def test_client_without_connector_owns_its_own():
+    client = BitgetClient(base_url=BASE_URL)
+    connector = client._client.connector
+    await client.close()
+    assert connector.closed
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BatchWriter:
+    """
+    Async writer stage: records are queued with `put()` and handed to `flush` in batches of
+    up to `max_batch`, at the latest `max_delay` seconds after the first record of a batch.
+
+    The queue holds at most `max_pending` records, so producers wait while the sink is slow
+    instead of growing memory. A failed batch is retried `retries` times with exponential
+    backoff and then dropped (and counted in `failed`).
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[Any]], Awaitable[None]],
+        max_batch: int = 500,
+        max_delay: float = 1.0,
+        max_pending: int = 10_000,
+        retries: int = 3,
+        name: str = "batch-writer",
+    ):
+        if max_batch <= 0:
+            raise ValueError("max_batch must be positive")
+        self.name = name
+        self.written = 0
+        self.failed = 0
+        self._flush = flush
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._retries = retries
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._task: Optional[asyncio.Task] = None
+        # pending queue.get(), kept across timeouts: cancelling it (wait_for) can lose an item
+        # that was dequeued just as the timeout fired
+        self._getter: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def put(self, record: Any) -> None:
+        self.start()
+        await self._queue.put(record)
+
+    async def _get(self, timeout: Optional[float] = None) -> Any:
+        """Next queued record; raises TimeoutError after `timeout` without dropping the pending get."""
+        if self._getter is None:
+            self._getter = asyncio.get_running_loop().create_task(self._queue.get())
+        done, _ = await asyncio.wait((self._getter,), timeout=timeout)
+        if not done:
+            raise asyncio.TimeoutError
+        getter, self._getter = self._getter, None
+        return getter.result()
+
+    async def _next_batch(self) -> List[Any]:
+        batch = [await self._get()]
+        deadline = asyncio.get_running_loop().time() + self._max_delay
+        while len(batch) < self._max_batch:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await self._get(timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _write(self, batch: List[Any]) -> None:
+        delay = 0.5
+        for attempt in range(self._retries + 1):
+            try:
+                await self._flush(batch)
+                self.written += len(batch)
+                return
+            except Exception as e:
+                if attempt == self._retries:
+                    self.failed += len(batch)
+                    logger.exception(f"[{self.name}] Dropping batch of {len(batch)} after {attempt + 1} attempts: {e}")
+                    return
+                logger.warning(f"[{self.name}] Batch flush failed ({e}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+                delay *= 2
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def close(self) -> None:
+        """Flush everything queued so far and stop the writer task."""
+        if self._task is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        self._task = None
+        if self._getter is not None:
+            # the queue is drained, so the pending get holds no record
+            self._getter.cancel()
+            self._getter = None
+
+    async def __aenter__(self) -> "BatchWriter":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
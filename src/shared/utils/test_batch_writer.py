@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from shared.utils.batch_writer import BatchWriter
+
+
+@pytest.mark.asyncio
+async def test_flushes_full_batches_and_remainder_on_close():
+    batches = []
+
+    async def flush(batch):
+        batches.append(list(batch))
+
+    async with BatchWriter(flush, max_batch=3, max_delay=10) as writer:
+        for i in range(7):
+            await writer.put(i)
+        await asyncio.sleep(0.01)
+        assert batches == [[0, 1, 2], [3, 4, 5]]
+
+    assert batches[-1] == [6]
+    assert writer.written == 7
+
+
+@pytest.mark.asyncio
+async def test_flushes_partial_batch_after_max_delay():
+    batches = []
+
+    async def flush(batch):
+        batches.append(list(batch))
+
+    writer = BatchWriter(flush, max_batch=100, max_delay=0.02)
+    await writer.put("a")
+    await asyncio.sleep(0.1)
+
+    assert batches == [["a"]]
+    await writer.close()
+
+
+@pytest.mark.asyncio
+async def test_retries_then_drops_failed_batch(monkeypatch):
+    calls = []
+
+    async def flush(batch):
+        calls.append(batch)
+        raise RuntimeError("db down")
+
+    async def no_sleep(_):
+        return None
+
+    writer = BatchWriter(flush, max_batch=2, max_delay=0, retries=2)
+    monkeypatch.setattr("shared.utils.batch_writer.asyncio.sleep", no_sleep)
+    await writer.put(1)
+    await writer.close()
+
+    assert len(calls) == 3
+    assert writer.failed == 1
+    assert writer.written == 0
+
+
+@pytest.mark.asyncio
+async def test_put_waits_when_pending_queue_is_full():
+    release = asyncio.Event()
+
+    async def flush(batch):
+        await release.wait()
+
+    writer = BatchWriter(flush, max_batch=1, max_delay=0, max_pending=1)
+    await writer.put(1)  # taken by the writer, blocked in flush
+    await writer.put(2)  # fills the queue
+    blocked = asyncio.create_task(writer.put(3))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    await blocked
+    await writer.close()
+    assert writer.written == 3
+
+
+@pytest.mark.asyncio
+async def test_records_arriving_at_the_batch_deadline_are_not_lost():
+    batches = []
+
+    async def flush(batch):
+        batches.append(list(batch))
+
+    async with BatchWriter(flush, max_batch=50, max_delay=0.001) as writer:
+        for i in range(300):
+            await writer.put(i)
+            if i % 3 == 0:
+                await asyncio.sleep(0.001)
+
+    assert [record for batch in batches for record in batch] == list(range(300))
+    assert writer.written == 300
+    assert writer._getter is None
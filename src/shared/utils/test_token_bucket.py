@@ -0,0 +1,45 @@
+import asyncio
+import time
+
+import pytest
+
+from shared.utils.token_bucket import TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_acquire_within_capacity_does_not_wait():
+    bucket = TokenBucket(rate=1, capacity=3)
+    start = time.monotonic()
+    for _ in range(3):
+        await bucket.acquire()
+    assert time.monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_acquire_paces_at_rate_once_empty():
+    bucket = TokenBucket(rate=50, capacity=1)
+    start = time.monotonic()
+    for _ in range(6):
+        await bucket.acquire()
+    # first token is free, the next five are refilled at 50/s
+    assert time.monotonic() - start >= 5 / 50 * 0.9
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_share_the_rate():
+    bucket = TokenBucket(rate=100, capacity=1)
+    start = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(11)))
+    assert time.monotonic() - start >= 10 / 100 * 0.9
+
+
+def test_try_acquire_does_not_block():
+    bucket = TokenBucket(rate=1, capacity=1)
+    assert bucket.try_acquire() is True
+    assert bucket.try_acquire() is False
+
+
+@pytest.mark.parametrize("rate, capacity", [(0, 1), (1, 0), (-1, None)])
+def test_invalid_configuration_raises(rate, capacity):
+    with pytest.raises(ValueError):
+        TokenBucket(rate=rate, capacity=capacity)